@@ -0,0 +1,208 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from io import BytesIO
+import os
+import sys
+
+#: The WSGI environ key under which :class:`ASGIRouter` stores the event
+#: loop that is serving the current request.
+ASGI_LOOP_KEY = 'pyramid.asgi.loop'
+
+
+class ASGIRouter:
+    """An :term:`ASGI` application wrapping a :app:`Pyramid`
+    :term:`router`.
+
+    Each HTTP request is converted into a WSGI environment and handed to
+    ``router`` in a worker thread drawn from a bounded thread pool of at
+    most ``max_workers`` threads (by default, the default size of a
+    :class:`concurrent.futures.ThreadPoolExecutor`), so synchronous views
+    never block the event loop.  The current :mod:`contextvars` context
+    is propagated into the worker thread.  Response body chunks are sent
+    back to the client as they are produced by the response's
+    ``app_iter``.
+
+    Views which are coroutine functions (``async def``) are awaited on the
+    event loop serving the request (see :func:`resolve_awaitable`), but
+    the rest of the request is processed synchronously, so the request
+    keeps its worker thread, and counts against ``max_workers``, until the
+    view is done.
+
+    Instances of this class are usually created by
+    :meth:`pyramid.config.Configurator.make_asgi_app`.
+
+    .. versionadded:: 2.2
+    """
+
+    def __init__(self, router, max_workers=None):
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.router = router
+        self.registry = router.registry
+        self.max_workers = max_workers
+        self.executor = self._make_executor()
+
+    def _make_executor(self):
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='pyramid-asgi'
+        )
+
+    async def __call__(self, scope, receive, send):
+        scope_type = scope['type']
+        if scope_type == 'http':
+            await self.handle_http(scope, receive, send)
+        elif scope_type == 'lifespan':
+            await self.handle_lifespan(scope, receive, send)
+        else:
+            raise ValueError('Unsupported ASGI scope type %r' % scope_type)
+
+    async def handle_lifespan(self, scope, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                # the pool is replaced so that the application can be served
+                # again; the workers still running may need the event loop,
+                # so they are waited for in another thread
+                executor, self.executor = self.executor, self._make_executor()
+                await asyncio.to_thread(executor.shutdown)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle_http(self, scope, receive, send):
+        chunks = []
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body', False):
+                break
+        loop = asyncio.get_running_loop()
+        environ = scope_to_environ(scope, b''.join(chunks))
+        environ[ASGI_LOOP_KEY] = loop
+        context = contextvars.copy_context()
+        await loop.run_in_executor(
+            self.executor, context.run, self.run_router, environ, send, loop
+        )
+
+    def run_router(self, environ, send, loop):
+        """Call the WSGI router with ``environ`` and stream its response
+        to ``send``.  This runs in a worker thread."""
+
+        def send_message(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        response_start = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info is not None and response_start.get('sent'):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response_start['status'] = int(status.split(' ', 1)[0])
+            response_start['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in headers
+            ]
+
+        def send_start():
+            response_start['sent'] = True
+            send_message(
+                {
+                    'type': 'http.response.start',
+                    'status': response_start['status'],
+                    'headers': response_start['headers'],
+                }
+            )
+
+        app_iter = self.router(environ, start_response)
+        try:
+            for chunk in app_iter:
+                if not chunk:
+                    continue
+                if not response_start.get('sent'):
+                    send_start()
+                send_message(
+                    {
+                        'type': 'http.response.body',
+                        'body': chunk,
+                        'more_body': True,
+                    }
+                )
+            if not response_start.get('sent'):
+                send_start()
+            send_message({'type': 'http.response.body', 'body': b''})
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+
+def scope_to_environ(scope, body):
+    """Build a :pep:`3333` WSGI environment from an ASGI HTTP ``scope``
+    and the complete request ``body`` bytes."""
+    script_name = scope.get('root_path', '')
+    path_info = scope['path']
+    if script_name and path_info.startswith(script_name):
+        path_info = path_info[len(script_name) :]
+    scheme = scope.get('scheme', 'http')
+    server = scope.get('server')
+    if not server or server[1] is None:
+        # no server, or a unix socket, whose path is no host name
+        server = ('localhost', 443 if scheme == 'https' else 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': script_name.encode('utf-8').decode('latin-1'),
+        'PATH_INFO': path_info.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scheme,
+        'wsgi.input': BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    client = scope.get('client')
+    if client:
+        environ['REMOTE_ADDR'] = client[0]
+        environ['REMOTE_PORT'] = str(client[1])
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin-1')
+        if name == 'content-type':
+            key = 'CONTENT_TYPE'
+        elif name == 'content-length':
+            key = 'CONTENT_LENGTH'
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key in environ:
+            sep = '; ' if key == 'HTTP_COOKIE' else ','
+            value = environ[key] + sep + value
+        environ[key] = value
+    return environ
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def resolve_awaitable(request, awaitable):
+    """Wait for ``awaitable`` to complete and return its result.
+
+    When the request is being served by :class:`ASGIRouter` the awaitable
+    runs on the server's event loop, with the :mod:`contextvars` context of
+    the calling worker thread, and the calling thread blocks until it is
+    done.  Otherwise, the awaitable runs to completion in a new event
+    loop.
+
+    .. versionadded:: 2.2
+    """
+    environ = getattr(request, 'environ', None) or {}
+    loop = environ.get(ASGI_LOOP_KEY)
+    if loop is None:
+        return asyncio.run(_await(awaitable))
+    return asyncio.run_coroutine_threadsafe(_await(awaitable), loop).result()
@@ -7,12 +7,14 @@ import re
 import time as time_mod
 from urllib.parse import quote, unquote
 import warnings
+import weakref
 from webob.cookies import CookieProfile
 from zope.interface import implementer
 
 from pyramid.authorization import Authenticated, Everyone
 from pyramid.interfaces import IAuthenticationPolicy, IDebugLogger
 from pyramid.util import (
+    LRUCache,
     SimpleSerializer,
     ascii_,
     bytes_,
@@ -22,12 +24,23 @@ from pyramid.util import (
 
 VALID_TOKEN = re.compile(r"^[A-Za-z][A-Za-z0-9+_-]*$")
 
+# an empty hash object of each hash algorithm used, copying it is cheaper
+# than creating a new one with ``hashlib.new``
+_hash_prototypes = {}
+
 
 class CallbackAuthenticationPolicy:
-    """Abstract class"""
+    """Abstract class
+
+    .. versionchanged:: 2.2
+       The ``callback`` is called at most once per request and userid, its
+       result being shared by :meth:`.authenticated_userid` and
+       :meth:`.effective_principals`.
+    """
 
     debug = False
     callback = None
+    _callback_results = None
 
     def _log(self, msg, methodname, request):
         logger = request.registry.queryUtility(IDebugLogger)
@@ -37,6 +50,28 @@ class CallbackAuthenticationPolicy:
             methodname = classname + '.' + methodname
             logger.debug(methodname + ': ' + msg)
 
+    def _call_callback(self, userid, request):
+        results = self._callback_results
+        if results is None:
+            results = self._callback_results = weakref.WeakKeyDictionary()
+        callback = self.callback
+        try:
+            cached = results.get(request)
+        except TypeError:
+            # the request cannot be weakly referenced
+            return callback(userid, request)
+        # the userid changes after remember or forget; a callback defined
+        # as a method is a new bound method each time, hence ``==``
+        if (
+            cached is not None
+            and cached[0] == callback
+            and cached[1] == userid
+        ):
+            return cached[2]
+        result = callback(userid, request)
+        results[request] = (callback, userid, result)
+        return result
+
     def _clean_principal(self, princid):
         if princid in (Authenticated, Everyone):
             princid = None
@@ -79,7 +114,7 @@ class CallbackAuthenticationPolicy:
                 request,
             )
             return userid
-        callback_ok = self.callback(userid, request)
+        callback_ok = self._call_callback(userid, request)
         if callback_ok is not None:  # is not None!
             debug and self._log(
                 'groupfinder callback returned %r; returning %r'
@@ -150,7 +185,7 @@ class CallbackAuthenticationPolicy:
             )
             groups = []
         else:
-            groups = self.callback(userid, request)
+            groups = self._call_callback(userid, request)
             debug and self._log(
                 f'groupfinder callback returned {groups!r} as groups',
                 'effective_principals',
@@ -573,6 +608,14 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
         Default: ``'Lax'``.  The 'samesite' option of the session cookie. Set
         the value to the string ``'None'`` to turn off the samesite option.
 
+    ``ticket_cache_size``
+
+        Default: ``None``.  If set, the results of verifying the signature of
+        up to this many distinct auth_tkt cookies are kept, so the tickets of
+        the most recently seen cookies are not hashed again on each request.
+        The ``timeout`` of a ticket is still checked on every request.
+        Optional.
+
     .. versionchanged:: 1.4
 
        Added the ``hashalg`` option, defaulting to ``sha512``.
@@ -587,6 +630,10 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
 
        Added the ``samesite`` option and made the default ``'Lax'``.
 
+    .. versionchanged:: 2.2
+
+       Added the ``ticket_cache_size`` option.
+
     Objects of this class implement the interface described by
     :class:`pyramid.interfaces.IAuthenticationPolicy`.
 
@@ -610,6 +657,7 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        ticket_cache_size=None,
     ):
         self.cookie = AuthTktCookieHelper(
             secret,
@@ -626,6 +674,7 @@ class AuthTktAuthenticationPolicy(CallbackAuthenticationPolicy):
             parent_domain=parent_domain,
             domain=domain,
             samesite=samesite,
+            ticket_cache_size=ticket_cache_size,
         )
         self.callback = callback
         self.debug = debug
@@ -746,7 +795,7 @@ def parse_ticket(secret, ticket, ip, hashalg='md5'):
     with an explanation.
     """
     ticket = text_(ticket).strip('"')
-    digest_size = hashlib.new(hashalg).digest_size * 2
+    digest_size = _hash_prototype(hashalg).digest_size * 2
     digest = ticket[:digest_size]
     try:
         timestamp = int(ticket[digest_size : digest_size + 8], 16)
@@ -788,7 +837,8 @@ def calculate_digest(
     userid = bytes_(userid, 'utf-8')
     tokens = bytes_(tokens, 'utf-8')
     user_data = bytes_(user_data, 'utf-8')
-    hash_obj = hashlib.new(hashalg)
+    prototype = _hash_prototype(hashalg)
+    hash_obj = prototype.copy()
 
     # Check to see if this is an IPv6 address
     if ':' in ip:
@@ -802,23 +852,23 @@ def calculate_digest(
         ip_timestamp + secret + userid + b'\0' + tokens + b'\0' + user_data
     )
     digest = hash_obj.hexdigest()
-    hash_obj2 = hashlib.new(hashalg)
+    hash_obj2 = prototype.copy()
     hash_obj2.update(bytes_(digest) + secret)
     return hash_obj2.hexdigest()
 
 
+def _hash_prototype(hashalg):
+    try:
+        return _hash_prototypes[hashalg]
+    except KeyError:
+        prototype = _hash_prototypes[hashalg] = hashlib.new(hashalg)
+        return prototype
+
+
 # this function licensed under the MIT license (stolen from Paste)
 def encode_ip_timestamp(ip, timestamp):
-    ip_chars = ''.join(map(chr, map(int, ip.split('.'))))
-    t = int(timestamp)
-    ts = (
-        (t & 0xFF000000) >> 24,
-        (t & 0xFF0000) >> 16,
-        (t & 0xFF00) >> 8,
-        t & 0xFF,
-    )
-    ts_chars = ''.join(map(chr, ts))
-    return bytes_(ip_chars + ts_chars)
+    ip_bytes = bytes(map(int, ip.split('.')))
+    return ip_bytes + (int(timestamp) & 0xFFFFFFFF).to_bytes(4, 'big')
 
 
 class AuthTktCookieHelper:
@@ -959,10 +1009,22 @@ class AuthTktCookieHelper:
         Default: ``'Lax'``.  The 'samesite' option of the session cookie. Set
         the value to ``None`` to turn off the samesite option. Optional.
 
+    ``ticket_cache_size``
+
+        Default: ``None``.  If set, the results of verifying the signature of
+        up to this many distinct auth_tkt cookies are kept, so the tickets of
+        the most recently seen cookies are not hashed again on each request.
+        The ``timeout`` of a ticket is still checked on every request.
+        Optional.
+
     .. versionchanged:: 2.0
 
         The default ``hashalg`` was changed from ``md5`` to ``sha512``.
 
+    .. versionchanged:: 2.2
+
+        Added the ``ticket_cache_size`` option.
+
     """
 
     parse_ticket = staticmethod(parse_ticket)  # for tests
@@ -999,6 +1061,7 @@ class AuthTktCookieHelper:
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        ticket_cache_size=None,
     ):
         self.cookie_profile = CookieProfile(
             cookie_name=cookie_name,
@@ -1023,6 +1086,28 @@ class AuthTktCookieHelper:
         self.parent_domain = parent_domain
         self.domain = domain
         self.hashalg = hashalg
+        self.ticket_cache = (
+            LRUCache(int(ticket_cache_size)) if ticket_cache_size else None
+        )
+
+    def _parse_ticket(self, cookie, remote_addr):
+        cache = self.ticket_cache
+        if cache is None:
+            return self.parse_ticket(
+                self.secret, cookie, remote_addr, self.hashalg
+            )
+        # the secret and hashalg are part of the key in case they are
+        # changed on the helper
+        key = (cookie, remote_addr, self.secret, self.hashalg)
+        parsed = cache.get(key)
+        if parsed is None:
+            parsed = self.parse_ticket(
+                self.secret, cookie, remote_addr, self.hashalg
+            )
+            cache[key] = parsed
+        timestamp, userid, tokens, user_data = parsed
+        # the tokens list ends up in the environ, never share it
+        return timestamp, userid, list(tokens), user_data
 
     def _get_cookies(self, request, value, max_age=None):
         if self.domain:
@@ -1060,8 +1145,8 @@ class AuthTktCookieHelper:
             remote_addr = '0.0.0.0'
 
         try:
-            timestamp, userid, tokens, user_data = self.parse_ticket(
-                self.secret, cookie, remote_addr, self.hashalg
+            timestamp, userid, tokens, user_data = self._parse_ticket(
+                cookie, remote_addr
             )
         except self.BadTicket:
             return None
@@ -46,6 +46,141 @@ ALL_PERMISSIONS = AllPermissionsList()  # api
 DENY_ALL = (Deny, Everyone, ALL_PERMISSIONS)  # api
 
 
+_marker = object()
+
+# ACLs checked once and compiled ACLs, both keyed by the id() of the ACL,
+# see _get_compiled_acl
+_seen_acls = {}
+_compiled_acls = {}
+_compiled_acls_maxsize = 1000
+# shorter ACLs are scanned faster than they are looked up once compiled
+_compile_min_aces = 8
+# whether the __acl__ of instances of a class is computed by a descriptor
+_computed_acl_classes = {}
+
+
+def _compile_acl(acl):
+    """Return a tuple of a dictionary mapping each permission named in
+    ``acl`` to an index of the ACEs which grant or deny it, and the index of
+    the ACEs which grant or deny every permission.  An index maps each
+    principal to the position and value of the first ACE mentioning it.
+    ``None`` is returned if any part of ``acl`` may be changed in place or
+    is unhashable, in which case it must be scanned on every check.  ``acl``
+    must be a list or a tuple."""
+    by_permission = {}
+    every_permission = {}
+    try:
+        for position, ace in enumerate(acl):
+            if ace.__class__ is not tuple or len(ace) != 3:
+                return None
+            principal, permissions = ace[1], ace[2]
+            entry = (position, ace)
+            if permissions.__class__ in (
+                AllPermissionsList,
+                _AllPermissionsList,
+            ):
+                every_permission.setdefault(principal, entry)
+                for index in by_permission.values():
+                    index.setdefault(principal, entry)
+                continue
+            if permissions.__class__ is str:
+                permissions = (permissions,)
+            elif permissions.__class__ not in (tuple, frozenset):
+                return None
+            for permission in permissions:
+                index = by_permission.get(permission)
+                if index is None:
+                    index = by_permission[permission] = dict(every_permission)
+                index.setdefault(principal, entry)
+    except TypeError:  # unhashable principal or permission
+        return None
+    return by_permission, every_permission
+
+
+def _find_ace(compiled, principals, permission):
+    """Return the first ACE of a compiled ACL which grants or denies
+    ``permission`` to any of ``principals``, or ``None``.  Raises a
+    ``TypeError`` if the permission or a principal is unhashable."""
+    index = compiled[0].get(permission, compiled[1])
+    found = None
+    for principal in principals:
+        entry = index.get(principal)
+        if entry is not None and (found is None or entry[0] < found[0]):
+            found = entry
+    if found is not None:
+        return found[1]
+
+
+def _scan_acl(acl, principals, permission):
+    """Return the first ACE of ``acl`` which grants or denies ``permission``
+    to any of ``principals``, or ``None``."""
+    for ace in acl:
+        ace_action, ace_principal, ace_permissions = ace
+        if ace_principal in principals:
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            if permission in ace_permissions:
+                return ace
+
+
+def _get_compiled_acl(acl, location):
+    """Return the result of :func:`_compile_acl` for the ACL ``acl`` of
+    ``location``, from the cache if ``acl`` has not been changed since it
+    was compiled.
+
+    ``None`` is returned for an ACL which is not a list or tuple of at least
+    ``_compile_min_aces`` ACEs, and the first time an ACL is checked: an ACL
+    created for a single check, such as the ACL of a resource loaded for one
+    request, would cost more to compile than to scan.  ``None`` is always
+    returned for an ACL computed by a descriptor such as a property, which
+    may return a new ACL each time."""
+    acl_class = acl.__class__
+    if (acl_class is not list and acl_class is not tuple) or (
+        len(acl) < _compile_min_aces
+    ):
+        return None
+    cached = _compiled_acls.get(id(acl))
+    # the caches hold a reference to the ACL so its id cannot be reused, and
+    # a copy of a list to detect whether it was changed in place; the ACEs
+    # of a compiled ACL are immutable
+    if cached is not None and (cached[1] is None or cached[1] == acl):
+        return cached[2]
+    return _update_compiled_acls(acl, location, cached)
+
+
+def _update_compiled_acls(acl, location, cached):
+    """Compile ``acl`` if it was seen before, see :func:`_get_compiled_acl`.
+    ``cached`` is the outdated entry of ``acl`` in the cache, if any."""
+    key = id(acl)
+    if cached is None:
+        if _seen_acls.get(key) is not acl:
+            cls = location.__class__
+            computed = _computed_acl_classes.get(cls)
+            if computed is None:
+                descriptor = getattr(cls, '__acl__', None)
+                computed = hasattr(descriptor.__class__, '__get__')
+                _computed_acl_classes[cls] = computed
+            if not computed:
+                if len(_seen_acls) >= _compiled_acls_maxsize:
+                    _seen_acls.clear()
+                _seen_acls[key] = acl
+            return None
+        _seen_acls.pop(key, None)
+    compiled = _compile_acl(acl)
+    snapshot = list(acl) if acl.__class__ is list else None
+    if cached is None and len(_compiled_acls) >= _compiled_acls_maxsize:
+        # evict the oldest ACL; ACLs checked repeatedly must not make the
+        # cache grow forever
+        try:
+            del _compiled_acls[next(iter(_compiled_acls))]
+        except (KeyError, RuntimeError):  # pragma: no cover
+            pass  # another thread changed the cache meanwhile
+    # we don't need a lock to mutate the caches, as each of the statements
+    # above and below is atomic
+    _compiled_acls[key] = (acl, snapshot, compiled)
+    return compiled
+
+
 @implementer(IAuthorizationPolicy)
 class ACLAuthorizationPolicy:
     """An :term:`authorization policy` which consults an :term:`ACL`
@@ -74,6 +209,15 @@ class ACLAuthorizationPolicy:
         :class:`pyramid.authorization.ACLDenied` if not."""
         return self.helper.permits(context, principals, permission)
 
+    def permits_many(self, contexts, principals, permission):
+        """Return a list of the results of :meth:`.permits` for each of the
+        ``contexts``.  See
+        :meth:`pyramid.authorization.ACLHelper.permits_many`.
+
+        .. versionadded:: 2.2
+        """
+        return self.helper.permits_many(contexts, principals, permission)
+
     def principals_allowed_by_permission(self, context, permission):
         """Return the set of principals explicitly granted the
         permission named ``permission`` according to the ACL directly
@@ -83,6 +227,18 @@ class ACLAuthorizationPolicy:
             context, permission
         )
 
+    def principals_allowed_by_permission_many(self, contexts, permission):
+        """Return a list of the results of
+        :meth:`.principals_allowed_by_permission` for each of the
+        ``contexts``.  See the method of the same name of
+        :class:`pyramid.authorization.ACLHelper`.
+
+        .. versionadded:: 2.2
+        """
+        return self.helper.principals_allowed_by_permission_many(
+            contexts, permission
+        )
+
 
 class ACLHelper:
     """A helper for use with constructing a :term:`security policy` which
@@ -118,17 +274,52 @@ class ACLHelper:
         access, return an instance of
         :class:`pyramid.authorization.ACLDenied` (equals ``False``).
 
+        .. versionchanged:: 2.2
+           An ACL which is a list or tuple of ``(action, principal,
+           permissions)`` tuples, where ``permissions`` is a string, a tuple,
+           a frozenset or :data:`pyramid.authorization.ALL_PERMISSIONS`, is
+           compiled into an index of its ACEs by permission and principal the
+           second time it is checked, so checking it no longer scans every
+           ACE.  Changes made to a list in place are detected.  ACLs of fewer
+           than 8 ACEs, ACLs returned by a callable ``__acl__`` and ACLs
+           computed by a property are not compiled.
+
         """
         acl = '<No ACL found on any object in resource lineage>'
 
+        # this is _find_location_ace inlined, as permits is called very
+        # often
         for location in lineage(context):
-            try:
-                acl = location.__acl__
-            except AttributeError:
+            # getattr with a default is much cheaper than catching the
+            # AttributeError when a location has no ACL
+            location_acl = getattr(location, '__acl__', _marker)
+            if location_acl is _marker:
                 continue
-
-            if acl and callable(acl):
-                acl = acl()
+            acl = location_acl
+
+            acl_class = acl.__class__
+            if acl_class is list or acl_class is tuple:
+                compiled = _get_compiled_acl(acl, location)
+            else:
+                if acl and callable(acl):
+                    acl = acl()
+                compiled = None
+
+            if compiled is not None:
+                try:
+                    ace = _find_ace(compiled, principals, permission)
+                except TypeError:
+                    ace = _scan_acl(acl, principals, permission)
+                if ace is None:
+                    continue
+                if ace[0] == Allow:
+                    return ACLAllowed(
+                        ace, acl, permission, principals, location
+                    )
+                else:
+                    return ACLDenied(
+                        ace, acl, permission, principals, location
+                    )
 
             for ace in acl:
                 ace_action, ace_principal, ace_permissions = ace
@@ -151,6 +342,77 @@ class ACLHelper:
             '<default deny>', acl, permission, principals, context
         )
 
+    def permits_many(self, contexts, principals, permission):
+        """Return a list of the results of :meth:`.permits` for each of the
+        ``contexts``, checking the same ``principals`` and ``permission``.
+
+        The ACL of each resource found in the :term:`lineage` of the
+        contexts is evaluated once, however many of the contexts it is
+        shared by: checking the children of a folder evaluates the ACLs of
+        the folder and its parents only once.  A callable ``__acl__`` is
+        called once for each resource.
+
+        .. versionadded:: 2.2
+        """
+        memo = {}
+        return [
+            self._permits(context, principals, permission, memo)
+            for context in contexts
+        ]
+
+    def _permits(self, context, principals, permission, memo):
+        acl = '<No ACL found on any object in resource lineage>'
+
+        for location in lineage(context):
+            cached = memo.get(id(location))
+            if cached is None:
+                found = self._find_location_ace(
+                    location, principals, permission
+                )
+                # keep a reference to the location so its id is not reused
+                memo[id(location)] = (location, found)
+            else:
+                found = cached[1]
+            if found is None:
+                continue
+            acl, ace = found
+            if ace is None:
+                continue
+            if ace[0] == Allow:
+                return ACLAllowed(ace, acl, permission, principals, location)
+            else:
+                return ACLDenied(ace, acl, permission, principals, location)
+
+        # default deny (if no ACL in lineage at all, or if none of the
+        # principals were mentioned in any ACE we found)
+        return ACLDenied(
+            '<default deny>', acl, permission, principals, context
+        )
+
+    def _find_location_ace(self, location, principals, permission):
+        """Return ``None`` if ``location`` has no ACL, else a tuple of its
+        ACL and the first ACE of the ACL matching any of ``principals`` and
+        ``permission``, or ``None`` if no ACE matches."""
+        # getattr with a default is much cheaper than catching the
+        # AttributeError when a location has no ACL
+        acl = getattr(location, '__acl__', _marker)
+        if acl is _marker:
+            return None
+
+        if acl and callable(acl):
+            acl = acl()
+            compiled = None
+        else:
+            compiled = _get_compiled_acl(acl, location)
+
+        if compiled is not None:
+            try:
+                return acl, _find_ace(compiled, principals, permission)
+            except TypeError:
+                pass
+
+        return acl, _scan_acl(acl, principals, permission)
+
     def principals_allowed_by_permission(self, context, permission):
         """Return the set of principals explicitly granted the permission
         named ``permission`` according to the ACL directly attached to the
@@ -177,33 +439,86 @@ class ACLHelper:
 
         for location in reversed(list(lineage(context))):
             # NB: we're walking *up* the object graph from the root
-            try:
-                acl = location.__acl__
-            except AttributeError:
-                continue
+            allowed = self._principals_allowed_at(
+                allowed, location, permission
+            )
 
-            allowed_here = set()
-            denied_here = set()
-
-            if acl and callable(acl):
-                acl = acl()
-
-            for ace_action, ace_principal, ace_permissions in acl:
-                if not is_nonstr_iter(ace_permissions):
-                    ace_permissions = [ace_permissions]
-                if (ace_action == Allow) and (permission in ace_permissions):
-                    if ace_principal not in denied_here:
-                        allowed_here.add(ace_principal)
-                if (ace_action == Deny) and (permission in ace_permissions):
-                    denied_here.add(ace_principal)
-                    if ace_principal == Everyone:
-                        # clear the entire allowed set, as we've hit a
-                        # deny of Everyone ala (Deny, Everyone, ALL)
-                        allowed = set()
-                        break
-                    elif ace_principal in allowed:
-                        allowed.remove(ace_principal)
-
-            allowed.update(allowed_here)
+        return allowed
+
+    def principals_allowed_by_permission_many(self, contexts, permission):
+        """Return a list of the results of
+        :meth:`.principals_allowed_by_permission` for each of the
+        ``contexts``, computing the principals allowed by the same
+        ``permission``.
+
+        The principals allowed at each resource found in the
+        :term:`lineage` of the contexts are computed once, however many of
+        the contexts it is shared by: computing the principals of the
+        children of a folder evaluates the ACLs of the folder and its
+        parents only once.  A callable ``__acl__`` is called once for each
+        resource.  Each of the returned sets is a new set.
+
+        .. versionadded:: 2.2
+        """
+        # maps the id of a location to the location and the principals
+        # allowed once its ACL has been applied; these sets are shared and
+        # never mutated
+        memo = {}
+        results = []
+
+        for context in contexts:
+            allowed = frozenset()
+            pending = []
+            for location in lineage(context):
+                cached = memo.get(id(location))
+                if cached is not None:
+                    allowed = cached[1]
+                    break
+                pending.append(location)
+
+            for location in reversed(pending):
+                allowed = self._principals_allowed_at(
+                    allowed, location, permission
+                )
+                # keep a reference to the location so its id is not reused
+                memo[id(location)] = (location, allowed)
+
+            results.append(set(allowed))
+
+        return results
+
+    def _principals_allowed_at(self, allowed, location, permission):
+        """Return the principals allowed once the ACL of ``location`` has
+        been applied to the principals ``allowed`` by its parents.  A new
+        set is returned if ``location`` has an ACL, ``allowed`` is not
+        mutated."""
+        acl = getattr(location, '__acl__', _marker)
+        if acl is _marker:
+            return allowed
+
+        allowed = set(allowed)
+        allowed_here = set()
+        denied_here = set()
+
+        if acl and callable(acl):
+            acl = acl()
+
+        for ace_action, ace_principal, ace_permissions in acl:
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            if (ace_action == Allow) and (permission in ace_permissions):
+                if ace_principal not in denied_here:
+                    allowed_here.add(ace_principal)
+            if (ace_action == Deny) and (permission in ace_permissions):
+                denied_here.add(ace_principal)
+                if ace_principal == Everyone:
+                    # clear the entire allowed set, as we've hit a
+                    # deny of Everyone ala (Deny, Everyone, ALL)
+                    allowed = set()
+                    break
+                elif ace_principal in allowed:
+                    allowed.remove(ace_principal)
+
+        allowed.update(allowed_here)
 
         return allowed
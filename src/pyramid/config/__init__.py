@@ -5,6 +5,7 @@ import threading
 import venusian
 from webob.exc import WSGIHTTPException as WebobWSGIHTTPException
 
+from pyramid.asgi import ASGIRouter
 from pyramid.asset import resolve_asset_spec
 from pyramid.authorization import ACLAuthorizationPolicy
 from pyramid.config.actions import (
@@ -41,7 +42,12 @@ from pyramid.registry import Introspectable, Introspector, Registry
 from pyramid.router import Router
 from pyramid.settings import aslist
 from pyramid.threadlocal import manager
-from pyramid.util import WeakOrderedSet, get_callable_name, object_description
+from pyramid.util import (
+    LRUCache,
+    WeakOrderedSet,
+    get_callable_name,
+    object_description,
+)
 
 _marker = object()
 
@@ -500,7 +506,10 @@ class Configurator(
         if not hasattr(_registry, '_clear_view_lookup_cache'):
 
             def _clear_view_lookup_cache():
-                _registry._view_lookup_cache = {}
+                settings = getattr(_registry, 'settings', None) or {}
+                _registry._view_lookup_cache = LRUCache(
+                    settings.get('pyramid.view_lookup_cache_size', 10000)
+                )
 
             _registry._clear_view_lookup_cache = _clear_view_lookup_cache
 
@@ -906,5 +915,24 @@ class Configurator(
 
         return app
 
+    def make_asgi_app(self, max_workers=None):
+        """Commits any pending configuration statements and returns an
+        :term:`ASGI` application (an instance of
+        :class:`pyramid.asgi.ASGIRouter`) wrapping the :app:`Pyramid` WSGI
+        application returned by :meth:`make_wsgi_app`.
+
+        Requests are handled in a thread pool of at most ``max_workers``
+        threads; the default is the default size of a
+        :class:`concurrent.futures.ThreadPoolExecutor`.  Views defined as
+        coroutine functions (``async def``) are awaited on the event loop
+        serving the request, but their request still holds its worker
+        thread, and counts against ``max_workers``, until the view is done:
+        size the pool for the number of concurrent requests awaiting a
+        view.
+
+        .. versionadded:: 2.2
+        """
+        return ASGIRouter(self.make_wsgi_app(), max_workers=max_workers)
+
 
 global_registries = WeakOrderedSet()
@@ -199,6 +199,10 @@ class FactoriesConfiguratorMixin:
 
             plist = exts.descriptors if property else exts.methods
             plist[name] = callable
+            request_classes = getattr(exts, 'request_classes', None)
+            if request_classes is not None:
+                # classes derived from the old descriptors are stale
+                request_classes.clear()
 
         if callable is None:
             self.action(('request extensions', name), None)
@@ -261,3 +265,5 @@ class _RequestExtensions:
     def __init__(self):
         self.descriptors = {}
         self.methods = {}
+        # request class -> subclass holding the descriptors
+        self.request_classes = {}
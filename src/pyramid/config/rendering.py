@@ -4,6 +4,7 @@ from pyramid.interfaces import PHASE1_CONFIG, IRendererFactory
 
 DEFAULT_RENDERERS = (
     ('json', renderers.json_renderer_factory),
+    ('json_stream', renderers.JSONStream()),
     ('string', renderers.string_renderer_factory),
 )
 
@@ -38,6 +38,7 @@ class RoutesConfiguratorMixin:
         pregenerator=None,
         static=False,
         inherit_slash=None,
+        lazy_root=None,
         **predicates,
     ):
         """Add a :term:`route configuration` to the current configuration
@@ -155,6 +156,22 @@ class RoutesConfiguratorMixin:
 
           .. versionadded:: 2.0
 
+        lazy_root
+
+          If ``lazy_root`` is ``True``, the root factory of this route is not
+          called when the route matches a request which is not traversed
+          (the route has no ``traverse`` argument or ``*traverse``
+          remainder).  Instead, ``request.root`` and ``request.context``
+          are a :class:`pyramid.traversal.LazyRoot` which calls the root
+          factory the first time it is used, for example when a view
+          permission is checked, and delegates to the resulting object.
+          Views are looked up as if the context provided the interfaces
+          implemented by the root factory when it is a class, or no
+          interface at all otherwise.  If ``lazy_root`` is ``None`` (the
+          default), the ``pyramid.lazy_root`` setting is used.
+
+          .. versionadded:: 2.2
+
         Predicate Arguments
 
         pattern
@@ -439,6 +456,7 @@ class RoutesConfiguratorMixin:
         intr['pregenerator'] = pregenerator
         intr['static'] = static
         intr['use_global_views'] = use_global_views
+        intr['lazy_root'] = lazy_root
 
         if static is True:
             intr['external_url'] = external_url
@@ -496,6 +514,8 @@ class RoutesConfiguratorMixin:
                 pregenerator=pregenerator,
                 static=static,
             )
+            if lazy_root is not None:
+                route.lazy_root = lazy_root
             intr['object'] = route
             return route
 
@@ -561,7 +581,10 @@ class RoutesConfiguratorMixin:
         this configurator's :term:`registry`."""
         mapper = self.registry.queryUtility(IRoutesMapper)
         if mapper is None:
-            mapper = RoutesMapper()
+            settings = self.registry.settings or {}
+            mapper = RoutesMapper(
+                compiled=settings.get('pyramid.compile_routes', False)
+            )
             self.registry.registerUtility(mapper, IRoutesMapper)
         return mapper
 
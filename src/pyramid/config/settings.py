@@ -9,6 +9,8 @@ class SettingsConfiguratorMixin:
             mapping = {}
         settings = Settings(mapping)
         self.registry.settings = settings
+        # the view lookup cache is sized by the settings
+        self.registry._clear_view_lookup_cache()
         return settings
 
     def add_settings(self, settings=None, **kw):
@@ -107,5 +109,8 @@ def Settings(d=None, _environ_=os.environ, **kw):
     S('prevent_http_cache', 'PYRAMID_PREVENT_HTTP_CACHE', asbool)
     S('prevent_cachebust', 'PYRAMID_PREVENT_CACHEBUST', asbool)
     S('csrf_trusted_origins', 'PYRAMID_CSRF_TRUSTED_ORIGINS', aslist, [])
+    S('compile_routes', 'PYRAMID_COMPILE_ROUTES', asbool)
+    S('lazy_root', 'PYRAMID_LAZY_ROOT', asbool)
+    S('view_lookup_cache_size', 'PYRAMID_VIEW_LOOKUP_CACHE_SIZE', int, 10000)
 
     return d
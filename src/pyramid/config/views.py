@@ -4,6 +4,7 @@ import operator
 import os
 from urllib.parse import quote, urljoin, urlparse, urlunparse
 import warnings
+import weakref
 from webob.acceptparse import Accept
 from zope.interface import Interface, implementedBy, implementer
 from zope.interface.interfaces import IInterface
@@ -28,6 +29,7 @@ from pyramid.httpexceptions import (
 from pyramid.interfaces import (
     PHASE1_CONFIG,
     IAcceptOrder,
+    IApplicationCreated,
     IException,
     IExceptionViewClassifier,
     IMultiView,
@@ -36,6 +38,7 @@ from pyramid.interfaces import (
     IRequest,
     IResponse,
     IRouteRequest,
+    IRoutesMapper,
     ISecuredView,
     IStaticURLInfo,
     IView,
@@ -48,9 +51,11 @@ import pyramid.predicates
 from pyramid.registry import Deferred
 from pyramid.security import NO_PERMISSION_REQUIRED
 from pyramid.static import static_view
+from pyramid.traversal import PATH_SAFE, quote_path_segment
 from pyramid.url import parse_url_overrides
 from pyramid.util import (
     WIN,
+    LRUCache,
     TopologicalSorter,
     as_sorted_tuple,
     is_nonstr_iter,
@@ -1964,6 +1969,38 @@ class ViewsConfiguratorMixin:
         header. By default, the list is empty and no alternatives will be
         supported.
 
+        The ``file_cache_size`` and ``max_cached_file_size`` keyword
+        arguments enable an in-memory cache of file metadata and small file
+        contents.  See :class:`pyramid.static.static_view` for their
+        meaning.  By default, no cache is kept.
+
+        If the ``etag`` keyword argument is ``True``, responses carry a
+        strong ``ETag`` computed from the contents of each file.  By
+        default, this is ``False``.
+
+        If the ``file_index`` keyword argument is ``True``, every file in the
+        static directory, along with its encoded variants, is indexed when
+        the application is created, so that serving files never requires
+        searching the filesystem for them and requests for missing files are
+        answered from the index.  It may instead be a path or
+        :term:`asset specification` of a JSON manifest mapping file paths
+        relative to ``path`` to their sizes, from which the index is built.
+        See :class:`pyramid.static.static_view` for details.  The index is
+        not used when ``pyramid.reload_assets`` is enabled.  By default,
+        this is ``False``.
+
+        If the ``zero_copy`` keyword argument is ``True``, files are served
+        without copying their contents when the server does not provide
+        ``wsgi.file_wrapper``.  See :class:`pyramid.response.MappedFileIter`.
+        By default, this is ``False``.
+
+        The ``compress``, ``compress_cache_size`` and
+        ``max_compressed_file_size`` keyword arguments enable compressing
+        text assets on the fly, caching the compressed bytes in memory, for
+        clients which accept the listed encodings (e.g. ``['br', 'gzip']``).
+        See :class:`pyramid.static.static_view` for their meaning.  By
+        default, no assets are compressed.
+
         The ``permission`` keyword argument is used to specify the
         :term:`permission` required by a user to execute the static view.  By
         default, it is the string
@@ -2045,6 +2082,13 @@ class ViewsConfiguratorMixin:
 
            Added the ``content_encodings`` argument.
 
+        .. versionchanged:: 2.2
+
+           Added the ``file_cache_size``, ``max_cached_file_size``,
+           ``etag``, ``file_index``, ``zero_copy``, ``compress``,
+           ``compress_cache_size`` and ``max_compressed_file_size``
+           arguments.
+
         """
         spec = self._make_spec(path)
         info = self._get_static_info()
@@ -2155,37 +2199,91 @@ class ViewDeriverInfo:
         return self.registry.settings
 
 
+# keyword arguments which do not affect the URL of a static view route beyond
+# its subpath; see StaticURLInfo.generate
+_STATIC_ROUTE_URL_KW = frozenset(
+    ('subpath', 'pathspec', 'rawspec', '_app_url')
+)
+
+
 @implementer(IStaticURLInfo)
 class StaticURLInfo:
     def __init__(self):
+        # path -> (url, spec, route_name)
+        self.lookup_cache = LRUCache(1000)
+        # request -> {(route_name, _app_url): URL for an empty subpath}
+        self.route_urls = weakref.WeakKeyDictionary()
         self.registrations = []
         self.cache_busters = []
 
+    @property
+    def registrations(self):
+        return self._registrations
+
+    @registrations.setter
+    def registrations(self, registrations):
+        self._registrations = registrations
+        self.lookup_cache.clear()
+
     def generate(self, path, request, **kw):
-        for url, spec, route_name in self.registrations:
-            if path.startswith(spec):
-                subpath = path[len(spec) :]
-                if WIN:  # pragma: no cover
-                    subpath = subpath.replace('\\', '/')  # windows
-                if self.cache_busters:
-                    subpath, kw = self._bust_asset_path(
-                        request, spec, subpath, kw
+        registration = self.lookup_cache.get(path)
+        if registration is None:
+            for registration in self.registrations:
+                if path.startswith(registration[1]):
+                    self.lookup_cache[path] = registration
+                    break
+            else:
+                raise ValueError('No static URL definition matching %s' % path)
+
+        url, spec, route_name = registration
+        subpath = path[len(spec) :]
+        if WIN:  # pragma: no cover
+            subpath = subpath.replace('\\', '/')  # windows
+        if self.cache_busters:
+            subpath, kw = self._bust_asset_path(request, spec, subpath, kw)
+        if url is None:
+            kw['subpath'] = subpath
+            if subpath.__class__ is str and kw.keys() <= _STATIC_ROUTE_URL_KW:
+                route_url = self._route_url(
+                    request, route_name, kw.get('_app_url')
+                )
+                if route_url is not None:
+                    return route_url + quote_path_segment(
+                        subpath, safe=PATH_SAFE
                     )
-                if url is None:
-                    kw['subpath'] = subpath
-                    return request.route_url(route_name, **kw)
-                else:
-                    app_url, qs, anchor = parse_url_overrides(request, kw)
-                    parsed = urlparse(url)
-                    if not parsed.scheme:
-                        url = urlunparse(
-                            parsed._replace(scheme=request.scheme)
-                        )
-                    subpath = quote(subpath)
-                    result = urljoin(url, subpath)
-                    return result + qs + anchor
-
-        raise ValueError('No static URL definition matching %s' % path)
+            return request.route_url(route_name, **kw)
+        else:
+            app_url, qs, anchor = parse_url_overrides(request, kw)
+            parsed = urlparse(url)
+            if not parsed.scheme:
+                url = urlunparse(parsed._replace(scheme=request.scheme))
+            subpath = quote(subpath)
+            result = urljoin(url, subpath)
+            return result + qs + anchor
+
+    def _route_url(self, request, route_name, app_url):
+        # Return the URL of the static view route for an empty subpath, or
+        # None if the route has a pregenerator.  The subpath is the last
+        # part of the route's pattern, so the URL for any other subpath is
+        # this URL followed by the quoted subpath.  The result is cached for
+        # the lifetime of the request.
+        route_urls = self.route_urls.get(request)
+        if route_urls is None:
+            route_urls = self.route_urls[request] = {}
+        key = (route_name, app_url)
+        try:
+            return route_urls[key]
+        except KeyError:
+            pass
+        result = None
+        mapper = request.registry.queryUtility(IRoutesMapper)
+        route = mapper.get_route(route_name) if mapper is not None else None
+        if route is not None and route.pregenerator is None:
+            if app_url is None:
+                app_url = request.application_url
+            result = app_url + route.generate({'subpath': ''})
+        route_urls[key] = result
+        return result
 
     def add(self, config, name, spec, **extra):
         # This feature only allows for the serving of a directory and
@@ -2220,16 +2318,44 @@ class StaticURLInfo:
             url = None
             cache_max_age = extra.pop('cache_max_age', None)
             content_encodings = extra.pop('content_encodings', [])
+            file_cache_size = extra.pop('file_cache_size', 0)
+            max_cached_file_size = extra.pop('max_cached_file_size', 65536)
+            etag = extra.pop('etag', False)
+            file_index = extra.pop('file_index', False)
+            zero_copy = extra.pop('zero_copy', False)
+            compress = extra.pop('compress', ())
+            compress_cache_size = extra.pop('compress_cache_size', 100)
+            max_compressed_file_size = extra.pop(
+                'max_compressed_file_size', 1048576
+            )
+            if isinstance(file_index, str):
+                file_index = config._make_spec(file_index)
+            reload = config.registry.settings['pyramid.reload_assets']
 
             # create a view
             view = static_view(
                 spec,
                 cache_max_age=cache_max_age,
                 use_subpath=True,
-                reload=config.registry.settings['pyramid.reload_assets'],
+                reload=reload,
                 content_encodings=content_encodings,
+                file_cache_size=file_cache_size,
+                max_cached_file_size=max_cached_file_size,
+                etag=etag,
+                file_index=file_index,
+                zero_copy=zero_copy,
+                compress=compress,
+                compress_cache_size=compress_cache_size,
+                max_compressed_file_size=max_compressed_file_size,
             )
 
+            if file_index and not reload:
+                # index once all asset overrides have been registered
+                def build_index(event):
+                    view.build_index()
+
+                config.add_subscriber(build_index, IApplicationCreated)
+
             # Mutate extra to allow factory, etc to be passed through here.
             # Treat permission specially because we'd like to default to
             # permissiveness (see docs of config.add_static_view).
@@ -2270,6 +2396,7 @@ class StaticURLInfo:
 
             # url, spec, route_name
             registrations.append((url, spec, route_name))
+            self.lookup_cache.clear()
 
         intr = config.introspectable(
             'static views', name, 'static view for %r' % name, 'static view'
@@ -6,6 +6,7 @@ from zope.interface.registry import Components
 from pyramid.decorator import reify
 from pyramid.interfaces import IIntrospectable, IIntrospector, ISettings
 from pyramid.path import CALLER_PACKAGE, caller_package
+from pyramid.util import LRUCache
 
 
 class Registry(Components, dict):
@@ -55,7 +56,22 @@ class Registry(Components, dict):
         dict.__init__(self)
 
     def _clear_view_lookup_cache(self):
-        self._view_lookup_cache = {}
+        settings = self._settings or {}
+        self._view_lookup_cache = LRUCache(
+            settings.get('pyramid.view_lookup_cache_size', 10000)
+        )
+
+    def view_lookup_cache_info(self):
+        """Return a named tuple of ``hits``, ``misses``, ``evictions``,
+        ``maxsize`` and ``currsize`` describing the view lookup cache.  The
+        cache holds the result of the most recent view lookups, including
+        lookups which found no view, and its size is controlled by the
+        ``pyramid.view_lookup_cache_size`` setting.  The statistics are reset
+        whenever a view is registered.
+
+        .. versionadded:: 2.2
+        """
+        return self._view_lookup_cache.info()
 
     def __bool__(self):
         # defeat bool determination via dict.__len__
@@ -1,7 +1,10 @@
+from collections.abc import Iterator
 from functools import partial
+from itertools import islice
 import json
 import os
 import re
+import weakref
 from zope.interface import implementer, providedBy
 from zope.interface.registry import Components
 
@@ -220,9 +223,21 @@ class JSON:
         explained in :ref:`json_serializing_custom_objects` instead
         of replacing the serializer.
 
+        The serializer may return ``bytes`` rather than a string, in which
+        case they are used as the response body as-is, without decoding and
+        encoding them again.  Serializers which produce UTF-8 encoded
+        ``bytes`` directly, such as ``orjson.dumps``, can be used this way.
+
+    Adapters are looked up once per class of object (or per set of
+    interfaces, for objects which directly provide interfaces) and the
+    result is cached until :meth:`add_adapter` is next called.
+
     .. versionadded:: 1.4
        Prior to this version, there was no public API for supplying options
        to the underlying serializer without defining a custom renderer.
+
+    .. versionchanged:: 2.2
+       Serializers may return ``bytes``, and adapter lookups are cached.
     """
 
     def __init__(self, serializer=json.dumps, adapters=(), **kw):
@@ -231,6 +246,8 @@ class JSON:
         self.serializer = serializer
         self.kw = kw
         self.components = Components()
+        # weak, so that classes created at runtime can still be collected
+        self.adapter_cache = weakref.WeakKeyDictionary()
         for type, adapter in adapters:
             self.add_adapter(type, adapter)
 
@@ -259,6 +276,7 @@ class JSON:
         self.components.registerAdapter(
             adapter, (type_or_iface,), IJSONAdapter
         )
+        self.adapter_cache.clear()
 
     def __call__(self, info):
         """Returns a plain JSON-encoded string with content-type
@@ -278,20 +296,33 @@ class JSON:
         return _render
 
     def _make_default(self, request):
+        adapter_cache = self.adapter_cache
+
         def default(obj):
             if hasattr(obj, '__json__'):
                 return obj.__json__(request)
-            obj_iface = providedBy(obj)
-            adapters = self.components.adapters
-            result = adapters.lookup(
-                (obj_iface,), IJSONAdapter, default=_marker
-            )
-            if result is _marker:
+            # adapters are cached per class, unless the object directly
+            # provides interfaces of its own
+            key = obj.__class__
+            provides = getattr(obj, '__provides__', None)
+            if provides is not None and provides is not getattr(
+                key, '__implemented__', None
+            ):
+                key = provides
+            adapter = adapter_cache.get(key)
+            if adapter is None:
+                adapter = self._lookup_adapter(providedBy(obj))
+                adapter_cache[key] = adapter
+            if adapter is _marker:
                 raise TypeError(f'{obj!r} is not JSON serializable')
-            return result(obj, request)
+            return adapter(obj, request)
 
         return default
 
+    def _lookup_adapter(self, obj_iface):
+        adapters = self.components.adapters
+        return adapters.lookup((obj_iface,), IJSONAdapter, default=_marker)
+
 
 json_renderer_factory = JSON()  # bw compat
 
@@ -387,7 +418,10 @@ class JSONP(JSON):
                         )
 
                     ct = 'application/javascript'
-                    body = f'/**/{callback}({val});'
+                    if isinstance(val, bytes):
+                        body = b'/**/%s(%s);' % (callback.encode('utf-8'), val)
+                    else:
+                        body = f'/**/{callback}({val});'
                 response = request.response
                 if response.content_type == response.default_content_type:
                     response.content_type = ct
@@ -396,6 +430,305 @@ class JSONP(JSON):
         return _render
 
 
+class JSONStream(JSON):
+    """Renderer that serializes its value to JSON incrementally and
+    returns the encoded document as an iterable of ``bytes`` chunks of
+    ``chunk_size`` bytes, which becomes the ``app_iter`` of the response.
+    Iterators and large lists, tuples and dicts are encoded a few items at
+    a time, so the whole document is never held in memory at once.
+
+    Any iterator found in the value, such as a generator or the value
+    itself, is consumed lazily and encoded as a JSON array.  As with
+    :class:`pyramid.renderers.JSON`, other objects are serialized using
+    their ``__json__`` method or an adapter added with
+    :meth:`~pyramid.renderers.JSON.add_adapter`.
+
+    The renderer is registered by default as ``json_stream``:
+
+    .. code-block:: python
+
+       from pyramid.view import view_config
+
+       @view_config(renderer='json_stream')
+       def myview(request):
+           return {'items': (item.__json__(request) for item in query())}
+
+    Keyword arguments other than ``adapters`` and ``chunk_size`` are passed
+    to the :class:`json.JSONEncoder` constructor (or to that of a ``cls``
+    subclass, if given).
+
+    .. note::
+
+       Because the body is produced while the response is being sent, an
+       exception raised while serializing cannot be turned into an error
+       response; the client receives a truncated document instead.
+
+    .. versionadded:: 2.2
+    """
+
+    # arrays and objects are encoded ``batch_size`` items at a time, and a
+    # list, tuple or dict holding more than about ``max_items`` items is
+    # walked rather than encoded in one shot
+    batch_size = 64
+    max_items = 1024
+
+    def __init__(self, adapters=(), chunk_size=16384, **kw):
+        self.encoder_class = kw.pop('cls', json.JSONEncoder)
+        self.chunk_size = chunk_size
+        JSON.__init__(self, adapters=adapters, **kw)
+
+    def __call__(self, info):
+        """Returns an iterable of JSON-encoded ``bytes`` chunks with
+        content-type ``application/json``. The content-type may be
+        overridden by setting ``request.response.content_type``."""
+
+        def _render(value, system):
+            request = system.get('request')
+            if request is not None:
+                response = request.response
+                ct = response.content_type
+                if ct == response.default_content_type:
+                    response.content_type = 'application/json'
+            default = self._make_default(request)
+            return self._iterencode(value, default)
+
+        return _render
+
+    def _iterencode(self, value, default):
+        walker = _JSONStreamWalker(self, default)
+        if walker.encoder.indent is None:
+            parts = walker.iterparts(value)
+        else:
+            # iterencode (unlike encode) uses the incremental pure-Python
+            # encoder, so large values are never materialized at once
+            parts = walker.encoder.iterencode(value)
+
+        # parts are joined until they fill a chunk, and larger parts are
+        # sliced; the leftover starts the next chunk
+        chunk_size = self.chunk_size
+        buf = []
+        size = 0
+        for part in parts:
+            buf.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                data = ''.join(buf)
+                start = 0
+                while size - start >= chunk_size:
+                    end = start + chunk_size
+                    yield data[start:end].encode('utf-8')
+                    start = end
+                buf = [data[start:]]
+                size -= start
+        if size:
+            yield ''.join(buf).encode('utf-8')
+
+
+class _JSONStreamWalker:
+    # Produces the parts of the JSON document of a value for JSONStream.
+    # Small containers are encoded in one shot by ``strict_encoder``, which
+    # can use the much faster C encoder and raises _ContainsIterator if it
+    # meets an iterator; iterators and large or iterator-holding containers
+    # are walked in batches.
+
+    def __init__(self, renderer, default):
+        self.default = default
+        self.batch_size = renderer.batch_size
+        self.max_items = renderer.max_items
+        # results of ``default`` computed during one-shot encodings, by id,
+        # so that the objects are not converted again when a value which
+        # failed to encode is walked; ``added`` lists the ids, newest last
+        self.converted = {}
+        self.added = []
+        self.encoder = renderer.encoder_class(
+            default=self.stream_default, **renderer.kw
+        )
+        self.strict_encoder = renderer.encoder_class(
+            default=self.strict_default, **renderer.kw
+        )
+
+    def convert(self, obj):
+        cached = self.converted.pop(id(obj), None)
+        if cached is not None:
+            return cached[1]
+        return self.default(obj)
+
+    def stream_default(self, obj):
+        if isinstance(obj, Iterator):
+            return _IteratorList(obj)
+        return self.convert(obj)
+
+    def strict_default(self, obj):
+        if isinstance(obj, Iterator):
+            raise _ContainsIterator
+        result = self.convert(obj)
+        # obj is kept alive so that its id cannot be reused meanwhile
+        self.converted[id(obj)] = (obj, result)
+        self.added.append(id(obj))
+        return result
+
+    def forget(self, mark):
+        # drops the results added since ``len(self.added)`` was ``mark``
+        added = self.added
+        if len(added) > mark:
+            converted = self.converted
+            for key in added[mark:]:
+                converted.pop(key, None)
+            del added[mark:]
+
+    def encode(self, value):
+        # returns the encoded value, or None if it must be walked; the
+        # caller forgets the results of ``default`` once done with value
+        if _count_items(value, self.max_items) > self.max_items:
+            return None
+        try:
+            return self.strict_encoder.encode(value)
+        except _ContainsIterator:
+            return None
+
+    def iterparts(self, value):
+        if isinstance(value, (Iterator, list, tuple)):
+            yield from self.iterarray(value)
+        elif isinstance(value, dict):
+            mark = len(self.added)
+            part = self.encode(value)
+            if part is None:
+                yield from self.iterobject(value)
+            else:
+                yield part
+            self.forget(mark)
+        elif value is None or isinstance(value, (str, int, float)):
+            yield self.strict_encoder.encode(value)
+        else:
+            yield from self.iterparts(self.convert(value))
+
+    def iterarray(self, value):
+        item_separator = self.encoder.item_separator
+        yield '['
+        separator = ''
+        value = iter(value)
+        while True:
+            batch = list(islice(value, self.batch_size))
+            if not batch:
+                break
+            yield separator
+            separator = item_separator
+            mark = len(self.added)
+            part = self.encode(batch)
+            if part is None:
+                for index, item in enumerate(batch):
+                    if index:
+                        yield item_separator
+                    yield from self.iterparts(item)
+            else:
+                yield part[1:-1]
+            self.forget(mark)
+        yield ']'
+
+    def iterobject(self, value):
+        item_separator = self.encoder.item_separator
+        key_separator = self.encoder.key_separator
+        # a dict of at most batch_size items is only walked when it cannot
+        # be encoded in one shot, so neither can its single batch
+        encode_batches = len(value) > self.batch_size
+        yield '{'
+        separator = ''
+        items = value.items()
+        if self.encoder.sort_keys:
+            items = sorted(items)
+        items = iter(items)
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                break
+            mark = len(self.added)
+            part = self.encode(dict(batch)) if encode_batches else None
+            if part is None:
+                for key, item in batch:
+                    key = self.encode_key(key)
+                    if key is None:
+                        continue
+                    yield separator
+                    separator = item_separator
+                    yield key
+                    yield key_separator
+                    yield from self.iterparts(item)
+            elif part != '{}':  # unless skipkeys dropped every key
+                yield separator
+                separator = item_separator
+                yield part[1:-1]
+            self.forget(mark)
+        yield '}'
+
+    def encode_key(self, key):
+        # the same coercion rules as json.JSONEncoder; None means skip
+        if isinstance(key, str):
+            pass
+        elif isinstance(key, float):
+            key = self.strict_encoder.encode(key)
+        elif key is True:
+            key = 'true'
+        elif key is False:
+            key = 'false'
+        elif key is None:
+            key = 'null'
+        elif isinstance(key, int):
+            key = int.__repr__(key)
+        elif self.encoder.skipkeys:
+            return None
+        else:
+            raise TypeError(
+                f'keys must be str, int, float, bool or None, '
+                f'not {key.__class__.__name__}'
+            )
+        return self.strict_encoder.encode(key)
+
+
+def _count_items(value, limit):
+    # a cheap estimate of the size of a list, tuple or dict: its items and
+    # those of its child containers, recursing into dicts held by dicts as
+    # the large lists of a JSON document are usually found there.  Dicts
+    # stop counting once ``limit`` is exceeded; lists are only batches.
+    if isinstance(value, dict):
+        count = len(value)
+        for child in value.values():
+            if isinstance(child, dict):
+                count += _count_items(child, limit - count)
+            elif isinstance(child, (list, tuple)):
+                count += len(child)
+            if count > limit:
+                break
+        return count
+    return len(value) + sum(
+        [len(child) for child in value if isinstance(child, _containers)]
+    )
+
+
+_containers = (list, tuple, dict)
+
+
+class _ContainsIterator(Exception):
+    pass
+
+
+class _IteratorList(list):
+    # the json encoder only encodes lists and tuples as arrays; this list
+    # is always empty but iterates over the wrapped iterator instead.  The
+    # first item is fetched up front because the encoder checks the
+    # truthiness of the list to decide whether to write "[]".
+    def __init__(self, iterator):
+        self.first = next(iterator, _marker)
+        self.iterator = iterator
+
+    def __bool__(self):
+        return self.first is not _marker
+
+    def __iter__(self):
+        if self.first is not _marker:
+            yield self.first
+            yield from self.iterator
+
+
 @implementer(IRendererInfo)
 class RendererHelper:
     def __init__(self, name=None, package=None, registry=None):
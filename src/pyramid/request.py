@@ -180,6 +180,35 @@ class Request(
 
     ResponseClass = Response
 
+    _application_url = None
+
+    @property
+    def application_url(self):
+        """
+        The URL including SCRIPT_NAME (no PATH_INFO or query string)
+
+        The value is computed once and reused until one of the parts of the
+        WSGI environment it is computed from changes, as it is needed for
+        every URL generated for the request.
+
+        .. versionchanged:: 2.2
+           The value is memoized.
+        """
+        environ = self.environ
+        key = (
+            environ.get('wsgi.url_scheme'),
+            environ.get('HTTP_HOST'),
+            environ.get('SERVER_NAME'),
+            environ.get('SERVER_PORT'),
+            environ.get('SCRIPT_NAME'),
+            environ.get('webob.url_encoding'),
+        )
+        cached = self._application_url
+        if cached is None or cached[0] != key:
+            url = BaseRequest.application_url.fget(self)
+            cached = self._application_url = (key, url)
+        return cached[1]
+
     @reify
     def tmpl_context(self):
         # docs-deprecated template context for Pylons-like apps; do not
@@ -330,9 +359,22 @@ def apply_request_extensions(request, extensions=None):
             method = fn.__get__(request, request.__class__)
             setattr(request, name, method)
 
-        InstancePropertyHelper.apply_properties(
-            request, extensions.descriptors
-        )
+        descriptors = extensions.descriptors
+        if descriptors:
+            # reuse the class derived for this request class the first time
+            # the extensions were applied to one of its instances
+            request_classes = getattr(extensions, 'request_classes', None)
+            if request_classes is None:
+                InstancePropertyHelper.apply_properties(request, descriptors)
+            else:
+                parent = request.__class__
+                newcls = request_classes.get(parent)
+                if newcls is None:
+                    newcls = InstancePropertyHelper.make_class(
+                        parent, descriptors
+                    )
+                    request_classes[parent] = newcls
+                request.__class__ = newcls
 
 
 class RequestLocalCache:
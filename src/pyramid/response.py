@@ -1,10 +1,15 @@
+import hashlib
 import mimetypes
+import mmap
+import os
 from os.path import getmtime, getsize
 import venusian
 from webob import Response as _Response
+from webob.response import AppIterRange
 from zope.interface import implementer
 
 from pyramid.interfaces import IResponse, IResponseFactory
+from pyramid.util import LRUCache
 
 _BLOCK_SIZE = 4096 * 64  # 256K
 
@@ -35,6 +40,24 @@ class FileResponse(Response):
     It's generally safe to leave this set to ``None`` if you're serving a
     binary file.  This argument will be ignored if you also leave
     ``content-type`` as ``None``.
+
+    If ``etag`` is ``True``, the response's ``ETag`` is set to a strong
+    validator computed from the contents of the file, so that
+    ``If-None-Match`` requests can be answered with ``304 Not Modified``.
+    The file is only read to compute the ETag the first time it is served
+    with a given modification time and size; the result is cached.
+
+    Requests for a byte range of the file are served by seeking to the
+    start of the range rather than reading the file from its beginning.
+
+    If ``zero_copy`` is ``True`` and the server does not provide
+    ``wsgi.file_wrapper``, the file is served by a
+    :class:`MappedFileIter` rather than a :class:`FileIter`, so that its
+    contents are not copied into new ``bytes`` objects.  Only use this with
+    servers that accept any bytes-like object from the app_iter.
+
+    .. versionchanged:: 2.2
+       Added the ``etag`` and ``zero_copy`` arguments.
     """
 
     def __init__(
@@ -44,6 +67,8 @@ class FileResponse(Response):
         cache_max_age=None,
         content_type=None,
         content_encoding=None,
+        etag=False,
+        zero_copy=False,
     ):
         if content_type is None:
             content_type, content_encoding = _guess_type(path)
@@ -52,17 +77,12 @@ class FileResponse(Response):
             content_type=content_type,
             content_encoding=content_encoding,
         )
-        self.last_modified = getmtime(path)
+        mtime = getmtime(path)
         content_length = getsize(path)
-        f = open(path, 'rb')
-        app_iter = None
-        if request is not None:
-            environ = request.environ
-            if 'wsgi.file_wrapper' in environ:
-                app_iter = environ['wsgi.file_wrapper'](f, _BLOCK_SIZE)
-        if app_iter is None:
-            app_iter = FileIter(f, _BLOCK_SIZE)
-        self.app_iter = app_iter
+        self.last_modified = mtime
+        if etag:
+            self.etag = _file_etag(path, mtime, content_length)
+        self.app_iter = _file_app_iter(open(path, 'rb'), request, zero_copy)
         # assignment of content_length must come after assignment of app_iter
         self.content_length = content_length
         if cache_max_age is not None:
@@ -78,6 +98,8 @@ class FileIter:
     ``block_size`` is an optional block size for iteration.
     """
 
+    remaining = None
+
     def __init__(self, file, block_size=_BLOCK_SIZE):
         self.file = file
         self.block_size = block_size
@@ -86,15 +108,112 @@ class FileIter:
         return self
 
     def __next__(self):
-        val = self.file.read(self.block_size)
+        size = self.block_size
+        remaining = self.remaining
+        if remaining is not None:
+            if remaining <= 0:
+                raise StopIteration
+            size = min(size, remaining)
+        val = self.file.read(size)
         if not val:
             raise StopIteration
+        if remaining is not None:
+            self.remaining = remaining - len(val)
         return val
 
+    def app_iter_range(self, start, stop):
+        """Return an iterator over bytes ``start`` to ``stop`` of the file,
+        seeking to ``start`` if the file supports it.  Used by
+        :class:`webob.Response` to serve ``Range`` requests."""
+        if not hasattr(self.file, 'seek'):
+            return AppIterRange(self, start, stop)
+        self.file.seek(start)
+        if stop is not None:
+            self.remaining = stop - start
+        return self
+
     def close(self):
         self.file.close()
 
 
+class MappedFileIter:
+    """A WSGI app_iter which serves a file without copying its contents.
+
+    ``file`` is a Python file object opened in binary mode which has a
+    ``fileno`` method.
+
+    Iterating yields :class:`memoryview` slices of at most ``block_size``
+    bytes over a read-only memory map of the file, rather than reading each
+    block into a new ``bytes`` object.  The file is mapped the first time the
+    iterator is advanced.
+
+    Servers, or middleware, which are able to send the file with
+    :func:`os.sendfile` may instead call :meth:`fileno` and send ``count``
+    bytes (or the rest of the file, if ``count`` is ``None``) starting at
+    byte ``offset``, without iterating at all.
+
+    .. versionadded:: 2.2
+    """
+
+    offset = 0
+    count = None
+
+    def __init__(self, file, block_size=_BLOCK_SIZE):
+        self.file = file
+        self.block_size = block_size
+        self.mmap = None
+        self.view = None
+        self.position = None
+
+    def fileno(self):
+        """Return the file descriptor of the file being served."""
+        return self.file.fileno()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position is None:
+            self.position = self.offset
+            if os.fstat(self.fileno()).st_size > self.position:
+                self.mmap = mmap.mmap(
+                    self.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self.view = memoryview(self.mmap)
+        if self.view is None:
+            raise StopIteration
+        end = len(self.view)
+        if self.count is not None:
+            end = min(end, self.offset + self.count)
+        start = self.position
+        if start >= end:
+            raise StopIteration
+        self.position = min(start + self.block_size, end)
+        return self.view[start : self.position]
+
+    def app_iter_range(self, start, stop):
+        """Return an iterator over bytes ``start`` to ``stop`` of the file.
+        Used by :class:`webob.Response` to serve ``Range`` requests."""
+        self.offset = start
+        if stop is not None:
+            self.count = stop - start
+        return self
+
+    def close(self):
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.mmap is not None:
+            try:
+                self.mmap.close()
+            except BufferError:
+                # slices handed to the server are still alive; the map is
+                # closed when they are garbage collected
+                pass
+            self.mmap = None
+        self.file.close()
+
+
 class response_adapter:
     """Decorator activated via a :term:`scan` which treats the function
     being decorated as a :term:`response adapter` for the set of types or
@@ -193,6 +312,35 @@ def _get_response_factory(registry):
     return response_factory
 
 
+def _file_app_iter(f, request, zero_copy=False):
+    # use the server's wsgi.file_wrapper when it provides one, unless a
+    # range is requested: FileIter can seek to the start of the range
+    if request is not None:
+        environ = request.environ
+        if 'wsgi.file_wrapper' in environ and 'HTTP_RANGE' not in environ:
+            return environ['wsgi.file_wrapper'](f, _BLOCK_SIZE)
+    if zero_copy:
+        return MappedFileIter(f, _BLOCK_SIZE)
+    return FileIter(f, _BLOCK_SIZE)
+
+
+_etag_cache = LRUCache(1000)
+
+
+def _file_etag(path, mtime, size):
+    # a strong validator computed from the file contents, cached per
+    # path, modification time and size
+    key = (path, mtime, size)
+    etag = _etag_cache.get(key)
+    if etag is None:
+        digest = hashlib.md5(usedforsecurity=False)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_BLOCK_SIZE), b''):
+                digest.update(block)
+        etag = _etag_cache[key] = digest.hexdigest()
+    return etag
+
+
 def _guess_type(path):
     content_type, content_encoding = mimetypes.guess_type(path, strict=False)
     if content_type is None:
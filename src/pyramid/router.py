@@ -1,4 +1,5 @@
-from zope.interface import implementer, providedBy
+from collections import namedtuple
+from zope.interface import Interface, implementedBy, implementer, providedBy
 
 from pyramid.events import (
     BeforeTraversal,
@@ -8,6 +9,7 @@ from pyramid.events import (
 )
 from pyramid.httpexceptions import HTTPNotFound
 from pyramid.interfaces import (
+    VH_ROOT_KEY,
     IDebugLogger,
     IExecutionPolicy,
     IRequest,
@@ -22,14 +24,27 @@ from pyramid.interfaces import (
 )
 from pyramid.request import Request, apply_request_extensions
 from pyramid.threadlocal import RequestContext
-from pyramid.traversal import DefaultRootFactory, ResourceTreeTraverser
+from pyramid.traversal import (
+    DefaultRootFactory,
+    LazyRoot,
+    ResourceTreeTraverser,
+    split_path_info,
+)
+from pyramid.util import is_nonstr_iter
 from pyramid.view import _call_view
 
+_marker = object()
+
+DispatchPlan = namedtuple(
+    'DispatchPlan', ['request_iface', 'root_factory', 'lazy_context_iface']
+)
+
 
 @implementer(IRouter)
 class Router:
     debug_notfound = False
     debug_routematch = False
+    lazy_root = False
 
     def __init__(self, registry):
         q = registry.queryUtility
@@ -51,6 +66,83 @@ class Router:
         if settings is not None:
             self.debug_notfound = settings['debug_notfound']
             self.debug_routematch = settings['debug_routematch']
+            self.lazy_root = settings.get('lazy_root', False)
+        # route -> DispatchPlan, root interface -> traverser factory; both
+        # are dropped whenever the registry changes
+        self.dispatch_plans = {}
+        self.traverser_factories = {}
+        self._registry_generation = self._get_registry_generation()
+        if self.routes_mapper is not None:
+            for route in self.routes_mapper.get_routes():
+                self.make_dispatch_plan(route)
+
+    def _get_registry_generation(self):
+        # zope.interface counts the changes to the adapters and utilities
+        registry = self.registry
+        return (registry.adapters._generation, registry.utilities._generation)
+
+    def _check_registry_generation(self):
+        generation = self._get_registry_generation()
+        if generation != self._registry_generation:
+            # an adapter or utility, such as a traverser or route request
+            # interface, was registered after the router was created
+            self._registry_generation = generation
+            self.dispatch_plans = {}
+            self.traverser_factories = {}
+
+    def make_dispatch_plan(self, route):
+        """Compute and remember the request interface and root factory
+        used for requests matching ``route``.
+
+        If the root of the route is built lazily, the plan also holds the
+        interface specification used in place of the context's for view
+        lookup: the one implemented by the root factory if it is a class,
+        otherwise :class:`zope.interface.Interface`.  Roots are not built
+        lazily if a custom :term:`traverser` is registered for it."""
+        root_factory = route.factory or self.root_factory
+        lazy_root = getattr(route, 'lazy_root', None)
+        if lazy_root is None:
+            lazy_root = self.lazy_root
+        lazy_context_iface = None
+        if lazy_root:
+            if isinstance(root_factory, type):
+                spec = implementedBy(root_factory)
+            else:
+                spec = Interface
+            if self.find_traverser_factory(spec) is None:
+                lazy_context_iface = spec
+        plan = DispatchPlan(
+            self.registry.queryUtility(
+                IRouteRequest, name=route.name, default=IRequest
+            ),
+            root_factory,
+            lazy_context_iface,
+        )
+        self.dispatch_plans[route] = plan
+        return plan
+
+    def find_traverser_factory(self, spec):
+        """Return the :term:`traverser` factory registered for the interface
+        specification ``spec`` or ``None`` if there is none.  The factory
+        found for each specification is remembered until the registry
+        changes."""
+        self._check_registry_generation()
+        factory = self.traverser_factories.get(spec, _marker)
+        if factory is _marker:
+            factory = self.registry.adapters.lookup((spec,), ITraverser)
+            self.traverser_factories[spec] = factory
+        return factory
+
+    def find_traverser(self, root):
+        """Return the :term:`traverser` for ``root``, as
+        ``registry.queryAdapter(root, ITraverser)`` would, falling back to
+        a :class:`pyramid.traversal.ResourceTreeTraverser`."""
+        factory = self.find_traverser_factory(providedBy(root))
+        if factory is not None:
+            traverser = factory(root)
+            if traverser is not None:
+                return traverser
+        return ResourceTreeTraverser(root)
 
     def handle_request(self, request):
         attrs = request.__dict__
@@ -58,9 +150,9 @@ class Router:
 
         request.request_iface = IRequest
         context = None
+        match = plan = None
         routes_mapper = self.routes_mapper
         debug_routematch = self.debug_routematch
-        adapters = registry.adapters
         has_listeners = registry.has_listeners
         notify = registry.notify
         logger = self.logger
@@ -98,11 +190,12 @@ class Router:
                     )
                     logger and logger.debug(msg)
 
-                request.request_iface = registry.queryUtility(
-                    IRouteRequest, name=route.name, default=IRequest
-                )
-
-                root_factory = route.factory or self.root_factory
+                self._check_registry_generation()
+                plan = self.dispatch_plans.get(route)
+                if plan is None:
+                    plan = self.make_dispatch_plan(route)
+                request.request_iface = plan.request_iface
+                root_factory = plan.root_factory
 
         # Notify anyone listening that we are about to start traversal
         #
@@ -112,33 +205,65 @@ class Router:
         # possible.
         has_listeners and notify(BeforeTraversal(request))
 
-        # Create the root factory
-        root = root_factory(request)
+        traverse = True
+        if (
+            match is not None
+            and 'traverse' not in match
+            and VH_ROOT_KEY not in request.environ
+        ):
+            if plan.lazy_context_iface is not None:
+                # the root factory is called when the root is first used
+                root = LazyRoot(root_factory, request)
+                context_iface = plan.lazy_context_iface
+                traverse = False
+            else:
+                root = root_factory(request)
+                context_iface = providedBy(root)
+                factory = self.find_traverser_factory(context_iface)
+                traverse = factory is not None
+        else:
+            # Create the root factory
+            root = root_factory(request)
         attrs['root'] = root
 
-        # We are about to traverse and find a context
-        traverser = adapters.queryAdapter(root, ITraverser)
-        if traverser is None:
-            traverser = ResourceTreeTraverser(root)
-        tdict = traverser(request)
-
-        context, view_name, subpath, traversed, vroot, vroot_path = (
-            tdict['context'],
-            tdict['view_name'],
-            tdict['subpath'],
-            tdict['traversed'],
-            tdict['virtual_root'],
-            tdict['virtual_root_path'],
-        )
-
-        attrs.update(tdict)
+        if traverse:
+            # We are about to traverse and find a context
+            traverser = self.find_traverser(root)
+            tdict = traverser(request)
+
+            context, view_name, subpath, traversed, vroot, vroot_path = (
+                tdict['context'],
+                tdict['view_name'],
+                tdict['subpath'],
+                tdict['traversed'],
+                tdict['virtual_root'],
+                tdict['virtual_root_path'],
+            )
+
+            attrs.update(tdict)
+            context_iface = providedBy(context)
+        else:
+            # The default traverser would not traverse at all for this
+            # route, so produce its result directly: the root is the
+            # context and the view name is empty.
+            subpath = match.get('subpath', ())
+            if not is_nonstr_iter(subpath):
+                subpath = split_path_info(subpath)
+            context = vroot = root
+            view_name = ''
+            traversed = vroot_path = ()
+            attrs['context'] = context
+            attrs['view_name'] = view_name
+            attrs['subpath'] = subpath
+            attrs['traversed'] = traversed
+            attrs['virtual_root'] = vroot
+            attrs['virtual_root_path'] = vroot_path
 
         # Notify anyone listening that we have a context and traversal is
         # complete
         has_listeners and notify(ContextFound(request))
 
         # find a view callable
-        context_iface = providedBy(context)
         response = _call_view(
             registry, request, context, context_iface, view_name
         )
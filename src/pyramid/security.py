@@ -1,3 +1,4 @@
+import copy
 from zope.deprecation import deprecated
 from zope.interface import implementer, providedBy
 
@@ -276,6 +277,35 @@ class SecurityAPIMixin:
             return Allowed('No security policy in use.')
         return policy.permits(self, context, permission)
 
+    def has_permissions(self, permission, contexts):
+        """Return a list of the results of :meth:`.has_permission` for
+        ``permission`` and each of the ``contexts``, such as the resources
+        found by a search which must be filtered by permission.
+
+        If the current security policy has a ``permits_many(request,
+        contexts, permission)`` method, it is called once to check all of the
+        contexts.  Otherwise, its ``permits`` method is called for each
+        context.  :class:`pyramid.authorization.ACLHelper` provides a
+        :meth:`~pyramid.authorization.ACLHelper.permits_many` method for
+        security policies to build upon.
+
+        :param permission: Does this request have the given permission?
+        :type permission: str
+        :param contexts: An iterable of resource objects
+        :returns: A list of :class:`pyramid.security.Allowed` or
+                  :class:`pyramid.security.Denied` instances.
+
+        .. versionadded:: 2.2
+
+        """
+        policy = _get_security_policy(self)
+        if policy is None:
+            return [Allowed('No security policy in use.') for _ in contexts]
+        permits_many = getattr(policy, 'permits_many', None)
+        if permits_many is not None:
+            return permits_many(self, contexts, permission)
+        return [policy.permits(self, c, permission) for c in contexts]
+
 
 class AuthenticationAPIMixin:
     """Mixin for Request class providing compatibility properties."""
@@ -334,8 +364,7 @@ class AuthenticationAPIMixin:
 
         security = _get_security_policy(self)
         if security is not None and isinstance(security, LegacySecurityPolicy):
-            authn = security._get_authn_policy(self)
-            return authn.effective_principals(self)
+            return security._get_effective_principals(self)
         return [Everyone]
 
     effective_principals = deprecated(
@@ -354,24 +383,66 @@ class LegacySecurityPolicy:
     A :term:`security policy` which provides a backwards compatibility shim for
     the :term:`authentication policy` and the :term:`authorization policy`.
 
+    The authenticated userid and the effective principals returned by the
+    authentication policy are computed once per request, and computed again
+    after :meth:`.remember` or :meth:`.forget` is called.
+
+    .. versionchanged:: 2.2
+       The authenticated userid and effective principals are memoized.
+
     """
 
+    _caches = None
+
     def _get_authn_policy(self, request):
         return request.registry.getUtility(IAuthenticationPolicy)
 
     def _get_authz_policy(self, request):
         return request.registry.getUtility(IAuthorizationPolicy)
 
+    def _load_authenticated_userid(self, request):
+        authn = self._get_authn_policy(request)
+        return authn.authenticated_userid(request)
+
+    def _load_effective_principals(self, request):
+        authn = self._get_authn_policy(request)
+        return authn.effective_principals(request)
+
+    def _get_caches(self):
+        # created lazily, so subclasses need not call __init__
+        caches = self._caches
+        if caches is None:
+            from pyramid.request import RequestLocalCache  # circular import
+
+            caches = self._caches = (
+                RequestLocalCache(self._load_authenticated_userid),
+                RequestLocalCache(self._load_effective_principals),
+            )
+        return caches
+
+    def _get_effective_principals(self, request):
+        principals = self._get_caches()[1].get_or_create(request)
+        # never hand out the cached principals themselves, a caller adding
+        # to them would grant the principal to every later check
+        return copy.copy(principals)
+
+    def _clear_caches(self, request):
+        caches = self._caches
+        if caches is not None:
+            for cache in caches:
+                cache.clear(request)
+
     def identity(self, request):
         return self.authenticated_userid(request)
 
     def authenticated_userid(self, request):
-        authn = self._get_authn_policy(request)
-        return authn.authenticated_userid(request)
+        return self._get_caches()[0].get_or_create(request)
 
     def remember(self, request, userid, **kw):
         authn = self._get_authn_policy(request)
-        return authn.remember(request, userid, **kw)
+        headers = authn.remember(request, userid, **kw)
+        self._clear_caches(request)
+        return headers
 
     def forget(self, request, **kw):
         if kw:
@@ -380,14 +451,23 @@ class LegacySecurityPolicy:
                 'arguments for `forget`'
             )
         authn = self._get_authn_policy(request)
-        return authn.forget(request)
+        headers = authn.forget(request)
+        self._clear_caches(request)
+        return headers
 
     def permits(self, request, context, permission):
-        authn = self._get_authn_policy(request)
         authz = self._get_authz_policy(request)
-        principals = authn.effective_principals(request)
+        principals = self._get_effective_principals(request)
         return authz.permits(context, principals, permission)
 
+    def permits_many(self, request, contexts, permission):
+        authz = self._get_authz_policy(request)
+        principals = self._get_effective_principals(request)
+        permits_many = getattr(authz, 'permits_many', None)
+        if permits_many is not None:
+            return permits_many(contexts, principals, permission)
+        return [authz.permits(c, principals, permission) for c in contexts]
+
 
 Everyone = 'system.Everyone'
 Authenticated = 'system.Authenticated'
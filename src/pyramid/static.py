@@ -1,16 +1,31 @@
+from collections import namedtuple
 from functools import lru_cache
+import gzip
 import json
 import mimetypes
 import os
 from os.path import exists, getmtime, getsize, isdir, join, normcase, normpath
-from pkg_resources import resource_exists, resource_filename, resource_isdir
+from pkg_resources import (
+    resource_exists,
+    resource_filename,
+    resource_isdir,
+    resource_listdir,
+)
+import time
 import warnings
 
 from pyramid.asset import abspath_from_asset_spec, resolve_asset_spec
 from pyramid.httpexceptions import HTTPMovedPermanently, HTTPNotFound
 from pyramid.path import caller_package
-from pyramid.response import FileResponse, _guess_type
+from pyramid.response import (
+    FileResponse,
+    Response,
+    _file_app_iter,
+    _file_etag,
+    _guess_type,
+)
 from pyramid.traversal import traversal_path_info
+from pyramid.util import LRUCache
 
 
 class static_view:
@@ -61,6 +76,56 @@ class static_view:
     ``Accept-Encoding`` value will be added to the response's ``Vary`` header.
     By default, the list is empty and no alternatives will be supported.
 
+    ``file_cache_size`` is the number of files for which the view keeps
+    the modification time, size and content type in memory so that serving
+    them does not require querying the filesystem.  The contents of files
+    no larger than ``max_cached_file_size`` bytes (64 KiB by default) are
+    kept as well, so they are served without opening them.  The cache is
+    bounded: the least recently served files are evicted first.  If
+    ``reload`` is ``True`` each cached file's modification time and size
+    are checked on every request and the entry is refreshed when the file
+    has changed.  By default, ``file_cache_size`` is ``0`` and no cache is
+    kept.
+
+    If ``etag`` is ``True``, responses carry a strong ``ETag`` computed from
+    the contents of the file (see :class:`pyramid.response.FileResponse`),
+    so that clients and caches can revalidate them with ``If-None-Match``.
+    By default, this is ``False``.
+
+    ``file_index`` controls how the view discovers which files, and which
+    encoded variants of them, exist.  By default, this is ``False`` and the
+    asset subsystem is queried the first time each file is requested.  If it
+    is ``True``, every file below ``root_dir`` is indexed once, by calling
+    :meth:`build_index` (which happens automatically on the first request if
+    it has not been called before), and requests for files that are not in
+    the index are answered with a ``404 Not Found`` without querying the
+    filesystem.  Symbolic links to directories are followed, except those
+    pointing back to a directory containing them.  ``file_index`` may
+    instead be an absolute path or :term:`asset specification` of a JSON
+    file mapping the ``/``-separated path of every file relative to
+    ``root_dir`` to its size in bytes, in which case the index is built
+    from that manifest rather than by walking the directory.  The index is
+    not used if ``reload`` is ``True``.
+
+    If ``zero_copy`` is ``True`` and the server does not provide
+    ``wsgi.file_wrapper``, files are served by a
+    :class:`pyramid.response.MappedFileIter`, which does not copy their
+    contents into new ``bytes`` objects.  By default, this is ``False``.
+
+    ``compress`` is a list of encodings (``gzip``, and ``br`` if the
+    ``brotli`` package is installed; others are ignored) with which text
+    assets, such as HTML, CSS, JavaScript, JSON and SVG files, are compressed
+    on the fly for clients which accept them in the ``Accept-Encoding``
+    header, when no pre-compressed variant (see ``content_encodings``) is
+    available.  A file is compressed the first time it is requested in each
+    encoding and the result is kept in a bounded in-memory cache of up to
+    ``compress_cache_size`` entries (100 by default), keyed by the file's
+    path, modification time and size, so that later requests are served from
+    memory.  Files smaller than 256 bytes, or larger than
+    ``max_compressed_file_size`` bytes (1 MiB by default), are served
+    uncompressed.  By default, the list is empty and no files are
+    compressed.
+
     .. note::
 
        If the ``root_dir`` is relative to a :term:`package`, or is a
@@ -74,6 +139,12 @@ class static_view:
 
        Added ``reload`` and ``content_encodings`` options.
 
+    .. versionchanged:: 2.2
+
+       Added ``file_cache_size``, ``max_cached_file_size``, ``etag``,
+       ``file_index``, ``zero_copy``, ``compress``, ``compress_cache_size``
+       and ``max_compressed_file_size`` options.
+
     """
 
     def __init__(
@@ -85,6 +156,14 @@ class static_view:
         index='index.html',
         reload=False,
         content_encodings=(),
+        file_cache_size=0,
+        max_cached_file_size=65536,
+        etag=False,
+        file_index=False,
+        zero_copy=False,
+        compress=(),
+        compress_cache_size=100,
+        max_compressed_file_size=1048576,
     ):
         # package_name is for bw compat; it is preferred to pass in a
         # package-relative path as root_dir
@@ -114,26 +193,152 @@ class static_view:
         self.reload = reload
         self.content_encodings = _compile_content_encodings(content_encodings)
         self.filemap = {}
+        self.file_cache = None
+        if file_cache_size:
+            self.file_cache = LRUCache(file_cache_size)
+        self.max_cached_file_size = max_cached_file_size
+        self.etag = etag
+        self.file_index = file_index
+        if isinstance(file_index, str):
+            self.file_index = abspath_from_asset_spec(file_index, package_name)
+        self.index_dirs = None
+        self.zero_copy = zero_copy
+        compressors = _get_compressors()
+        self.compressors = {
+            encoding: compressors[encoding]
+            for encoding in compress
+            if encoding in compressors
+        }
+        self.compress_cache = LRUCache(compress_cache_size)
+        self.max_compressed_file_size = max_compressed_file_size
 
     def __call__(self, context, request):
+        if self.file_index and self.index_dirs is None and not self.reload:
+            self.build_index()
         resource_name = self.get_resource_name(request)
         files = self.get_possible_files(resource_name)
         filepath, content_encoding = self.find_best_match(request, files)
         if filepath is None:
             raise HTTPNotFound(request.url)
 
-        content_type, _ = _guess_type(resource_name)
-        response = FileResponse(
-            filepath,
-            request,
-            self.cache_max_age,
-            content_type,
-            content_encoding,
-        )
-        if len(files) > 1:
+        response = None
+        vary = len(files) > 1
+        if self.compressors and content_encoding is None:
+            content_type, _ = _guess_type(resource_name)
+            if _is_compressible(content_type):
+                vary = True
+                response = self.make_compressed_response(
+                    request, filepath, content_type
+                )
+
+        if response is None and self.file_cache is None:
+            content_type, _ = _guess_type(resource_name)
+            response = FileResponse(
+                filepath,
+                request,
+                self.cache_max_age,
+                content_type,
+                content_encoding,
+                etag=self.etag,
+                zero_copy=self.zero_copy,
+            )
+        elif response is None:
+            cached = self.get_cached_file(resource_name, filepath)
+            response = self.make_cached_response(
+                request, filepath, cached, content_encoding
+            )
+        if vary:
             _add_vary(response, 'Accept-Encoding')
         return response
 
+    def make_compressed_response(self, request, filepath, content_type):
+        """Return a response serving ``filepath`` compressed in the encoding
+        most preferred by the client, or ``None`` if the client does not
+        accept any of the ``compress`` encodings or the file is not worth
+        compressing."""
+        if not request.accept_encoding:
+            return None
+        offers = request.accept_encoding.acceptable_offers(
+            list(self.compressors)
+        )
+        if not offers:
+            return None
+        encoding = offers[0][0]
+        st = os.stat(filepath)
+        if not (
+            _MIN_COMPRESS_SIZE <= st.st_size <= self.max_compressed_file_size
+        ):
+            return None
+        key = (filepath, st.st_mtime, st.st_size, encoding)
+        cached = self.compress_cache.get(key)
+        if cached is None:
+            with open(filepath, 'rb') as f:
+                body = self.compressors[encoding](f.read())
+            if len(body) >= st.st_size:
+                # remember that compression does not help this file
+                cached = False
+            else:
+                etag = None
+                if self.etag:
+                    etag = '{}-{}'.format(
+                        _file_etag(filepath, st.st_mtime, st.st_size),
+                        encoding,
+                    )
+                cached = _CachedFile(
+                    st.st_mtime, len(body), content_type, body, etag
+                )
+            self.compress_cache[key] = cached
+        if cached is False:
+            return None
+        return self.make_cached_response(request, filepath, cached, encoding)
+
+    def get_cached_file(self, resource_name, filepath):
+        """Return the cached metadata and, for small files, contents of
+        ``filepath``, reading them into the file cache if necessary."""
+        cached = self.file_cache.get(filepath)
+        if cached is not None and self.reload:
+            st = os.stat(filepath)
+            if st.st_mtime != cached.mtime or st.st_size != cached.size:
+                cached = None
+        if cached is None:
+            content_type, _ = _guess_type(resource_name)
+            with open(filepath, 'rb') as f:
+                st = os.fstat(f.fileno())
+                body = None
+                if st.st_size <= self.max_cached_file_size:
+                    body = f.read()
+            etag = None
+            if self.etag:
+                etag = _file_etag(filepath, st.st_mtime, st.st_size)
+            cached = _CachedFile(
+                st.st_mtime, st.st_size, content_type, body, etag
+            )
+            self.file_cache[filepath] = cached
+        return cached
+
+    def make_cached_response(self, request, filepath, cached, encoding):
+        """Return a response equivalent to a
+        :class:`pyramid.response.FileResponse` for a cached file."""
+        response = Response(
+            conditional_response=True,
+            content_type=cached.content_type,
+            content_encoding=encoding,
+        )
+        response.last_modified = cached.mtime
+        if cached.etag is not None:
+            response.etag = cached.etag
+        if cached.body is not None:
+            response.body = cached.body
+        else:
+            # the file may have changed since it was cached, so its length
+            # is that of the file actually sent
+            f = open(filepath, 'rb')
+            response.app_iter = _file_app_iter(f, request, self.zero_copy)
+            response.content_length = os.fstat(f.fileno()).st_size
+        if self.cache_max_age is not None:
+            response.cache_expires = self.cache_max_age
+        return response
+
     def get_resource_name(self, request):
         """
         Return the computed name of the requested resource.
@@ -150,27 +355,39 @@ class static_view:
         if path is None:
             raise HTTPNotFound('Out of bounds: %s' % request.url)
 
-        # normalize asset spec or fs path into resource_path
-        if self.package_name:  # package resource
-            resource_path = '{}/{}'.format(self.docroot.rstrip('/'), path)
-            if resource_isdir(self.package_name, resource_path):
-                if not request.path_url.endswith('/'):
-                    raise self.add_slash_redirect(request)
+        resource_path = self.get_resource_path(path)
+        if self.index_dirs is not None:
+            is_dir = resource_path.rstrip('/') in self.index_dirs
+        elif self.package_name:
+            is_dir = resource_isdir(self.package_name, resource_path)
+        else:
+            is_dir = isdir(resource_path)
+        if is_dir:
+            if not request.path_url.endswith('/'):
+                raise self.add_slash_redirect(request)
+            if self.package_name:
                 resource_path = '{}/{}'.format(
                     resource_path.rstrip('/'),
                     self.index,
                 )
-
-        else:  # filesystem file
-            # os.path.normpath converts / to \ on windows
-            resource_path = normcase(normpath(join(self.norm_docroot, path)))
-            if isdir(resource_path):
-                if not request.path_url.endswith('/'):
-                    raise self.add_slash_redirect(request)
+            else:
                 resource_path = join(resource_path, self.index)
 
         return resource_path
 
+    def get_resource_path(self, path):
+        """
+        Return the resource name of the ``/``-separated ``path`` relative to
+        the root directory.
+
+        """
+        # normalize asset spec or fs path into resource_path
+        if self.package_name:  # package resource
+            return '{}/{}'.format(self.docroot.rstrip('/'), path)
+        # filesystem file
+        # os.path.normpath converts / to \ on windows
+        return normcase(normpath(join(self.norm_docroot, path)))
+
     def find_resource_path(self, name):
         """
         Return the absolute path to the resource or ``None`` if it doesn't
@@ -189,6 +406,8 @@ class static_view:
         result = self.filemap.get(resource_name)
         if result is not None:
             return result
+        if self.index_dirs is not None:
+            return []
 
         # XXX we could put a lock around this work but worst case scenario a
         # couple requests scan the disk for files at the same time and then
@@ -219,6 +438,107 @@ class static_view:
             self.filemap[resource_name] = result
         return result
 
+    def build_index(self):
+        """
+        Index every file served by this view, and its encoded variants, so
+        that requests never need to query the filesystem to find them.  See
+        the ``file_index`` argument for how the files are discovered.
+
+        """
+        if self.file_index is True:
+            files = self._walk_files()
+        else:
+            files = self._load_file_manifest()
+
+        sizes = {}
+        dirs = {self.get_resource_path('').rstrip('/')}
+        for path, (filepath, size) in files.items():
+            sizes[self.get_resource_path(path)] = (filepath, size)
+            parts = path.split('/')[:-1]
+            for i in range(len(parts)):
+                dirs.add(self.get_resource_path('/'.join(parts[: i + 1])))
+
+        names = set(sizes)
+        for resource_name in sizes:
+            for extensions in self.content_encodings.values():
+                for ext in extensions:
+                    if resource_name.endswith(ext):
+                        names.add(resource_name[: -len(ext)])
+
+        filemap = {}
+        for resource_name in names:
+            result = []
+            if resource_name in sizes:
+                result.append(sizes[resource_name] + (None,))
+            for encoding, extensions in self.content_encodings.items():
+                for ext in extensions:
+                    encoded = sizes.get(resource_name + ext)
+                    if encoded is not None:
+                        result.append(encoded + (encoding,))
+            # sort the files by size, smallest first
+            result.sort(key=lambda x: x[1])
+            filemap[resource_name] = [
+                (filepath, encoding) for filepath, size, encoding in result
+            ]
+        self.filemap = filemap
+        self.index_dirs = dirs
+
+    def _walk_files(self):
+        files = {}
+        if self.package_name:
+            pending = ['']
+            while pending:
+                parent = pending.pop()
+                resource_path = self.get_resource_path(parent)
+                for name in resource_listdir(self.package_name, resource_path):
+                    path = parent + '/' + name if parent else name
+                    resource_path = self.get_resource_path(path)
+                    if resource_isdir(self.package_name, resource_path):
+                        pending.append(path)
+                    else:
+                        filepath = resource_filename(
+                            self.package_name, resource_path
+                        )
+                        files[path] = (filepath, getsize(filepath))
+        else:
+            # symlinked directories are followed, as they are when serving
+            # without the index, except those linking back to a directory
+            # being walked; ``ancestors`` maps each directory still to be
+            # walked to the real paths of itself and its parents
+            docroot = self.norm_docroot
+            ancestors = {docroot: frozenset([os.path.realpath(docroot)])}
+            for dirpath, dirnames, filenames in os.walk(
+                docroot, followlinks=True
+            ):
+                seen = ancestors.pop(dirpath)
+                subdirs = []
+                for name in dirnames:
+                    realpath = os.path.realpath(join(dirpath, name))
+                    if realpath not in seen:
+                        subdirs.append(name)
+                        ancestors[join(dirpath, name)] = seen | {realpath}
+                dirnames[:] = subdirs
+                parent = os.path.relpath(dirpath, docroot)
+                parent = '' if parent == '.' else parent.replace(os.sep, '/')
+                for name in filenames:
+                    path = parent + '/' + name if parent else name
+                    filepath = join(dirpath, name)
+                    files[path] = (filepath, getsize(filepath))
+        return files
+
+    def _load_file_manifest(self):
+        with open(self.file_index, 'rb') as fp:
+            manifest = json.loads(fp.read().decode('utf-8'))
+        files = {}
+        for path, size in manifest.items():
+            resource_path = self.get_resource_path(path)
+            if self.package_name:
+                filepath = resource_filename(self.package_name, resource_path)
+            else:
+                filepath = resource_path
+            files[path] = (filepath, size)
+        return files
+
     def find_best_match(self, request, files):
         """Return ``(path | None, encoding)``."""
         # if the client did not specify encodings then assume only the
@@ -254,6 +574,11 @@ class static_view:
         return HTTPMovedPermanently(url)
 
 
+_CachedFile = namedtuple(
+    '_CachedFile', ['mtime', 'size', 'content_type', 'body', 'etag']
+)
+
+
 def _compile_content_encodings(encodings):
     """
     Convert mimetypes.encodings_map into a dict of
@@ -267,6 +592,46 @@ def _compile_content_encodings(encodings):
     return result
 
 
+_MIN_COMPRESS_SIZE = 256
+
+_compressible_types = {
+    'application/javascript',
+    'application/json',
+    'application/wasm',
+    'application/xml',
+    'image/svg+xml',
+}
+
+
+def _is_compressible(content_type):
+    return (
+        content_type.startswith('text/')
+        or content_type in _compressible_types
+        or content_type.endswith(('+json', '+xml'))
+    )
+
+
+def _gzip_compress(data):
+    # a fixed mtime keeps the output, and hence its ETag, deterministic
+    return gzip.compress(data, mtime=0)
+
+
+def _get_compressors():
+    """
+    Return a dict of ``(encoding) -> compress function`` for the encodings
+    that may be used to compress static assets on the fly.
+
+    """
+    compressors = {'gzip': _gzip_compress}
+    try:
+        import brotli
+    except ImportError:
+        pass
+    else:
+        compressors['br'] = brotli.compress
+    return compressors
+
+
 def _add_vary(response, option):
     vary = response.vary or []
     if not any(x.lower() == option.lower() for x in vary):
@@ -384,24 +749,38 @@ class ManifestCacheBuster:
     If ``reload`` is ``True`` then the manifest file will be reloaded when
     changed. It is not recommended to leave this enabled in production.
 
+    ``reload_interval`` is the minimum number of seconds between checks
+    for changes to the manifest file when ``reload`` is ``True``.  By
+    default, it is ``0`` and the file is checked every time a URL is
+    generated; a page which generates hundreds of asset URLs can set it to
+    a second or so to check the file at most once per page.
+
     If the manifest file cannot be found on disk it will be treated as
     an empty mapping unless ``reload`` is ``False``.
 
     .. versionadded:: 1.6
+
+    .. versionchanged:: 2.2
+       Added the ``reload_interval`` argument.
     """
 
     exists = staticmethod(exists)  # testing
     getmtime = staticmethod(getmtime)  # testing
+    monotonic = staticmethod(time.monotonic)  # testing
 
-    def __init__(self, manifest_spec, reload=False):
+    def __init__(self, manifest_spec, reload=False, reload_interval=0):
         package_name = caller_package().__name__
         self.manifest_path = abspath_from_asset_spec(
             manifest_spec, package_name
         )
         self.reload = reload
+        self.reload_interval = reload_interval
 
         self._mtime = None
-        if not reload:
+        self._checked = None
+        if reload:
+            self._manifest = {}
+        else:
             self._manifest = self.get_manifest()
 
     def get_manifest(self):
@@ -424,14 +803,25 @@ class ManifestCacheBuster:
     def manifest(self):
         """The current manifest dictionary."""
         if self.reload:
-            if not self.exists(self.manifest_path):
-                return {}
-            mtime = self.getmtime(self.manifest_path)
-            if self._mtime is None or mtime > self._mtime:
-                self._manifest = self.get_manifest()
-                self._mtime = mtime
+            now = self.monotonic()
+            if (
+                self._checked is None
+                or now - self._checked >= self.reload_interval
+            ):
+                self._checked = now
+                self._check_manifest()
         return self._manifest
 
+    def _check_manifest(self):
+        if not self.exists(self.manifest_path):
+            self._manifest = {}
+            self._mtime = None
+            return
+        mtime = self.getmtime(self.manifest_path)
+        if self._mtime is None or mtime > self._mtime:
+            self._manifest = self.get_manifest()
+            self._mtime = mtime
+
     def __call__(self, request, subpath, kw):
         subpath = self.manifest.get(subpath, subpath)
         return (subpath, kw)
@@ -1,3 +1,4 @@
+import contextvars
 import threading
 
 from pyramid.registry import global_registry
@@ -32,11 +33,54 @@ class ThreadLocalManager(threading.local):
         self.stack[:] = []
 
 
+class ContextVarManager:
+    """A stack of ``{'request': ..., 'registry': ...}`` dictionaries with
+    the same API as :class:`ThreadLocalManager`, stored in a
+    :class:`contextvars.ContextVar`.
+
+    Each thread has its own stack, as with :class:`ThreadLocalManager`, but
+    so does each :mod:`asyncio` task and each
+    :meth:`contextvars.Context.run` call: changes made within one of them
+    are not visible to the others.  A task or context copy starts with the
+    stack that was current when it was created.
+
+    .. versionadded:: 2.2
+    """
+
+    def __init__(self, default=None):
+        self._stack = contextvars.ContextVar('pyramid_manager', default=())
+        self.default = default
+
+    @property
+    def stack(self):
+        return list(self._stack.get())
+
+    def push(self, info):
+        self._stack.set(self._stack.get() + (info,))
+
+    set = push  # b/c
+
+    def pop(self):
+        stack = self._stack.get()
+        if stack:
+            self._stack.set(stack[:-1])
+            return stack[-1]
+
+    def get(self):
+        stack = self._stack.get()
+        if stack:
+            return stack[-1]
+        return self.default()
+
+    def clear(self):
+        self._stack.set(())
+
+
 def defaults():
     return {'request': None, 'registry': global_registry}
 
 
-manager = ThreadLocalManager(default=defaults)
+manager = ContextVarManager(default=defaults)
 
 
 def get_current_request():
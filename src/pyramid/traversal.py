@@ -533,7 +533,9 @@ def unquote_bytes_to_wsgi(bytestring):
     return unquote_to_bytes(bytestring).decode('latin-1')
 
 
-_segment_cache = {}
+@lru_cache(10000)
+def _quote_segment(segment, safe):
+    return url_quote(text_(segment, 'utf-8'), safe)
 
 
 def quote_path_segment(segment, safe=PATH_SEGMENT_SAFE):
@@ -552,31 +554,43 @@ def quote_path_segment(segment, safe=PATH_SEGMENT_SAFE):
     .. note::
 
        The return value for each segment passed to this
-       function is cached in a module-scope dictionary for
-       speed: the cached version is returned when possible
-       rather than recomputing the quoted version.  No cache
-       emptying is ever done for the lifetime of an
-       application, however.  If you pass arbitrary
-       user-supplied strings to this function (as opposed to
-       some bounded set of values from a 'working set' known to
-       your application), it may become a memory leak.
+       function is cached for speed: the cached version is
+       returned when possible rather than recomputing the quoted
+       version.  The cache holds the most recently used 10000
+       segments by default; its size may be changed with
+       :func:`pyramid.traversal.set_quote_path_segment_cache_size`
+       and its statistics are returned by
+       :func:`pyramid.traversal.quote_path_segment_cache_info`.
+
+    .. versionchanged:: 2.2
+       The cache is bounded.  Previously every segment passed to this
+       function was kept for the lifetime of the application.
 
     """
-    # The bit of this code that deals with ``_segment_cache`` is an
-    # optimization: we cache all the computation of URL path segments
-    # in this module-scope dictionary with the original string as the
-    # key, so we can look it up later without needing to reencode
-    # or re-url-quote it
-    try:
-        if segment.__class__ not in (str, bytes):
-            segment = str(segment)
-        return _segment_cache[(segment, safe)]
-    except KeyError:
-        result = url_quote(text_(segment, 'utf-8'), safe)
-        # we don't need a lock to mutate _segment_cache, as the below
-        # will generate exactly one Python bytecode (STORE_SUBSCR)
-        _segment_cache[(segment, safe)] = result
-        return result
+    if segment.__class__ not in (str, bytes):
+        segment = str(segment)
+    return _quote_segment(segment, safe)
+
+
+def quote_path_segment_cache_info():
+    """Return a named tuple of ``hits``, ``misses``, ``maxsize`` and
+    ``currsize`` describing the cache used by
+    :func:`pyramid.traversal.quote_path_segment`.
+
+    .. versionadded:: 2.2
+    """
+    return _quote_segment.cache_info()
+
+
+def set_quote_path_segment_cache_size(maxsize):
+    """Replace the cache used by :func:`pyramid.traversal.quote_path_segment`
+    with an empty one holding at most ``maxsize`` segments.  If ``maxsize``
+    is ``None`` the cache is unbounded.
+
+    .. versionadded:: 2.2
+    """
+    global _quote_segment
+    _quote_segment = lru_cache(maxsize)(_quote_segment.__wrapped__)
 
 
 @implementer(ITraverser)
@@ -745,6 +759,28 @@ class ResourceURL:
         )
 
 
+def _shared_physical_path(resource, memo):
+    """Return the ``physical_path`` which :class:`ResourceURL` computes for
+    ``resource``, reusing the paths of its ancestors stored in ``memo`` (a
+    dictionary keyed by ``id()``) and adding the paths computed along the
+    way.  Used to generate the URLs of many resources sharing a parent."""
+    chain = []
+    prefix = ''
+    location = resource
+    while location is not None:
+        cached = memo.get(id(location))
+        if cached is not None:
+            prefix = cached[1]
+            break
+        chain.append(location)
+        location = getattr(location, '__parent__', None)
+    for location in reversed(chain):
+        prefix += quote_path_segment(location.__name__ or '') + '/'
+        # keep a reference to the resource so its id is not reused
+        memo[id(location)] = (location, prefix)
+    return prefix
+
+
 @lru_cache(1000)
 def _join_path_tuple(tuple):
     return tuple and '/'.join([quote_path_segment(x) for x in tuple]) or '/'
@@ -756,3 +792,66 @@ class DefaultRootFactory:
 
     def __init__(self, request):
         pass
+
+
+class LazyRoot:
+    """A stand-in for the :term:`root` resource which calls the root
+    factory with the request the first time the root is used and behaves as
+    the resulting object from then on.  Attribute access, item access,
+    ``isinstance`` checks and interface lookups are delegated to the real
+    root.
+
+    It is used as ``request.root`` and ``request.context`` for routes added
+    with ``lazy_root=True``."""
+
+    __slots__ = ('_factory', '_request', '_root')
+
+    def __init__(self, factory, request):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_request', request)
+
+    def _get_root(self):
+        try:
+            return object.__getattribute__(self, '_root')
+        except AttributeError:
+            root = self._factory(self._request)
+            object.__setattr__(self, '_root', root)
+            return root
+
+    @property
+    def __class__(self):
+        return self._get_root().__class__
+
+    def __getattr__(self, name):
+        return getattr(self._get_root(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get_root(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._get_root(), name)
+
+    # container methods are only present if the root has them; traversal
+    # relies on ``__getitem__`` raising ``AttributeError`` otherwise
+    __getitem__ = property(lambda self: self._get_root().__getitem__)
+    __contains__ = property(lambda self: self._get_root().__contains__)
+    __iter__ = property(lambda self: self._get_root().__iter__)
+    __len__ = property(lambda self: self._get_root().__len__)
+
+    def __bool__(self):
+        return bool(self._get_root())
+
+    def __eq__(self, other):
+        return self._get_root() == other
+
+    def __ne__(self, other):
+        return self._get_root() != other
+
+    def __hash__(self):
+        return hash(self._get_root())
+
+    def __repr__(self):
+        return repr(self._get_root())
+
+    def __str__(self):
+        return str(self._get_root())
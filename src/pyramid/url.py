@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 import os
+from zope.interface import providedBy
 
 from pyramid.encode import url_quote, urlencode
 from pyramid.interfaces import IResourceURL, IRoutesMapper, IStaticURLInfo
@@ -11,6 +12,7 @@ from pyramid.traversal import (
     PATH_SAFE,
     PATH_SEGMENT_SAFE,
     ResourceURL,
+    _shared_physical_path,
     quote_path_segment,
 )
 from pyramid.util import bytes_
@@ -18,6 +20,10 @@ from pyramid.util import bytes_
 QUERY_SAFE = "/?:@!$&'()*+,;="  # RFC 3986
 ANCHOR_SAFE = QUERY_SAFE
 
+_URL_OVERRIDES = frozenset(
+    ('_app_url', '_scheme', '_host', '_port', '_query', '_anchor')
+)
+
 
 def parse_url_overrides(request, kw):
     """
@@ -29,6 +35,9 @@ def parse_url_overrides(request, kw):
       ``(app_url, qs, anchor)``.
 
     """
+    if _URL_OVERRIDES.isdisjoint(kw):
+        return request.application_url, '', ''
+
     app_url = kw.pop('_app_url', None)
     scheme = kw.pop('_scheme', None)
     host = kw.pop('_host', None)
@@ -598,6 +607,98 @@ class URLMethodsMixin:
         kw['app_url'] = self.script_name
         return self.resource_url(resource, *elements, **kw)
 
+    def resource_urls(self, resources, *elements, **kw):
+        """
+        Generate the URLs of each :term:`resource` in the iterable
+        ``resources`` and return them as a list.  The result is the same as
+        calling :meth:`pyramid.request.Request.resource_url` with
+        ``elements`` and ``kw`` for each resource in turn::
+
+            [request.resource_url(resource, *elements, **kw)
+             for resource in resources]
+
+        but it is faster when generating the URLs of many resources (such as
+        the children of a folder): the application URL, query string and
+        elements are computed once, and the quoted path of each parent
+        resource is computed only once for all of its children.
+
+        Resources which have a ``__resource_url__`` method or for which an
+        :class:`pyramid.interfaces.IResourceURL` adapter is registered, as
+        well as all of the resources when ``route_name`` is passed, are
+        handed to :meth:`pyramid.request.Request.resource_url` one at a
+        time.
+
+        .. versionadded:: 2.2
+        """
+        if 'route_name' in kw:
+            return [
+                self.resource_url(resource, *elements, **kw)
+                for resource in resources
+            ]
+
+        try:
+            reg = self.registry
+        except AttributeError:
+            reg = get_current_registry()  # b/c
+
+        urlkw = {}
+        for name in ('app_url', 'scheme', 'host', 'port', 'query', 'anchor'):
+            val = kw.get(name, None)
+            if val is not None:
+                urlkw['_' + name] = val
+        app_url, qs, anchor = parse_url_overrides(self, urlkw)
+
+        if elements:
+            suffix = _join_elements(elements)
+        else:
+            suffix = ''
+        suffix = suffix + qs + anchor
+
+        vroot_path = self.environ.get(ResourceURL.VH_ROOT_KEY)
+        if vroot_path is not None:
+            vroot_path = vroot_path.rstrip('/')
+
+        lookup = reg.adapters.lookup
+        request_iface = providedBy(self)
+        has_adapter = {}
+        paths = {}
+        urls = []
+
+        for resource in resources:
+            resource_iface = providedBy(resource)
+            adapted = has_adapter.get(resource_iface)
+            if adapted is None:
+                adapted = has_adapter[resource_iface] = (
+                    lookup((resource_iface, request_iface), IResourceURL)
+                    is not None
+                )
+            if adapted or getattr(resource, '__resource_url__', None):
+                urls.append(self.resource_url(resource, *elements, **kw))
+                continue
+
+            path = _shared_physical_path(resource, paths)
+            if vroot_path and path.startswith(vroot_path):
+                path = path[len(vroot_path) :]
+            urls.append(app_url + path + suffix)
+
+        return urls
+
+    def resource_paths(self, resources, *elements, **kw):
+        """
+        Generates the paths (aka 'relative URLs', URLs minus the host,
+        scheme, and port) of each :term:`resource` in the iterable
+        ``resources`` and return them as a list.
+
+        This function accepts the same arguments as
+        :meth:`pyramid.request.Request.resource_urls` and performs the same
+        duty, in the way :meth:`pyramid.request.Request.resource_path`
+        relates to :meth:`pyramid.request.Request.resource_url`.
+
+        .. versionadded:: 2.2
+        """
+        kw['app_url'] = self.script_name
+        return self.resource_urls(resources, *elements, **kw)
+
     def static_url(self, path, **kw):
         """
         Generates a fully qualified URL for a static :term:`asset`.
@@ -11,12 +11,16 @@ _marker = object()
 
 @implementer(IRoute)
 class Route:
+    # whether the root factory is called lazily, None means the default
+    lazy_root = None
+
     def __init__(
         self, name, pattern, factory=None, predicates=(), pregenerator=None
     ):
         self.pattern = pattern
         self.path = pattern  # indefinite b/w compat, not in interface
         self.match, self.generate = _compile_route(pattern)
+        self.static_segments = _static_segments(pattern)
         self.name = name
         self.factory = factory
         self.predicates = predicates
@@ -25,11 +29,13 @@ class Route:
 
 @implementer(IRoutesMapper)
 class RoutesMapper:
-    def __init__(self):
+    def __init__(self, compiled=False):
         self.routelist = []
         self.static_routes = []
 
         self.routes = {}
+        self.compiled = compiled
+        self._index = None
 
     def has_routes(self):
         return bool(self.routelist)
@@ -64,6 +70,7 @@ class RoutesMapper:
             self.static_routes.append(route)
 
         self.routes[name] = route
+        self._index = None
         return route
 
     def generate(self, name, kw):
@@ -80,7 +87,16 @@ class RoutesMapper:
                 e.encoding, e.object, e.start, e.end, e.reason
             )
 
-        for route in self.routelist:
+        routelist = self.routelist
+        if self.compiled and not path.endswith('\n'):
+            # a trailing newline is matched by the ``$`` anchor of the route
+            # regexes, so such paths always take the linear scan below
+            index = self._index
+            if index is None:
+                index = self._index = _RouteIndex(routelist)
+            routelist = index.candidates(path)
+
+        for route in routelist:
             match = route.match(path)
             if match is not None:
                 preds = route.predicates
@@ -92,6 +108,44 @@ class RoutesMapper:
         return {'route': None, 'match': None}
 
 
+class _RouteIndex:
+    """A segment trie over the literal prefixes of a list of routes.
+
+    Each node holds, in definition order, every route that could possibly
+    match a path reaching that node: the routes whose leading static
+    segments lead there plus the routes stored in all of its ancestors.
+    Looking up a path therefore yields the few candidate routes that must
+    still be tried with their regexes, and first-match-wins ordering is
+    preserved."""
+
+    def __init__(self, routelist):
+        root = ([], {})
+        for order, route in enumerate(routelist):
+            segments = getattr(route, 'static_segments', ())
+            node = root
+            for segment in segments:
+                node = node[1].setdefault(segment, ([], {}))
+            node[0].append((order, route))
+        self.root = self._freeze(root, [])
+
+    def _freeze(self, node, inherited):
+        entries = sorted(inherited + node[0], key=lambda entry: entry[0])
+        children = {
+            segment: self._freeze(child, entries)
+            for segment, child in node[1].items()
+        }
+        return [route for order, route in entries], children
+
+    def candidates(self, path):
+        routes, children = self.root
+        for segment in path.split('/')[1:]:
+            child = children.get(segment)
+            if child is None:
+                break
+            routes, children = child
+        return routes
+
+
 # stolen from bobo and modified
 old_route_re = re.compile(r'(\:[_a-zA-Z]\w*)')
 star_at_end = re.compile(r'\*(\w*)$')
@@ -108,7 +162,7 @@ def update_pattern(matchobj):
     return '{%s}' % name[1:]
 
 
-def _compile_route(route):
+def _split_route(route):
     # This function really wants to consume Unicode patterns natively, but if
     # someone passes us a bytestring, we allow it by converting it to Unicode
     # using the ASCII decoding.  We decode it using ASCII because we don't
@@ -134,6 +188,24 @@ def _compile_route(route):
     if star_at_end.search(route):
         route, remainder = route.rsplit('*', 1)
 
+    return route, remainder
+
+
+def _static_segments(route):
+    # Return the path segments every path matched by ``route`` must start
+    # with.  Only whole segments of the leading literal part of the pattern
+    # are used; a partial segment preceding a replacement marker or a
+    # star remainder is left for the route regex to check.
+    route, remainder = _split_route(route)
+    pat = route_re.split(route)
+    segments = pat[0].split('/')[1:]
+    if len(pat) > 1 or remainder is not None:
+        segments.pop()
+    return tuple(segments)
+
+
+def _compile_route(route):
+    route, remainder = _split_route(route)
     pat = route_re.split(route)
 
     # every element in "pat" will be Unicode (regardless of whether the
@@ -152,6 +224,10 @@ def _compile_route(route):
     )  # native
     rpat.append(re.escape(prefix))  # unicode
 
+    # the names of the replacement markers in the pattern; other keys in
+    # the dict passed to the generator do not need to be quoted
+    names = []
+
     while pat:
         name = pat.pop()  # unicode
         name = name[1:-1]
@@ -161,6 +237,7 @@ def _compile_route(route):
             name, reg = name.split(':', 1)
         else:
             reg = '[^/]+'
+        names.append(name)
         gen.append('%%(%s)s' % name)  # native
         name = f'(?P<{name}>{reg})'  # unicode
         rpat.append(name)
@@ -201,26 +278,28 @@ def _compile_route(route):
 
     def generator(dict):
         newdict = {}
-        for k, v in dict.items():
+        for k in names:
+            v = dict[k]  # raises KeyError if a marker has no value
+            if v.__class__ is not str:
+                if v.__class__ is bytes:
+                    # url_quote below needs a native string
+                    v = v.decode('utf-8')
+                else:
+                    v = str(v)
+            newdict[k] = quote_path_segment(v, PATH_SAFE)
+
+        if remainder:
+            v = dict[remainder]
             if v.__class__ is bytes:
-                # url_quote below needs a native string
                 v = v.decode('utf-8')
-
-            if k == remainder:
-                # a stararg argument
-                if is_nonstr_iter(v):
-                    v = '/'.join([q(x) for x in v])  # native
-                else:
-                    if v.__class__ is not str:
-                        v = str(v)
-                    v = q(v)
+            # a stararg argument
+            if is_nonstr_iter(v):
+                v = '/'.join([q(x) for x in v])  # native
             else:
                 if v.__class__ is not str:
                     v = str(v)
                 v = q(v)
-
-            # at this point, the value will be a native string
-            newdict[k] = v
+            newdict[remainder] = v
 
         result = gen % newdict  # native string result
         return result
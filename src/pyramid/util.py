@@ -1,8 +1,10 @@
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 import functools
 from hmac import compare_digest
 import inspect
 import platform
+import threading
 import weakref
 
 from pyramid.path import DottedNameResolver as _DottedNameResolver
@@ -140,31 +142,39 @@ class InstancePropertyHelper:
         """
         attrs = dict(properties)
         if attrs:
-            parent = target.__class__
-            # fix the module name so it appears to still be the parent
-            # e.g. pyramid.request instead of pyramid.util
-            attrs.setdefault('__module__', parent.__module__)
-            newcls = type(parent.__name__, (parent, object), attrs)
-            # We assign __provides__ and __implemented__ below to prevent a
-            # memory leak that results from from the usage of this instance's
-            # eventual use in an adapter lookup.  Adapter lookup results in
-            # ``zope.interface.implementedBy`` being called with the
-            # newly-created class as an argument.  Because the newly-created
-            # class has no interface specification data of its own, lookup
-            # causes new ClassProvides and Implements instances related to our
-            # just-generated class to be created and set into the newly-created
-            # class' __dict__.  We don't want these instances to be created; we
-            # want this new class to behave exactly like it is the parent class
-            # instead.  See GitHub issues #1212, #1529 and #1568 for more
-            # information.
-            for name in ('__implemented__', '__provides__'):
-                # we assign these attributes conditionally to make it possible
-                # to test this class in isolation without having any interfaces
-                # attached to it
-                val = getattr(parent, name, _marker)
-                if val is not _marker:
-                    setattr(newcls, name, val)
-            target.__class__ = newcls
+            target.__class__ = cls.make_class(target.__class__, attrs)
+
+    @classmethod
+    def make_class(cls, parent, properties):
+        """Return a new subclass of ``parent`` holding the ``properties``
+        generated from :meth:`.make_property`.  Instances of ``parent`` may
+        have their ``__class__`` set to the result to gain the properties.
+        """
+        attrs = dict(properties)
+        # fix the module name so it appears to still be the parent
+        # e.g. pyramid.request instead of pyramid.util
+        attrs.setdefault('__module__', parent.__module__)
+        newcls = type(parent.__name__, (parent, object), attrs)
+        # We assign __provides__ and __implemented__ below to prevent a
+        # memory leak that results from from the usage of this instance's
+        # eventual use in an adapter lookup.  Adapter lookup results in
+        # ``zope.interface.implementedBy`` being called with the
+        # newly-created class as an argument.  Because the newly-created
+        # class has no interface specification data of its own, lookup
+        # causes new ClassProvides and Implements instances related to our
+        # just-generated class to be created and set into the newly-created
+        # class' __dict__.  We don't want these instances to be created; we
+        # want this new class to behave exactly like it is the parent class
+        # instead.  See GitHub issues #1212, #1529 and #1568 for more
+        # information.
+        for name in ('__implemented__', '__provides__'):
+            # we assign these attributes conditionally to make it possible
+            # to test this class in isolation without having any interfaces
+            # attached to it
+            val = getattr(parent, name, _marker)
+            if val is not _marker:
+                setattr(newcls, name, val)
+        return newcls
 
     @classmethod
     def set_property(cls, target, callable, name=None, reify=False):
@@ -317,6 +327,76 @@ class WeakOrderedSet:
             return self._items[oid]()
 
 
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
+
+
+class LRUCache:
+    """A thread-safe mapping which holds at most ``maxsize`` items.
+
+    When full, storing a new key evicts the least recently used item.  The
+    number of lookup hits and misses and the number of evictions are
+    counted and may be retrieved via :meth:`.info`.
+
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a') == 1
+        cache['c'] = 3  # evicts 'b'
+        cache.get('b') is None
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the value for ``key`` or ``default``, marking the key as
+        the most recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            data = self._data
+            data[key] = value
+            data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Remove all items from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        """Return a :class:`CacheInfo` tuple of the cache statistics."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self._data),
+        )
+
+
 def strings_differ(string1, string2):
     """Check whether two strings differ while avoiding timing attacks.
 
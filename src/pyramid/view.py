@@ -607,7 +607,14 @@ def _find_views(
         view_classifier = IViewClassifier
     registered = registry.adapters.registered
     cache = registry._view_lookup_cache
-    views = cache.get((request_iface, context_iface, view_name))
+    key = (
+        request_iface,
+        context_iface,
+        view_name,
+        tuple(view_types),
+        view_classifier,
+    )
+    views = cache.get(key)
     if views is None:
         views = []
         for req_type, ctx_type in itertools.product(
@@ -620,15 +627,9 @@ def _find_views(
                 )
                 if view_callable is not None:
                     views.append(view_callable)
-        if views:
-            # do not cache view lookup misses.  rationale: dont allow cache to
-            # grow without bound if somebody tries to hit the site with many
-            # missing URLs.  we could use an LRU cache instead, but then
-            # purposeful misses by an attacker would just blow out the cache
-            # anyway. downside: misses will almost always consume more CPU than
-            # hits in steady state.
-            with registry._lock:
-                cache[(request_iface, context_iface, view_name)] = views
+        # misses are cached too: the cache is bounded, so many missing URLs
+        # only evict the least recently used lookups instead of growing it
+        cache[key] = views
 
     return views
 
@@ -2,6 +2,7 @@ import inspect
 from zope.interface import implementer, provider
 
 from pyramid import renderers
+from pyramid.asgi import resolve_awaitable
 from pyramid.csrf import check_csrf_origin, check_csrf_token
 from pyramid.exceptions import ConfigurationError
 from pyramid.httpexceptions import HTTPForbidden
@@ -403,6 +404,8 @@ def rendered_view(view, info):
             if result.__class__ is Response:  # common case
                 response = result
             else:
+                if inspect.isawaitable(result):
+                    result = resolve_awaitable(request, result)
                 response = info.registry.queryAdapterOrSelf(result, IResponse)
                 if response is None:
                     if result is None:
@@ -438,6 +441,8 @@ def rendered_view(view, info):
         if result.__class__ is Response:  # potential common case
             response = result
         else:
+            if inspect.isawaitable(result):
+                result = resolve_awaitable(request, result)
             # this must adapt, it can't do a simple interface check
             # (avoid trying to render webob responses)
             response = info.registry.queryAdapterOrSelf(result, IResponse)
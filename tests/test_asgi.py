@@ -0,0 +1,441 @@
+import asyncio
+import contextvars
+import sys
+import unittest
+
+from pyramid import testing
+
+dummy_var = contextvars.ContextVar('dummy_var', default=None)
+
+
+class TestASGIRouter(unittest.TestCase):
+    def _makeOne(self, router, max_workers=None):
+        from pyramid.asgi import ASGIRouter
+
+        app = ASGIRouter(router, max_workers=max_workers)
+        self.addCleanup(app.executor.shutdown)
+        return app
+
+    def _callApp(self, app, scope, messages=None):
+        if messages is None:
+            messages = [{'type': 'http.request', 'body': b''}]
+        received = list(messages)
+        sent = []
+
+        async def receive():
+            return received.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(app(scope, receive, send))
+        return sent
+
+    def _makeScope(self, **kw):
+        scope = {
+            'type': 'http',
+            'method': 'GET',
+            'path': '/',
+            'query_string': b'',
+            'headers': [],
+        }
+        scope.update(kw)
+        return scope
+
+    def test_ctor(self):
+        router = DummyRouter()
+        app = self._makeOne(router, max_workers=3)
+        self.assertEqual(app.router, router)
+        self.assertEqual(app.registry, router.registry)
+        self.assertEqual(app.max_workers, 3)
+        self.assertEqual(app.executor._max_workers, 3)
+
+    def test_ctor_default_max_workers(self):
+        app = self._makeOne(DummyRouter())
+        self.assertTrue(app.max_workers >= 5)
+
+    def test_http(self):
+        router = DummyRouter(
+            headers=[('Content-Type', 'text/plain')], body=[b'a', b'', b'b']
+        )
+        app = self._makeOne(router)
+        sent = self._callApp(
+            app,
+            self._makeScope(method='POST'),
+            [
+                {'type': 'http.request', 'body': b'ab', 'more_body': True},
+                {'type': 'http.request', 'body': b'c'},
+            ],
+        )
+        self.assertEqual(
+            sent,
+            [
+                {
+                    'type': 'http.response.start',
+                    'status': 200,
+                    'headers': [(b'content-type', b'text/plain')],
+                },
+                {
+                    'type': 'http.response.body',
+                    'body': b'a',
+                    'more_body': True,
+                },
+                {
+                    'type': 'http.response.body',
+                    'body': b'b',
+                    'more_body': True,
+                },
+                {'type': 'http.response.body', 'body': b''},
+            ],
+        )
+        self.assertEqual(router.body, b'abc')
+        self.assertEqual(router.environ['REQUEST_METHOD'], 'POST')
+        self.assertTrue(router.app_iter.closed)
+
+    def test_http_empty_body(self):
+        router = DummyRouter(status='204 No Content', body=[])
+        app = self._makeOne(router)
+        sent = self._callApp(app, self._makeScope())
+        self.assertEqual(
+            sent,
+            [
+                {
+                    'type': 'http.response.start',
+                    'status': 204,
+                    'headers': [],
+                },
+                {'type': 'http.response.body', 'body': b''},
+            ],
+        )
+
+    def test_http_error_after_response_started(self):
+        class Router(DummyRouter):
+            def __call__(self, environ, start_response):
+                start_response(self.status, self.headers)
+                yield b'a'
+                try:
+                    raise RuntimeError
+                except RuntimeError:
+                    exc_info = sys.exc_info()
+                start_response('500 Internal Server Error', [], exc_info)
+
+        router = Router()
+        app = self._makeOne(router)
+        self.assertRaises(RuntimeError, self._callApp, app, self._makeScope())
+
+    def test_http_disconnect(self):
+        router = DummyRouter()
+        app = self._makeOne(router)
+        sent = self._callApp(
+            app, self._makeScope(), [{'type': 'http.disconnect'}]
+        )
+        self.assertEqual(sent, [])
+        self.assertEqual(router.environ, None)
+
+    def test_http_propagates_contextvars(self):
+        router = DummyRouter()
+        app = self._makeOne(router)
+        token = dummy_var.set('value')
+        try:
+            self._callApp(app, self._makeScope())
+        finally:
+            dummy_var.reset(token)
+        self.assertEqual(router.var, 'value')
+
+    def test_http_sets_loop(self):
+        from pyramid.asgi import ASGI_LOOP_KEY
+
+        router = DummyRouter()
+        app = self._makeOne(router)
+        self._callApp(app, self._makeScope())
+        self.assertIsInstance(
+            router.environ[ASGI_LOOP_KEY], asyncio.AbstractEventLoop
+        )
+
+    def test_lifespan(self):
+        app = self._makeOne(DummyRouter())
+        sent = self._callApp(
+            app,
+            {'type': 'lifespan'},
+            [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}],
+        )
+        self.assertEqual(
+            sent,
+            [
+                {'type': 'lifespan.startup.complete'},
+                {'type': 'lifespan.shutdown.complete'},
+            ],
+        )
+
+    def test_lifespan_replaces_executor(self):
+        app = self._makeOne(DummyRouter(), max_workers=2)
+        executor = app.executor
+        self._callApp(
+            app,
+            {'type': 'lifespan'},
+            [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}],
+        )
+        self.assertIsNot(app.executor, executor)
+        self.assertEqual(app.executor._max_workers, 2)
+        self.assertRaises(RuntimeError, executor.submit, int)
+
+    def test_unsupported_scope(self):
+        app = self._makeOne(DummyRouter())
+        self.assertRaises(
+            ValueError, self._callApp, app, {'type': 'websocket'}
+        )
+
+
+class Test_scope_to_environ(unittest.TestCase):
+    def _callFUT(self, scope, body=b''):
+        from pyramid.asgi import scope_to_environ
+
+        return scope_to_environ(scope, body)
+
+    def test_minimal(self):
+        environ = self._callFUT(
+            {'type': 'http', 'method': 'GET', 'path': '/'}, b'body'
+        )
+        self.assertEqual(environ['REQUEST_METHOD'], 'GET')
+        self.assertEqual(environ['SCRIPT_NAME'], '')
+        self.assertEqual(environ['PATH_INFO'], '/')
+        self.assertEqual(environ['QUERY_STRING'], '')
+        self.assertEqual(environ['SERVER_NAME'], 'localhost')
+        self.assertEqual(environ['SERVER_PORT'], '80')
+        self.assertEqual(environ['SERVER_PROTOCOL'], 'HTTP/1.1')
+        self.assertEqual(environ['wsgi.url_scheme'], 'http')
+        self.assertEqual(environ['wsgi.input'].read(), b'body')
+        self.assertFalse('REMOTE_ADDR' in environ)
+
+    def test_full(self):
+        environ = self._callFUT(
+            {
+                'type': 'http',
+                'method': 'POST',
+                'scheme': 'https',
+                'http_version': '2',
+                'root_path': '/app',
+                'path': '/app/caf\xe9',
+                'query_string': b'a=1',
+                'server': ('example.com', 8443),
+                'client': ('10.0.0.1', 1234),
+                'headers': [
+                    (b'content-type', b'text/plain'),
+                    (b'content-length', b'4'),
+                    (b'x-forwarded-for', b'1.2.3.4'),
+                    (b'accept', b'text/html'),
+                    (b'accept', b'text/plain'),
+                    (b'cookie', b'a=1'),
+                    (b'cookie', b'b=2'),
+                ],
+            }
+        )
+        self.assertEqual(environ['REQUEST_METHOD'], 'POST')
+        self.assertEqual(environ['SCRIPT_NAME'], '/app')
+        self.assertEqual(environ['PATH_INFO'], '/caf\xc3\xa9')
+        self.assertEqual(environ['QUERY_STRING'], 'a=1')
+        self.assertEqual(environ['SERVER_NAME'], 'example.com')
+        self.assertEqual(environ['SERVER_PORT'], '8443')
+        self.assertEqual(environ['SERVER_PROTOCOL'], 'HTTP/2')
+        self.assertEqual(environ['wsgi.url_scheme'], 'https')
+        self.assertEqual(environ['REMOTE_ADDR'], '10.0.0.1')
+        self.assertEqual(environ['REMOTE_PORT'], '1234')
+        self.assertEqual(environ['CONTENT_TYPE'], 'text/plain')
+        self.assertEqual(environ['CONTENT_LENGTH'], '4')
+        self.assertEqual(environ['HTTP_X_FORWARDED_FOR'], '1.2.3.4')
+        self.assertEqual(environ['HTTP_ACCEPT'], 'text/html,text/plain')
+        self.assertEqual(environ['HTTP_COOKIE'], 'a=1; b=2')
+
+    def test_unix_socket(self):
+        environ = self._callFUT(
+            {
+                'type': 'http',
+                'method': 'GET',
+                'scheme': 'https',
+                'path': '/',
+                'server': ('/run/app.sock', None),
+            }
+        )
+        self.assertEqual(environ['SERVER_NAME'], 'localhost')
+        self.assertEqual(environ['SERVER_PORT'], '443')
+
+
+class Test_resolve_awaitable(unittest.TestCase):
+    def _callFUT(self, request, awaitable):
+        from pyramid.asgi import resolve_awaitable
+
+        return resolve_awaitable(request, awaitable)
+
+    def test_without_loop(self):
+        async def coro():
+            return 'result'
+
+        request = testing.DummyRequest()
+        self.assertEqual(self._callFUT(request, coro()), 'result')
+
+    def test_with_loop(self):
+        from pyramid.asgi import ASGI_LOOP_KEY
+
+        async def coro():
+            return asyncio.get_running_loop()
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            request = testing.DummyRequest(environ={ASGI_LOOP_KEY: loop})
+            result = await loop.run_in_executor(
+                None, self._callFUT, request, coro()
+            )
+            return loop, result
+
+        loop, result = asyncio.run(main())
+        self.assertIs(result, loop)
+
+
+class TestIntegration(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def tearDown(self):
+        import pyramid.config
+
+        pyramid.config.global_registries.empty()
+
+    async def _call(self, app, path):
+        sent = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b''}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': 'GET', 'path': path}
+        await app(scope, receive, send)
+        return sent
+
+    def _callApp(self, app, path):
+        return asyncio.run(self._call(app, path))
+
+    async def _lifespan(self, app):
+        messages = [
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            pass
+
+        await app({'type': 'lifespan'}, receive, send)
+
+    def test_sync_and_async_views(self):
+        from pyramid.response import Response
+
+        def sync_view(request):
+            return Response('sync')
+
+        async def async_view(request):
+            from pyramid.threadlocal import get_current_request
+
+            await asyncio.sleep(0)
+            self.assertIs(get_current_request(), request)
+            return {'name': request.matchdict['name']}
+
+        self.config.add_route('sync', '/sync')
+        self.config.add_view(sync_view, route_name='sync')
+        self.config.add_route('async', '/async/{name}')
+        self.config.add_view(async_view, route_name='async', renderer='json')
+        app = self.config.make_asgi_app()
+        self.addCleanup(app.executor.shutdown)
+
+        sent = self._callApp(app, '/sync')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertEqual(sent[1]['body'], b'sync')
+
+        sent = self._callApp(app, '/async/fred')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertEqual(sent[1]['body'], b'{"name": "fred"}')
+
+        sent = self._callApp(app, '/missing')
+        self.assertEqual(sent[0]['status'], 404)
+
+    def test_served_from_two_loops(self):
+        async def async_view(request):
+            await asyncio.sleep(0)
+            return 'ok'
+
+        self.config.add_route('async', '/async')
+        self.config.add_view(async_view, route_name='async', renderer='string')
+        app = self.config.make_asgi_app(max_workers=1)
+        self.addCleanup(app.executor.shutdown)
+
+        async def serve():
+            sent = await self._call(app, '/async')
+            await self._lifespan(app)
+            return sent[1]['body']
+
+        # e.g. a server restarted in the same process
+        self.assertEqual(asyncio.run(serve()), b'ok')
+        self.assertEqual(asyncio.run(serve()), b'ok')
+
+    def test_lifespan_shutdown_waits_for_requests_in_flight(self):
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def async_view(request):
+            started.set()
+            await finish.wait()
+            return 'done'
+
+        self.config.add_route('async', '/async')
+        self.config.add_view(async_view, route_name='async', renderer='string')
+        app = self.config.make_asgi_app()
+        self.addCleanup(app.executor.shutdown)
+
+        async def main():
+            request = asyncio.create_task(self._call(app, '/async'))
+            await started.wait()
+            shutdown = asyncio.create_task(self._lifespan(app))
+            await asyncio.sleep(0.01)
+            # the event loop is still running while the pool shuts down
+            self.assertFalse(shutdown.done())
+            finish.set()
+            await shutdown
+            return await request
+
+        sent = asyncio.run(main())
+        self.assertEqual(sent[1]['body'], b'done')
+
+
+class DummyAppIter:
+    closed = False
+
+    def __init__(self, body):
+        self.body = body
+
+    def __iter__(self):
+        return iter(self.body)
+
+    def close(self):
+        self.closed = True
+
+
+class DummyRouter:
+    environ = None
+
+    def __init__(self, status='200 OK', headers=(), body=(b'OK',)):
+        self.registry = object()
+        self.status = status
+        self.headers = list(headers)
+        self.app_iter = DummyAppIter(body)
+
+    def __call__(self, environ, start_response):
+        self.environ = environ
+        self.body = environ['wsgi.input'].read()
+        self.var = dummy_var.get()
+        start_response(self.status, self.headers)
+        return self.app_iter
@@ -568,6 +568,12 @@ class TestAuthTktAuthenticationPolicy(unittest.TestCase):
         inst = self._getTargetClass()('secret', hashalg='sha512')
         self.assertEqual(inst.cookie.hashalg, 'sha512')
 
+    def test_ticket_cache_size(self):
+        inst = self._getTargetClass()('secret')
+        self.assertEqual(inst.cookie.ticket_cache, None)
+        inst = self._getTargetClass()('secret', ticket_cache_size='10')
+        self.assertEqual(inst.cookie.ticket_cache.maxsize, 10)
+
     def test_unauthenticated_userid_returns_None(self):
         request = DummyRequest({})
         policy = self._makeOne(None, None)
@@ -883,6 +889,46 @@ class TestAuthTktCookieHelper(unittest.TestCase):
         result = helper.identify(request)
         self.assertEqual(result, None)
 
+    def test_identify_ticket_cache(self):
+        helper = self._makeOne(
+            'secret', include_ip=True, timeout=10, ticket_cache_size=2
+        )
+        helper.now = 5
+        helper.auth_tkt.tokens = ['a']
+        calls = []
+        parse_ticket = helper.parse_ticket
+
+        def counting_parse_ticket(*arg):
+            calls.append(arg)
+            return parse_ticket(*arg)
+
+        helper.parse_ticket = counting_parse_ticket
+        request = self._makeRequest('ticket')
+        result = helper.identify(request)
+        self.assertEqual(result['userid'], 'userid')
+        self.assertEqual(result['tokens'], ['a'])
+        result['tokens'].append('b')
+        result = helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(result['userid'], 'userid')
+        self.assertEqual(result['tokens'], ['a'])
+        self.assertEqual(len(calls), 1)
+        helper.identify(self._makeRequest('ticket', ipv6=True))
+        self.assertEqual(len(calls), 2)
+        helper.secret = 'other'
+        helper.identify(self._makeRequest('ticket'))
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(calls[2], ('other', 'ticket', '1.1.1.1', 'sha512'))
+        # the timeout is checked even when the ticket is cached
+        helper.now = 20
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+        self.assertEqual(len(calls), 3)
+
+    def test_identify_ticket_cache_bad_cookie(self):
+        helper = self._makeOne('secret', ticket_cache_size=10)
+        helper.auth_tkt.parse_raise = True
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+        self.assertEqual(len(helper.ticket_cache), 0)
+
     def test_identify_cookie_timeout(self):
         helper = self._makeOne('secret', timeout=1)
         self.assertEqual(helper.timeout, 1)
@@ -1580,6 +1626,67 @@ class TestSessionAuthenticationPolicy(unittest.TestCase):
         self.assertEqual(request.session.get('userid'), None)
         self.assertEqual(result, [])
 
+    def test_callback_called_once_per_request_and_userid(self):
+        from pyramid.authorization import Authenticated, Everyone
+
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+            return ['group:' + userid]
+
+        request = DummyRequest(session={'userid': 'fred'})
+        policy = self._makeOne(callback)
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(
+            policy.effective_principals(request),
+            [Everyone, Authenticated, 'fred', 'group:fred'],
+        )
+        self.assertEqual(calls, ['fred'])
+        policy.remember(request, 'wilma')
+        self.assertEqual(policy.authenticated_userid(request), 'wilma')
+        self.assertEqual(calls, ['fred', 'wilma'])
+        policy.authenticated_userid(DummyRequest(session={'userid': 'wilma'}))
+        self.assertEqual(calls, ['fred', 'wilma', 'wilma'])
+        policy.callback = lambda userid, request: None
+        self.assertEqual(policy.authenticated_userid(request), None)
+
+    def test_callback_request_not_weakly_referenceable(self):
+        class Request:
+            __slots__ = ('session',)
+
+        calls = []
+
+        def callback(userid, request):
+            calls.append(userid)
+            return []
+
+        request = Request()
+        request.session = {'userid': 'fred'}
+        policy = self._makeOne(callback)
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(calls, ['fred', 'fred'])
+
+    def test_callback_method_called_once(self):
+        from pyramid.authentication import CallbackAuthenticationPolicy
+
+        calls = []
+
+        class Policy(CallbackAuthenticationPolicy):
+            def unauthenticated_userid(self, request):
+                return request.session['userid']
+
+            def callback(self, userid, request):
+                calls.append(userid)
+                return []
+
+        request = DummyRequest(session={'userid': 'fred'})
+        policy = Policy()
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(calls, ['fred'])
+
 
 class TestSessionAuthenticationHelper(unittest.TestCase):
     def _makeRequest(self, session=None):
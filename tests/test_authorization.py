@@ -148,6 +148,24 @@ class TestACLAuthorizationPolicy(unittest.TestCase):
         # ['view_stuff']
         self.assertEqual(result, False)
 
+    def test_permits_many(self):
+        from pyramid.authorization import Allow
+
+        context = DummyContext(__acl__=[(Allow, 'fred', 'view')])
+        policy = self._makeOne()
+        result = policy.permits_many([context, context], ['fred'], 'view')
+        self.assertEqual(result, [True, True])
+
+    def test_principals_allowed_by_permission_many(self):
+        from pyramid.authorization import Allow
+
+        context = DummyContext(__acl__=[(Allow, 'fred', 'view')])
+        policy = self._makeOne()
+        result = policy.principals_allowed_by_permission_many(
+            [context, context], 'view'
+        )
+        self.assertEqual(result, [{'fred'}, {'fred'}])
+
     def test_principals_allowed_by_permission_direct(self):
         from pyramid.authorization import DENY_ALL, Allow
 
@@ -410,6 +428,291 @@ class TestACLHelper(unittest.TestCase):
         result = helper.permits(context, ['bob'], 'read')
         self.assertTrue(result)
 
+    def _compileEveryACL(self, maxsize=None):
+        from pyramid import authorization
+
+        for name in ('_compile_min_aces', '_compiled_acls_maxsize'):
+            self.addCleanup(
+                setattr, authorization, name, getattr(authorization, name)
+            )
+        self.addCleanup(authorization._compiled_acls.clear)
+        self.addCleanup(authorization._seen_acls.clear)
+        authorization._compile_min_aces = 1
+        if maxsize is not None:
+            authorization._compiled_acls_maxsize = maxsize
+        return authorization
+
+    def test_first_matching_ace_wins(self):
+        from pyramid.authorization import (
+            ALL_PERMISSIONS,
+            ACLHelper,
+            Allow,
+            Deny,
+        )
+
+        authorization = self._compileEveryACL()
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = (
+            (Allow, 'fred', 'view'),
+            (Deny, 'barney', ALL_PERMISSIONS),
+            (Allow, 'barney', ('view', 'edit')),
+            (Allow, 'fred', frozenset(['edit', 'delete'])),
+        )
+        # the ACL is scanned the first time and compiled the second time
+        for compiled in (False, True):
+            result = helper.permits(context, ['barney', 'fred'], 'view')
+            self.assertEqual(result, True)
+            self.assertEqual(result.ace, (Allow, 'fred', 'view'))
+            self.assertEqual(
+                id(context.__acl__) in authorization._compiled_acls, compiled
+            )
+            result = helper.permits(context, ['fred', 'barney'], 'edit')
+            self.assertEqual(result, False)
+            self.assertEqual(result.ace, (Deny, 'barney', ALL_PERMISSIONS))
+            result = helper.permits(context, ['fred'], 'delete')
+            self.assertEqual(result, True)
+            self.assertEqual(result.acl, context.__acl__)
+            self.assertEqual(result.context, context)
+            result = helper.permits(context, ['wilma'], 'delete')
+            self.assertEqual(result, False)
+            self.assertEqual(result.ace, '<default deny>')
+
+    def test_short_acl_not_compiled(self):
+        from pyramid import authorization
+        from pyramid.authorization import ACLHelper, Allow
+
+        helper = ACLHelper()
+        context = DummyContext(__acl__=[(Allow, 'fred', 'view')] * 7)
+        for _ in range(3):
+            self.assertEqual(helper.permits(context, ['fred'], 'view'), True)
+        self.assertNotIn(id(context.__acl__), authorization._seen_acls)
+        self.assertNotIn(id(context.__acl__), authorization._compiled_acls)
+
+    def test_long_acl_compiled(self):
+        from pyramid import authorization
+        from pyramid.authorization import ACLHelper, Allow
+
+        self.addCleanup(authorization._compiled_acls.clear)
+        helper = ACLHelper()
+        acl = [(Allow, 'barney', 'view')] * 7 + [(Allow, 'fred', 'view')]
+        context = DummyContext(__acl__=acl)
+        for _ in range(2):
+            result = helper.permits(context, ['fred'], 'view')
+            self.assertEqual(result, True)
+            self.assertEqual(result.ace, (Allow, 'fred', 'view'))
+        self.assertIs(authorization._compiled_acls[id(acl)][0], acl)
+
+    def test_computed_acl_not_compiled(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        authorization = self._compileEveryACL()
+        acl = [(Allow, 'fred', 'view')]
+
+        class Context:
+            @property
+            def __acl__(self):
+                return acl
+
+        helper = ACLHelper()
+        for _ in range(3):
+            self.assertEqual(helper.permits(Context(), ['fred'], 'view'), True)
+        self.assertNotIn(id(acl), authorization._seen_acls)
+        self.assertNotIn(id(acl), authorization._compiled_acls)
+
+    def test_acl_changed_in_place(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        self._compileEveryACL()
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'fred', 'view')]
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), True)
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), True)
+        context.__acl__.insert(0, (Deny, 'fred', 'view'))
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), False)
+        context.__acl__[0] = (Allow, 'fred', 'edit')
+        result = helper.permits(context, ['fred'], 'edit')
+        self.assertEqual(result, True)
+        self.assertEqual(result.ace, (Allow, 'fred', 'edit'))
+
+    def test_mutable_aces(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        self._compileEveryACL()
+        helper = ACLHelper()
+        context = DummyContext()
+        permissions = ['view']
+        context.__acl__ = ((Allow, 'fred', permissions),)
+        self.assertEqual(helper.permits(context, ['fred'], 'edit'), False)
+        self.assertEqual(helper.permits(context, ['fred'], 'edit'), False)
+        permissions.append('edit')
+        self.assertEqual(helper.permits(context, ['fred'], 'edit'), True)
+        ace = [Allow, 'fred', 'view']
+        context.__acl__ = [ace]
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), True)
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), True)
+        ace[0] = 'Deny'
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), False)
+
+    def test_unhashable_principals(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        self._compileEveryACL()
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, ['fred'], 'view'), (Allow, 'bob', 'view')]
+        self.assertEqual(helper.permits(context, [['fred']], 'view'), True)
+        self.assertEqual(helper.permits(context, [['fred']], 'view'), True)
+        context.__acl__ = [(Allow, 'bob', 'view')]
+        self.assertEqual(helper.permits(context, [['fred']], 'view'), False)
+        self.assertEqual(helper.permits(context, [['fred']], 'view'), False)
+        self.assertEqual(helper.permits(context, [[], 'bob'], 'view'), True)
+
+    def test_acl_sequence(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        class ACL:
+            def __iter__(self):
+                return iter([(Allow, 'fred', 'view')])
+
+        self._compileEveryACL()
+        helper = ACLHelper()
+        context = DummyContext(__acl__=ACL())
+        self.assertEqual(helper.permits(context, ['fred'], 'view'), True)
+        self.assertEqual(
+            helper.permits_many([context], ['fred'], 'view'), [True]
+        )
+
+    def test_compiled_acls_cache_is_bounded(self):
+        from pyramid.authorization import ACLHelper, Allow
+
+        authorization = self._compileEveryACL(maxsize=2)
+        helper = ACLHelper()
+        contexts = [
+            DummyContext(__acl__=[(Allow, 'fred', 'view')]) for i in range(3)
+        ]
+        for context in contexts:
+            helper.permits(context, ['fred'], 'view')
+            helper.permits(context, ['fred'], 'view')
+        # the oldest compiled ACL is evicted
+        self.assertEqual(
+            list(authorization._compiled_acls),
+            [id(context.__acl__) for context in contexts[1:]],
+        )
+        # ACLs seen once are forgotten when there are too many of them
+        for i in range(3):
+            helper.permits(
+                DummyContext(__acl__=[(Allow, 'fred', 'view')]), [], 'view'
+            )
+        self.assertEqual(len(authorization._seen_acls), 1)
+
+    def test_permits_many_compiled(self):
+        from pyramid.authorization import ACLHelper, Allow, Deny
+
+        self._compileEveryACL()
+        helper = ACLHelper()
+        root = DummyContext(__acl__=[(Deny, 'fred', 'edit')])
+        context = DummyContext(__parent__=root)
+        for _ in range(2):
+            result = helper.permits_many([context], ['fred'], 'edit')
+            self.assertEqual(result, [False])
+            self.assertEqual(result[0].ace, (Deny, 'fred', 'edit'))
+        result = helper.permits_many([context], [['fred']], 'edit')
+        self.assertEqual(result, [False])
+        self.assertEqual(result[0].ace, '<default deny>')
+        root.__acl__ = [(Allow, 'fred', 'edit')] * 8
+        self.assertEqual(
+            helper.permits_many([root, context], ['fred'], 'edit'),
+            [True, True],
+        )
+
+    def test_permits_many(self):
+        from pyramid.authorization import DENY_ALL, ACLHelper, Allow, Deny
+
+        calls = []
+
+        def folder_acl():
+            calls.append(1)
+            return [(Allow, 'fred', 'edit'), (Deny, 'wilma', 'view')]
+
+        helper = ACLHelper()
+        root = DummyContext(__acl__=[(Allow, 'wilma', 'view'), DENY_ALL])
+        folder = DummyContext(__parent__=root, __acl__=folder_acl)
+        document = DummyContext(__parent__=folder)
+        other = DummyContext(__parent__=root)
+        contexts = [folder, document, other, DummyContext()]
+
+        for principals, permission in (
+            (['wilma'], 'view'),
+            (['fred'], 'edit'),
+            (['fred', 'wilma'], 'edit'),
+            (['barney'], 'view'),
+        ):
+            del calls[:]
+            result = helper.permits_many(contexts, principals, permission)
+            self.assertEqual(len(calls), 1)
+            expected = [
+                helper.permits(context, principals, permission)
+                for context in contexts
+            ]
+            self.assertEqual(
+                [(bool(r), r.ace, r.acl, r.context) for r in result],
+                [(bool(r), r.ace, r.acl, r.context) for r in expected],
+            )
+
+    def test_principals_allowed_by_permission_many(self):
+        from pyramid.authorization import (
+            DENY_ALL,
+            ACLHelper,
+            Allow,
+            Deny,
+            Everyone,
+        )
+
+        calls = []
+
+        def folder_acl():
+            calls.append(1)
+            return [
+                (Allow, 'fred', ('view', 'edit')),
+                (Deny, 'wilma', 'view'),
+            ]
+
+        helper = ACLHelper()
+        root = DummyContext(
+            __acl__=[(Allow, 'wilma', 'view'), (Allow, 'barney', 'edit')]
+        )
+        folder = DummyContext(__parent__=root, __acl__=folder_acl)
+        document = DummyContext(__parent__=folder)
+        private = DummyContext(
+            __parent__=folder, __acl__=[(Allow, 'betty', 'view'), DENY_ALL]
+        )
+        other = DummyContext(__parent__=root)
+        closed = DummyContext(
+            __parent__=root, __acl__=[(Deny, Everyone, 'edit')]
+        )
+        contexts = [document, private, folder, other, closed, DummyContext()]
+
+        for permission in ('view', 'edit', 'delete'):
+            del calls[:]
+            result = helper.principals_allowed_by_permission_many(
+                contexts, permission
+            )
+            self.assertEqual(len(calls), 1)
+            expected = [
+                helper.principals_allowed_by_permission(context, permission)
+                for context in contexts
+            ]
+            self.assertEqual(result, expected)
+
+        result = helper.principals_allowed_by_permission_many(
+            [document, folder, other], 'view'
+        )
+        self.assertEqual(result, [{'fred'}, {'fred'}, {'wilma'}])
+        result[0].add('barney')
+        self.assertEqual(result[1], {'fred'})
+
     def test_principals_allowed_by_permission_direct(self):
         from pyramid.authorization import DENY_ALL, ACLHelper, Allow
 
@@ -109,6 +109,16 @@ class TestFactoriesMixin(unittest.TestCase):
         exts = config.registry.getUtility(IRequestExtensions)
         self.assertTrue('foo' in exts.methods)
 
+    def test_add_request_method_clears_request_classes(self):
+        from pyramid.interfaces import IRequestExtensions
+
+        config = self._makeOne(autocommit=True)
+        config.add_request_method(lambda x: 1, name='foo', reify=True)
+        exts = config.registry.getUtility(IRequestExtensions)
+        exts.request_classes[object] = object
+        config.add_request_method(lambda x: 2, name='bar', property=True)
+        self.assertEqual(exts.request_classes, {})
+
     def test_add_request_method_with_unnamed_callable(self):
         from pyramid.interfaces import IRequestExtensions
 
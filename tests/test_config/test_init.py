@@ -484,7 +484,16 @@ class ConfiguratorTests(unittest.TestCase):
         config._fix_registry()
         self.assertFalse(hasattr(reg, '_view_lookup_cache'))
         reg._clear_view_lookup_cache()
-        self.assertEqual(reg._view_lookup_cache, {})
+        self.assertEqual(len(reg._view_lookup_cache), 0)
+        self.assertEqual(reg._view_lookup_cache.maxsize, 10000)
+
+    def test__fix_registry_clear_view_lookup_cache_uses_settings(self):
+        reg = DummyRegistry()
+        reg.settings = {'pyramid.view_lookup_cache_size': 5}
+        config = self._makeOne(reg)
+        config._fix_registry()
+        reg._clear_view_lookup_cache()
+        self.assertEqual(reg._view_lookup_cache.maxsize, 5)
 
     def test_setup_registry_calls_fix_registry(self):
         reg = DummyRegistry()
@@ -849,6 +858,21 @@ test_config.dummy_include2"""
         self.assertTrue(IApplicationCreated.providedBy(subscriber[0]))
         pyramid.config.global_registries.empty()
 
+    def test_make_asgi_app(self):
+        from pyramid.asgi import ASGIRouter
+        import pyramid.config
+        from pyramid.router import Router
+
+        config = self._makeOne()
+        config.manager = DummyThreadLocalManager()
+        app = config.make_asgi_app(max_workers=2)
+        self.assertEqual(app.__class__, ASGIRouter)
+        self.assertEqual(app.router.__class__, Router)
+        self.assertEqual(app.registry, config.registry)
+        self.assertEqual(app.max_workers, 2)
+        app.executor.shutdown()
+        pyramid.config.global_registries.empty()
+
     def test_include_with_dotted_name(self):
         from tests import test_config
 
@@ -34,6 +34,12 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
         config = self._makeOne()
         mapper = config.get_routes_mapper()
         self.assertEqual(mapper.routelist, [])
+        self.assertFalse(mapper.compiled)
+
+    def test_get_routes_mapper_compiled(self):
+        config = self._makeOne(settings={'pyramid.compile_routes': 'true'})
+        mapper = config.get_routes_mapper()
+        self.assertTrue(mapper.compiled)
 
     def test_get_routes_mapper_already_registered(self):
         from pyramid.interfaces import IRoutesMapper
@@ -93,6 +99,18 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
         route = self._assertRoute(config, 'name', 'path')
         self.assertEqual(route.factory, factory)
 
+    def test_add_route_with_lazy_root(self):
+        config = self._makeOne(autocommit=True)
+        config.add_route('name', 'path', lazy_root=True)
+        route = self._assertRoute(config, 'name', 'path')
+        self.assertTrue(route.lazy_root)
+
+    def test_add_route_lazy_root_default(self):
+        config = self._makeOne(autocommit=True)
+        config.add_route('name', 'path')
+        route = self._assertRoute(config, 'name', 'path')
+        self.assertEqual(route.lazy_root, None)
+
     def test_add_route_with_static(self):
         config = self._makeOne(autocommit=True)
         config.add_route('name', 'path/{foo}', static=True)
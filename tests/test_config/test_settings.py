@@ -25,6 +25,11 @@ class TestSettingsConfiguratorMixin(unittest.TestCase):
         settings = config._set_settings({'a': '1'})
         self.assertEqual(settings['a'], '1')
 
+    def test__set_settings_sizes_view_lookup_cache(self):
+        config = self._makeOne()
+        config._set_settings({'pyramid.view_lookup_cache_size': '3'})
+        self.assertEqual(config.registry._view_lookup_cache.maxsize, 3)
+
     def test_get_settings_nosettings(self):
         from pyramid.registry import Registry
 
@@ -176,6 +181,42 @@ class TestSettings(unittest.TestCase):
         self.assertEqual(result['prevent_cachebust'], True)
         self.assertEqual(result['pyramid.prevent_cachebust'], True)
 
+    def test_compile_routes(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['compile_routes'], False)
+        self.assertEqual(settings['pyramid.compile_routes'], False)
+        result = self._makeOne({'compile_routes': 't'})
+        self.assertEqual(result['compile_routes'], True)
+        self.assertEqual(result['pyramid.compile_routes'], True)
+        result = self._makeOne({'pyramid.compile_routes': '1'})
+        self.assertEqual(result['compile_routes'], True)
+        self.assertEqual(result['pyramid.compile_routes'], True)
+        result = self._makeOne({}, {'PYRAMID_COMPILE_ROUTES': '1'})
+        self.assertEqual(result['compile_routes'], True)
+        self.assertEqual(result['pyramid.compile_routes'], True)
+
+    def test_lazy_root(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['lazy_root'], False)
+        self.assertEqual(settings['pyramid.lazy_root'], False)
+        result = self._makeOne({'lazy_root': 'true'})
+        self.assertEqual(result['lazy_root'], True)
+        self.assertEqual(result['pyramid.lazy_root'], True)
+        result = self._makeOne({}, {'PYRAMID_LAZY_ROOT': '1'})
+        self.assertEqual(result['lazy_root'], True)
+        self.assertEqual(result['pyramid.lazy_root'], True)
+
+    def test_view_lookup_cache_size(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['view_lookup_cache_size'], 10000)
+        self.assertEqual(settings['pyramid.view_lookup_cache_size'], 10000)
+        result = self._makeOne({'view_lookup_cache_size': '10'})
+        self.assertEqual(result['view_lookup_cache_size'], 10)
+        self.assertEqual(result['pyramid.view_lookup_cache_size'], 10)
+        result = self._makeOne({}, {'PYRAMID_VIEW_LOOKUP_CACHE_SIZE': '5'})
+        self.assertEqual(result['view_lookup_cache_size'], 5)
+        self.assertEqual(result['pyramid.view_lookup_cache_size'], 5)
+
     def test_reload_templates(self):
         settings = self._makeOne({})
         self.assertEqual(settings['reload_templates'], False)
@@ -2617,6 +2617,23 @@ class TestViewsConfigurationMixin(unittest.TestCase):
         config.add_static_view('static', static_path)
         self.assertEqual(info.added, [(config, 'static', static_path, {})])
 
+    def test_add_static_view_file_index(self):
+        from zope.interface import Interface
+
+        from pyramid.interfaces import IView, IViewClassifier
+
+        config = self._makeOne(autocommit=True)
+        config.add_static_view('static', 'files', file_index=True)
+        request_type = self._getRouteRequestIface(config, '__static/')
+        wrapped = config.registry.adapters.lookup(
+            (IViewClassifier, request_type, Interface), IView, name=''
+        )
+        view = wrapped.__original_view__
+        self.assertEqual(view.index_dirs, None)
+        config.make_wsgi_app()
+        self.assertTrue(view.index_dirs)
+        self.assertTrue(view.get_resource_path('minimal.txt') in view.filemap)
+
     def test_add_forbidden_view(self):
         from zope.interface import implementedBy
 
@@ -3923,6 +3940,83 @@ class TestStaticURLInfo(unittest.TestCase):
         finally:
             testing.tearDown()
 
+    def test_generate_lookup_cached(self):
+        inst = self._makeOne()
+        inst.registrations = [
+            ('http://example.com/foo/', 'package:path/', None),
+            ('http://example.com/bar/', 'package:', None),
+        ]
+        request = self._makeRequest()
+        for _ in range(2):
+            result = inst.generate('package:path/abc', request)
+            self.assertEqual(result, 'http://example.com/foo/abc')
+        self.assertEqual(inst.lookup_cache.info().hits, 1)
+        inst.registrations = [('http://example.com/bar/', 'package:', None)]
+        result = inst.generate('package:path/abc', request)
+        self.assertEqual(result, 'http://example.com/bar/path/abc')
+
+    def test_generate_lookup_cache_cleared_by_add(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(config, 'http://example.com/foo', 'package:path')
+        request = self._makeRequest()
+        inst.generate('package:path/abc', request)
+        inst.add(config, 'http://example.com/bar', 'package:')
+        self.assertEqual(len(inst.lookup_cache), 0)
+
+    def test_generate_static_route(self):
+        from pyramid.interfaces import IStaticURLInfo
+
+        config = testing.setUp()
+        try:
+            config.add_static_view('static', 'tests:fixtures/static')
+            request = testing.DummyRequest()
+            inst = config.registry.getUtility(IStaticURLInfo)
+            for name in ('index.html', 'sub dir/caf\xe9.html', 'a&b;c'):
+                path = 'tests:fixtures/static/' + name
+                result = inst.generate(path, request)
+                expected = request.route_url('__static/', subpath=name)
+                self.assertEqual(result, expected)
+            result = inst.generate(
+                'tests:fixtures/static/a b', request, _app_url='/app'
+            )
+            self.assertEqual(result, '/app/static/a%20b')
+            self.assertEqual(
+                inst.route_urls[request],
+                {
+                    ('__static/', None): 'http://example.com/static/',
+                    ('__static/', '/app'): '/app/static/',
+                },
+            )
+            result = inst.generate(
+                'tests:fixtures/static/a', request, _query={'x': '1'}
+            )
+            self.assertEqual(result, 'http://example.com/static/a?x=1')
+        finally:
+            testing.tearDown()
+
+    def test_generate_static_route_with_pregenerator(self):
+        from pyramid.interfaces import IStaticURLInfo
+
+        def pregenerator(request, elements, kw):
+            kw['subpath'] = 'v1/' + kw['subpath']
+            return elements, kw
+
+        config = testing.setUp()
+        try:
+            config.add_static_view(
+                'static', 'tests:fixtures/static', pregenerator=pregenerator
+            )
+            request = testing.DummyRequest()
+            inst = config.registry.getUtility(IStaticURLInfo)
+            result = inst.generate('tests:fixtures/static/a', request)
+            self.assertEqual(result, 'http://example.com/static/v1/a')
+            self.assertEqual(
+                inst.route_urls[request], {('__static/', None): None}
+            )
+        finally:
+            testing.tearDown()
+
     def test_generate_route_url(self):
         inst = self._makeOne()
         inst.registrations = [(None, 'package:path/', '__viewname/')]
@@ -4149,6 +4243,64 @@ class TestStaticURLInfo(unittest.TestCase):
         self.assertEqual(config.view_kw['permission'], NO_PERMISSION_REQUIRED)
         self.assertEqual(config.view_kw['view'].__class__, static_view)
 
+    def test_add_viewname_with_file_cache(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(
+            config,
+            'view',
+            'anotherpackage:path',
+            file_cache_size=10,
+            max_cached_file_size=100,
+            etag=True,
+            zero_copy=True,
+            compress=['gzip'],
+            compress_cache_size=5,
+            max_compressed_file_size=1000,
+        )
+        view = config.view_kw['view']
+        self.assertEqual(view.file_cache.maxsize, 10)
+        self.assertEqual(view.max_cached_file_size, 100)
+        self.assertEqual(view.etag, True)
+        self.assertEqual(view.zero_copy, True)
+        self.assertEqual(list(view.compressors), ['gzip'])
+        self.assertEqual(view.compress_cache.maxsize, 5)
+        self.assertEqual(view.max_compressed_file_size, 1000)
+        self.assertFalse('file_cache_size' in config.route_kw)
+
+    def test_add_viewname_with_file_index(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(config, 'view', 'anotherpackage:path', file_index=True)
+        view = config.view_kw['view']
+        self.assertEqual(view.file_index, True)
+        self.assertFalse('file_index' in config.route_kw)
+        subscriber, iface = config.subscribers[0]
+        view.build_index = lambda: config.subscribers.append('built')
+        subscriber(None)
+        self.assertEqual(config.subscribers[-1], 'built')
+
+    def test_add_viewname_with_file_index_manifest(self):
+        import os
+
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(
+            config, 'view', 'anotherpackage:path', file_index='manifest.json'
+        )
+        view = config.view_kw['view']
+        self.assertEqual(
+            view.file_index,
+            os.path.join(os.path.dirname(__file__), 'manifest.json'),
+        )
+
+    def test_add_viewname_with_file_index_reload(self):
+        config = DummyConfig()
+        config.registry.settings['pyramid.reload_assets'] = True
+        inst = self._makeOne()
+        inst.add(config, 'view', 'anotherpackage:path', file_index=True)
+        self.assertEqual(config.subscribers, [])
+
     def test_add_viewname_with_route_prefix(self):
         config = DummyConfig()
         config.route_prefix = '/abc'
@@ -4357,8 +4509,16 @@ class DummyAccept:
 class DummyConfig:
     def __init__(self):
         self.registry = DummyRegistry()
+        self.subscribers = []
 
     route_prefix = ''
+    package_name = 'tests.test_config'
+
+    def _make_spec(self, path):
+        return self.package_name + ':' + path
+
+    def add_subscriber(self, subscriber, iface):
+        self.subscribers.append((subscriber, iface))
 
     def add_route(self, *args, **kw):
         self.route_args = args
@@ -23,7 +23,30 @@ class TestRegistry(unittest.TestCase):
         registry = self._makeOne()
         registry._view_lookup_cache[1] = 2
         registry._clear_view_lookup_cache()
-        self.assertEqual(registry._view_lookup_cache, {})
+        self.assertEqual(len(registry._view_lookup_cache), 0)
+
+    def test_view_lookup_cache_sized_by_settings(self):
+        registry = self._makeOne()
+        self.assertEqual(registry._view_lookup_cache.maxsize, 10000)
+        registry.settings = {'pyramid.view_lookup_cache_size': 2}
+        registry._clear_view_lookup_cache()
+        self.assertEqual(registry._view_lookup_cache.maxsize, 2)
+
+    def test_view_lookup_cache_info(self):
+        registry = self._makeOne()
+        registry.settings = {'pyramid.view_lookup_cache_size': 1}
+        registry._clear_view_lookup_cache()
+        cache = registry._view_lookup_cache
+        cache[1] = 2
+        cache.get(1)
+        cache.get(2)
+        cache[2] = 3
+        info = registry.view_lookup_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.maxsize, 1)
+        self.assertEqual(info.currsize, 1)
 
     def test_package_name(self):
         package_name = 'testing'
@@ -103,6 +103,341 @@ class TestJSON(unittest.TestCase):
         renderer = self._makeOne()(None)
         self.assertRaises(TypeError, renderer, objects, {})
 
+    def test_with_bytes_serializer(self):
+        from pyramid.renderers import RendererHelper
+
+        def serializer(value, **kw):
+            return b'{"a": 1}'
+
+        self.config.add_renderer('json', self._makeOne(serializer=serializer))
+        request = testing.DummyRequest()
+        helper = RendererHelper('json', registry=self.config.registry)
+        response = helper.render_to_response({'a': 1}, None, request=request)
+        self.assertEqual(response.body, b'{"a": 1}')
+        self.assertEqual(response.content_type, 'application/json')
+
+    def test_adapter_cached_per_class(self):
+        def adapter(obj, req):
+            return obj.isoformat()
+
+        now = datetime.now(timezone.utc)
+        renderer = self._makeOne(adapters=((datetime, adapter),))
+        lookups = []
+        lookup_adapter = renderer._lookup_adapter
+
+        def _lookup_adapter(obj_iface):
+            lookups.append(obj_iface)
+            return lookup_adapter(obj_iface)
+
+        renderer._lookup_adapter = _lookup_adapter
+        result = renderer(None)([now, now], {})
+        self.assertEqual(result, '["%s", "%s"]' % ((now.isoformat(),) * 2))
+        self.assertEqual(len(lookups), 1)
+        self.assertEqual(dict(renderer.adapter_cache), {datetime: adapter})
+
+    def test_adapter_cache_cleared_by_add_adapter(self):
+        class MyObject:
+            pass
+
+        renderer = self._makeOne()
+        self.assertRaises(TypeError, renderer(None), MyObject(), {})
+        self.assertTrue(MyObject in renderer.adapter_cache)
+        self.assertRaises(TypeError, renderer(None), MyObject(), {})
+        renderer.add_adapter(MyObject, lambda obj, req: 'adapted')
+        self.assertEqual(len(renderer.adapter_cache), 0)
+        self.assertEqual(renderer(None)(MyObject(), {}), '"adapted"')
+
+    def test_adapter_cache_does_not_keep_classes_alive(self):
+        import gc
+        import weakref
+
+        class MyObject:
+            pass
+
+        renderer = self._makeOne()
+        self.assertRaises(TypeError, renderer(None), MyObject(), {})
+        self.assertEqual(len(renderer.adapter_cache), 1)
+        ref = weakref.ref(MyObject)
+        del MyObject
+        # zope.interface's own lookup cache refers to the class as well
+        adapters = renderer.components.adapters
+        adapters.changed(adapters)
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(renderer.adapter_cache), 0)
+
+    def test_adapter_for_directly_provided_interface(self):
+        from zope.interface import Interface, alsoProvides, implementer
+
+        class IFoo(Interface):
+            pass
+
+        class IBar(Interface):
+            pass
+
+        @implementer(IFoo)
+        class MyObject:
+            pass
+
+        renderer = self._makeOne()
+        renderer.add_adapter(IFoo, lambda obj, req: 'foo')
+        renderer.add_adapter(IBar, lambda obj, req: 'bar')
+        bar = MyObject()
+        alsoProvides(bar, IBar)
+        result = renderer(None)([MyObject(), bar, MyObject()], {})
+        self.assertEqual(result, '["foo", "bar", "foo"]')
+
+
+class TestJSONStream(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _makeOne(self, **kw):
+        from pyramid.renderers import JSONStream
+
+        return JSONStream(**kw)
+
+    def _render(self, renderer, value, system=None):
+        result = renderer(None)(value, system or {})
+        return b''.join(result)
+
+    def test_it(self):
+        result = self._render(self._makeOne(), {'a': 1})
+        self.assertEqual(result, b'{"a": 1}')
+
+    def test_result_is_lazy(self):
+        consumed = []
+
+        def gen():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        renderer = self._makeOne(chunk_size=1)(None)
+        result = renderer({'a': gen()}, {})
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(result), b'{')
+        self.assertEqual(consumed, [])
+        self.assertEqual(b''.join(result), b'"a": [0, 1, 2]}')
+        self.assertEqual(consumed, [0, 1, 2])
+
+    def test_chunks(self):
+        renderer = self._makeOne(chunk_size=5)
+        renderer.batch_size = 2
+        result = list(renderer(None)(list(range(6)), {}))
+        self.assertEqual(result, [b'[0, 1', b', 2, ', b'3, 4,', b' 5]'])
+
+    def test_chunks_of_large_list_in_dict(self):
+        import json
+
+        value = {'items': [{'id': i, 'name': 'x' * 10} for i in range(5000)]}
+        renderer = self._makeOne(chunk_size=1024)
+        result = list(renderer(None)(value, {}))
+        self.assertEqual(b''.join(result), json.dumps(value).encode())
+        self.assertTrue(len(result) > 100)
+        self.assertEqual({len(chunk) for chunk in result[:-1]}, {1024})
+        self.assertTrue(len(result[-1]) <= 1024)
+
+    def test_large_dict(self):
+        import json
+
+        value = {str(i): list(range(i % 20)) for i in range(200)}
+        value['gen'] = iter([1])
+        result = self._render(self._makeOne(sort_keys=True), value)
+        value['gen'] = [1]
+        self.assertEqual(result, json.dumps(value, sort_keys=True).encode())
+
+    def test_large_dict_skipkeys(self):
+        value = {(i,): i for i in range(100)}
+        value['a'] = 1
+        renderer = self._makeOne(skipkeys=True)
+        renderer.batch_size = 10
+        renderer.max_items = 10
+        self.assertEqual(self._render(renderer, value), b'{"a": 1}')
+
+    def test_large_items_in_batch(self):
+        renderer = self._makeOne()
+        renderer.max_items = 3
+        value = [[1, 2], [3, 4]]
+        self.assertEqual(self._render(renderer, value), b'[[1, 2], [3, 4]]')
+
+    def test_iterators(self):
+        value = {
+            'a': (i for i in range(3)),
+            'b': iter([]),
+            'c': [1, map(str, 'ab')],
+        }
+        result = self._render(self._makeOne(), value)
+        self.assertEqual(
+            result, b'{"a": [0, 1, 2], "b": [], "c": [1, ["a", "b"]]}'
+        )
+
+    def test_top_level_iterator(self):
+        result = self._render(self._makeOne(), iter([{'a': 1}, 2]))
+        self.assertEqual(result, b'[{"a": 1}, 2]')
+
+    def test_encoder_kw(self):
+        renderer = self._makeOne(indent=1, sort_keys=True)
+        result = self._render(renderer, {'b': iter([1]), 'a': 2})
+        self.assertEqual(result, b'{\n "a": 2,\n "b": [\n  1\n ]\n}')
+
+    def test_encoder_kw_with_object_adapter(self):
+        class MyObject:
+            def __json__(self, request):
+                return iter([1])
+
+        renderer = self._makeOne(indent=1)
+        result = self._render(renderer, [MyObject()])
+        self.assertEqual(result, b'[\n [\n  1\n ]\n]')
+
+    def test_with_custom_encoder_class(self):
+        import json
+
+        class Encoder(json.JSONEncoder):
+            def __init__(self, **kw):
+                kw['sort_keys'] = True
+                json.JSONEncoder.__init__(self, **kw)
+
+        renderer = self._makeOne(cls=Encoder)
+        result = self._render(
+            renderer, {'b': iter([1]), 'a': {'d': 1, 'c': 2}}
+        )
+        self.assertEqual(result, b'{"a": {"c": 2, "d": 1}, "b": [1]}')
+
+    def test_keys(self):
+        renderer = self._makeOne(separators=(',', ':'))
+        value = {
+            'a': iter([1]),
+            2: 'int',
+            1.5: 'float',
+            True: 'true',
+            False: 'false',
+            None: 'null',
+        }
+        result = self._render(renderer, value)
+        self.assertEqual(
+            result,
+            b'{"a":[1],"2":"int","1.5":"float","true":"true",'
+            b'"false":"false","null":"null"}',
+        )
+
+    def test_skipkeys(self):
+        renderer = self._makeOne(skipkeys=True)
+        result = self._render(renderer, {(1,): 1, 'a': iter([])})
+        self.assertEqual(result, b'{"a": []}')
+
+    def test_bad_key(self):
+        renderer = self._makeOne()(None)
+        result = renderer({'a': iter([]), (1,): 1}, {})
+        self.assertRaises(TypeError, list, result)
+
+    def test_nested_iterators(self):
+        value = [{'a': iter([iter([1, 2]), (3, iter([]))])}, 'x']
+        result = self._render(self._makeOne(), iter([value]))
+        self.assertEqual(result, b'[[{"a": [[1, 2], [3, []]]}, "x"]]')
+
+    def test_object_returning_iterator(self):
+        class MyObject:
+            def __json__(self, request):
+                return iter([1, 2])
+
+        result = self._render(self._makeOne(), {'a': MyObject()})
+        self.assertEqual(result, b'{"a": [1, 2]}')
+
+    def test_non_ascii(self):
+        renderer = self._makeOne(ensure_ascii=False)
+        result = self._render(renderer, ['\N{SNOWMAN}'])
+        self.assertEqual(result, '["\N{SNOWMAN}"]'.encode('utf-8'))
+
+    def test_with_request_content_type_notset(self):
+        request = testing.DummyRequest()
+        self._render(self._makeOne(), {'a': 1}, {'request': request})
+        self.assertEqual(request.response.content_type, 'application/json')
+
+    def test_with_request_content_type_set(self):
+        request = testing.DummyRequest()
+        request.response.content_type = 'text/mishmash'
+        self._render(self._makeOne(), {'a': 1}, {'request': request})
+        self.assertEqual(request.response.content_type, 'text/mishmash')
+
+    def test_with_custom_adapter(self):
+        request = testing.DummyRequest()
+
+        def adapter(obj, req):
+            self.assertEqual(req, request)
+            return obj.isoformat()
+
+        now = datetime.now(timezone.utc)
+        renderer = self._makeOne(adapters=((datetime, adapter),))
+        result = self._render(renderer, iter([now]), {'request': request})
+        self.assertEqual(result, b'["%s"]' % now.isoformat().encode())
+
+    def test_with_object_adapter(self):
+        request = testing.DummyRequest()
+        outerself = self
+
+        class MyObject:
+            def __init__(self, x):
+                self.x = x
+
+            def __json__(self, req):
+                outerself.assertEqual(req, request)
+                return {'x': self.x}
+
+        objects = (MyObject(i) for i in (1, 2))
+        result = self._render(self._makeOne(), objects, {'request': request})
+        self.assertEqual(result, b'[{"x": 1}, {"x": 2}]')
+
+    def test_object_adapter_called_once(self):
+        calls = []
+
+        class MyObject:
+            def __init__(self, x):
+                self.x = x
+
+            def __json__(self, req):
+                calls.append(self.x)
+                return {'x': self.x}
+
+        value = {'a': [MyObject(1), {'b': MyObject(2)}, iter([MyObject(3)])]}
+        result = self._render(self._makeOne(), value)
+        self.assertEqual(
+            result, b'{"a": [{"x": 1}, {"b": {"x": 2}}, [{"x": 3}]]}'
+        )
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_object_converted_per_occurrence(self):
+        class MyObject:
+            def __json__(self, req):
+                return iter([1])
+
+        obj = MyObject()
+        result = self._render(self._makeOne(), {'a': [obj, obj]})
+        self.assertEqual(result, b'{"a": [[1], [1]]}')
+
+    def test_with_object_adapter_no___json__(self):
+        class MyObject:
+            pass
+
+        renderer = self._makeOne()(None)
+        result = renderer([MyObject()], {})
+        self.assertRaises(TypeError, list, result)
+
+    def test_render_to_response(self):
+        from pyramid.renderers import RendererHelper
+
+        request = testing.DummyRequest()
+        helper = RendererHelper('json_stream', registry=self.config.registry)
+        self.config.add_renderer('json_stream', self._makeOne())
+        response = helper.render_to_response(
+            iter([1, 2]), None, request=request
+        )
+        self.assertEqual(response.content_type, 'application/json')
+        self.assertEqual(response.body, b'[1, 2]')
+
 
 class Test_string_renderer_factory(unittest.TestCase):
     def _callFUT(self, name):
@@ -763,6 +1098,18 @@ class TestJSONP(unittest.TestCase):
             HTTPBadRequest, renderer, {'a': '1'}, {'request': request}
         )
 
+    def test_render_to_jsonp_bytes_serializer(self):
+        from pyramid.renderers import JSONP
+
+        def serializer(value, **kw):
+            return b'{"a": "1"}'
+
+        renderer = JSONP(serializer=serializer)(None)
+        request = testing.DummyRequest()
+        request.GET['callback'] = 'callback'
+        result = renderer({'a': '1'}, {'request': request})
+        self.assertEqual(result, b'/**/callback({"a": "1"});')
+
 
 class Dummy:
     pass
@@ -364,6 +364,35 @@ class TestRequest(unittest.TestCase):
         request = self._makeOne({'REQUEST_METHOD': 'GET'})
         self.assertRaises(ValueError, getattr, request, 'json_body')
 
+    def test_application_url(self):
+        request = self._makeOne(
+            {
+                'SERVER_NAME': 'example.com',
+                'SERVER_PORT': '80',
+                'SCRIPT_NAME': '/app',
+                'wsgi.url_scheme': 'http',
+            }
+        )
+        result = request.application_url
+        self.assertEqual(result, 'http://example.com/app')
+        self.assertIs(request.application_url, result)
+
+    def test_application_url_environ_changed(self):
+        request = self._makeOne(
+            {
+                'SERVER_NAME': 'example.com',
+                'SERVER_PORT': '80',
+                'wsgi.url_scheme': 'http',
+            }
+        )
+        self.assertEqual(request.application_url, 'http://example.com')
+        request.script_name = '/app'
+        self.assertEqual(request.application_url, 'http://example.com/app')
+        request.host = 'example.org:8080'
+        self.assertEqual(
+            request.application_url, 'http://example.org:8080/app'
+        )
+
     def test_set_property(self):
         request = self._makeOne()
         opts = [2, 1]
@@ -537,6 +566,43 @@ class Test_apply_request_extensions(unittest.TestCase):
         self.assertEqual(request.bar, 'bar')
         self.assertEqual(request.foo('abc'), 'abc')
 
+    def test_it_reuses_derived_class(self):
+        extensions = Dummy()
+        extensions.methods = {'foo': lambda x, y: y}
+        extensions.descriptors = {'bar': property(lambda x: 'bar')}
+        extensions.request_classes = {}
+        request1 = DummyRequest()
+        request2 = DummyRequest()
+        self._callFUT(request1, extensions=extensions)
+        self._callFUT(request2, extensions=extensions)
+        self.assertTrue(request1.__class__ is request2.__class__)
+        self.assertTrue(issubclass(request1.__class__, DummyRequest))
+        self.assertEqual(
+            extensions.request_classes, {DummyRequest: request1.__class__}
+        )
+        self.assertEqual(request2.bar, 'bar')
+        self.assertEqual(request2.foo('abc'), 'abc')
+
+    def test_it_without_request_classes_derives_class_per_request(self):
+        extensions = Dummy()
+        extensions.methods = {}
+        extensions.descriptors = {'bar': property(lambda x: 'bar')}
+        request1 = DummyRequest()
+        request2 = DummyRequest()
+        self._callFUT(request1, extensions=extensions)
+        self._callFUT(request2, extensions=extensions)
+        self.assertFalse(request1.__class__ is request2.__class__)
+        self.assertEqual(request2.bar, 'bar')
+
+    def test_it_no_descriptors(self):
+        extensions = Dummy()
+        extensions.methods = {}
+        extensions.descriptors = {}
+        extensions.request_classes = {}
+        request = DummyRequest()
+        self._callFUT(request, extensions=extensions)
+        self.assertTrue(request.__class__ is DummyRequest)
+
 
 class Test_subclassing_Request(unittest.TestCase):
     def test_subclass(self):
@@ -69,6 +69,98 @@ class TestFileResponse(unittest.TestCase):
             )
             r.app_iter.close()
 
+    def test_without_etag(self):
+        r = self._makeOne(self._getPath())
+        self.assertEqual(r.etag, None)
+        r.app_iter.close()
+
+    def test_with_etag(self):
+        import hashlib
+
+        path = self._getPath()
+        with open(path, 'rb') as f:
+            expected = hashlib.md5(f.read()).hexdigest()
+        r = self._makeOne(path, etag=True)
+        self.assertEqual(r.etag, expected)
+        r.app_iter.close()
+
+    def test_with_etag_cached(self):
+        from pyramid.response import _etag_cache
+
+        path = self._getPath()
+        self._makeOne(path, etag=True).app_iter.close()
+        hits = _etag_cache.info().hits
+        r = self._makeOne(path, etag=True)
+        self.assertEqual(_etag_cache.info().hits, hits + 1)
+        r.app_iter.close()
+
+    def test_if_none_match(self):
+        from webob import Request
+
+        path = self._getPath()
+        r = self._makeOne(path, etag=True)
+        request = Request.blank('/', if_none_match='"%s"' % r.etag)
+        result = request.get_response(r)
+        self.assertEqual(result.status_int, 304)
+        self.assertEqual(result.body, b'')
+
+    def test_range_request(self):
+        from webob import Request
+
+        path = self._getPath()
+        with open(path, 'rb') as f:
+            data = f.read()
+        request = Request.blank('/', range='bytes=2-5')
+        request.environ['wsgi.file_wrapper'] = DummyFileWrapper
+        r = self._makeOne(path, request=request)
+        result = request.get_response(r)
+        self.assertEqual(result.status_int, 206)
+        self.assertEqual(result.body, data[2:6])
+
+    def test_file_wrapper(self):
+        from webob import Request
+
+        request = Request.blank('/')
+        request.environ['wsgi.file_wrapper'] = DummyFileWrapper
+        r = self._makeOne(self._getPath(), request=request)
+        self.assertTrue(isinstance(r.app_iter, DummyFileWrapper))
+        r.app_iter.file.close()
+
+    def test_zero_copy(self):
+        from webob import Request
+
+        from pyramid.response import MappedFileIter
+
+        path = self._getPath()
+        with open(path, 'rb') as f:
+            data = f.read()
+        request = Request.blank('/')
+        r = self._makeOne(path, request=request, zero_copy=True)
+        self.assertTrue(isinstance(r.app_iter, MappedFileIter))
+        self.assertEqual(b''.join(r.app_iter), data)
+        r.app_iter.close()
+
+    def test_zero_copy_file_wrapper(self):
+        from webob import Request
+
+        request = Request.blank('/')
+        request.environ['wsgi.file_wrapper'] = DummyFileWrapper
+        r = self._makeOne(self._getPath(), request=request, zero_copy=True)
+        self.assertTrue(isinstance(r.app_iter, DummyFileWrapper))
+        r.app_iter.file.close()
+
+    def test_zero_copy_range_request(self):
+        from webob import Request
+
+        path = self._getPath()
+        with open(path, 'rb') as f:
+            data = f.read()
+        request = Request.blank('/', range='bytes=2-5')
+        r = self._makeOne(path, request=request, zero_copy=True)
+        result = request.get_response(r)
+        self.assertEqual(result.status_int, 206)
+        self.assertEqual(result.body, data[2:6])
+
     def test_python_277_bug_15207(self):
         # python 2.7.7 on windows has a bug where its mimetypes.guess_type
         # function returns Unicode for the content_type, unlike any previous
@@ -121,6 +213,99 @@ class TestFileIter(unittest.TestCase):
         inst.close()
         self.assertTrue(f.closed)
 
+    def test_app_iter_range(self):
+        f = io.BytesIO(b'abcdef')
+        inst = self._makeOne(f, 2)
+        result = inst.app_iter_range(1, 4)
+        self.assertEqual(list(result), [b'bc', b'd'])
+        self.assertEqual(f.tell(), 4)
+
+    def test_app_iter_range_no_stop(self):
+        f = io.BytesIO(b'abcdef')
+        inst = self._makeOne(f, 2)
+        result = inst.app_iter_range(3, None)
+        self.assertEqual(list(result), [b'de', b'f'])
+
+    def test_app_iter_range_not_seekable(self):
+        class File:
+            def __init__(self):
+                self.data = io.BytesIO(b'abcdef')
+
+            def read(self, size):
+                return self.data.read(size)
+
+        inst = self._makeOne(File(), 2)
+        result = inst.app_iter_range(1, 4)
+        self.assertEqual(b''.join(result), b'bcd')
+
+
+class TestMappedFileIter(unittest.TestCase):
+    def _makeOne(self, data, block_size=2):
+        import tempfile
+
+        from pyramid.response import MappedFileIter
+
+        f = tempfile.TemporaryFile()
+        f.write(data)
+        f.flush()
+        inst = MappedFileIter(f, block_size)
+        self.addCleanup(inst.close)
+        return inst
+
+    def test___iter__(self):
+        inst = self._makeOne(b'abc')
+        self.assertEqual(inst.__iter__(), inst)
+
+    def test_iteration(self):
+        inst = self._makeOne(b'abcde')
+        result = list(inst)
+        self.assertTrue(all(isinstance(x, memoryview) for x in result))
+        self.assertEqual([bytes(x) for x in result], [b'ab', b'cd', b'e'])
+        self.assertEqual(list(inst), [])
+
+    def test_empty(self):
+        inst = self._makeOne(b'')
+        self.assertEqual(list(inst), [])
+        self.assertEqual(inst.mmap, None)
+
+    def test_fileno(self):
+        inst = self._makeOne(b'abc')
+        self.assertEqual(inst.fileno(), inst.file.fileno())
+        self.assertEqual(inst.offset, 0)
+        self.assertEqual(inst.count, None)
+
+    def test_app_iter_range(self):
+        inst = self._makeOne(b'abcdef')
+        result = inst.app_iter_range(1, 4)
+        self.assertEqual(inst.offset, 1)
+        self.assertEqual(inst.count, 3)
+        self.assertEqual([bytes(x) for x in result], [b'bc', b'd'])
+
+    def test_app_iter_range_no_stop(self):
+        inst = self._makeOne(b'abcdef')
+        result = inst.app_iter_range(3, None)
+        self.assertEqual([bytes(x) for x in result], [b'de', b'f'])
+
+    def test_app_iter_range_past_end(self):
+        inst = self._makeOne(b'abcdef')
+        result = inst.app_iter_range(6, None)
+        self.assertEqual(list(result), [])
+
+    def test_close(self):
+        inst = self._makeOne(b'abc')
+        next(inst)
+        mapped = inst.mmap
+        inst.close()
+        self.assertTrue(mapped.closed)
+        self.assertTrue(inst.file.closed)
+
+    def test_close_with_live_slices(self):
+        inst = self._makeOne(b'abc')
+        chunk = next(inst)
+        inst.close()
+        self.assertEqual(bytes(chunk), b'ab')
+        self.assertTrue(inst.file.closed)
+
 
 class TestResponseAdapter(unittest.TestCase):
     def setUp(self):
@@ -237,3 +422,9 @@ class DummyVenusian:
 
     def attach(self, wrapped, fn, category=None, depth=None):
         self.attached.append((wrapped, fn, category, depth))
+
+
+class DummyFileWrapper:
+    def __init__(self, file, block_size):
+        self.file = file
+        self.block_size = block_size
@@ -163,6 +163,112 @@ class TestRouter(unittest.TestCase):
         router = self._makeOne()
         self.assertEqual(router.root_policy, rootfactory)
 
+    def test_ctor_makes_dispatch_plans(self):
+        iface = self._registerRouteRequest('foo')
+
+        def factory(request):  # pragma: no cover
+            pass
+
+        foo = self._connectRoute('foo', 'foo', factory)
+        bar = self._connectRoute('bar', 'bar')
+        router = self._makeOne()
+        plan = router.dispatch_plans[foo]
+        self.assertEqual(plan.request_iface, iface)
+        self.assertEqual(plan.root_factory, factory)
+        plan = router.dispatch_plans[bar]
+        self.assertEqual(plan.request_iface.__name__, 'IRequest')
+        self.assertEqual(plan.root_factory, router.root_factory)
+
+    def test_make_dispatch_plan_for_route_added_later(self):
+        router = self._makeOne()
+        iface = self._registerRouteRequest('foo')
+        route = self._connectRoute('foo', 'foo')
+        self.assertFalse(route in router.dispatch_plans)
+        plan = router.make_dispatch_plan(route)
+        self.assertEqual(plan.request_iface, iface)
+        self.assertEqual(router.dispatch_plans[route], plan)
+
+    def test_call_route_added_later_makes_dispatch_plan(self):
+        from pyramid.interfaces import IViewClassifier
+
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, '', IViewClassifier, None, None)
+        self._connectRoute('bar', 'bar')
+        router = self._makeOne()
+        self._registerRouteRequest('foo')
+        route = self._connectRoute('foo', 'archives')
+        environ = self._makeEnviron(PATH_INFO='/archives')
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        self.assertTrue(route in router.dispatch_plans)
+
+    def test_find_traverser_default(self):
+        from pyramid.traversal import ResourceTreeTraverser
+
+        router = self._makeOne()
+        root = DummyContext()
+        traverser = router.find_traverser(root)
+        self.assertEqual(traverser.__class__, ResourceTreeTraverser)
+        self.assertEqual(traverser.root, root)
+        self.assertEqual(len(router.traverser_factories), 1)
+
+    def test_find_traverser_registered(self):
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        router = self._makeOne()
+        root = DummyContext()
+        traverser = router.find_traverser(root)
+        self.assertEqual(traverser.__class__.__name__, 'DummyTraverserFactory')
+        traverser = router.find_traverser(root)
+        self.assertEqual(traverser.__class__.__name__, 'DummyTraverserFactory')
+        self.assertEqual(traverser.root, root)
+
+    def test_find_traverser_registered_later(self):
+        from pyramid.traversal import ResourceTreeTraverser
+
+        router = self._makeOne()
+        root = DummyContext()
+        traverser = router.find_traverser(root)
+        self.assertEqual(traverser.__class__, ResourceTreeTraverser)
+        self._registerTraverserFactory(root)
+        traverser = router.find_traverser(root)
+        self.assertEqual(traverser.__class__.__name__, 'DummyTraverserFactory')
+
+    def test_call_route_request_registered_later(self):
+        from pyramid.interfaces import IViewClassifier
+
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._connectRoute('foo', 'archives')
+        router = self._makeOne()
+        iface = self._registerRouteRequest('foo')
+        self._registerView(view, '', IViewClassifier, iface, None)
+        environ = self._makeEnviron(PATH_INFO='/archives')
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        self.assertEqual(
+            router.dispatch_plans[
+                router.routes_mapper.get_route('foo')
+            ].request_iface,
+            iface,
+        )
+
+    def test_find_traverser_factory_returns_None(self):
+        from pyramid.interfaces import ITraverser
+        from pyramid.traversal import ResourceTreeTraverser
+
+        self.registry.registerAdapter(
+            lambda root: None, (None,), ITraverser, name=''
+        )
+        router = self._makeOne()
+        traverser = router.find_traverser(DummyContext())
+        self.assertEqual(traverser.__class__, ResourceTreeTraverser)
+
     def test_request_factory(self):
         from pyramid.interfaces import IRequestFactory
 
@@ -813,6 +919,158 @@ class TestRouter(unittest.TestCase):
         )
         self.assertTrue("predicates: 'predicate'" in logger.messages[0])
 
+    def _callRouteWithoutTraversal(
+        self, pattern, path, view_name='', **environ
+    ):
+        from pyramid.interfaces import IViewClassifier
+
+        req_iface = self._registerRouteRequest('foo')
+        root = DummyContext()
+        self._connectRoute('foo', pattern, lambda request: root)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+        view = DummyView(response)
+        self._registerView(view, view_name, IViewClassifier, req_iface, None)
+        router = self._makeOne()
+        self._mockFinishRequest(router)
+        environ = self._makeEnviron(PATH_INFO=path, **environ)
+        result = router(environ, DummyStartResponse())
+        self.assertEqual(result, ['Hello world'])
+        return root, view.request
+
+    def test_call_route_without_traversal(self):
+        root, request = self._callRouteWithoutTraversal(
+            'archives/{article}', '/archives/article1'
+        )
+        self.assertEqual(request.root, root)
+        self.assertEqual(request.context, root)
+        self.assertEqual(request.view_name, '')
+        self.assertEqual(request.subpath, ())
+        self.assertEqual(request.traversed, ())
+        self.assertEqual(request.virtual_root, root)
+        self.assertEqual(request.virtual_root_path, ())
+
+    def test_call_route_without_traversal_star_subpath(self):
+        root, request = self._callRouteWithoutTraversal(
+            'static/*subpath', '/static/a/b'
+        )
+        self.assertEqual(request.context, root)
+        self.assertEqual(request.view_name, '')
+        self.assertEqual(request.subpath, ('a', 'b'))
+
+    def test_call_route_without_traversal_string_subpath(self):
+        root, request = self._callRouteWithoutTraversal(
+            'static/{subpath:.*}', '/static/a/b'
+        )
+        self.assertEqual(request.subpath, ('a', 'b'))
+
+    def test_call_route_with_traverse_uses_traverser(self):
+        root, request = self._callRouteWithoutTraversal(
+            'archives/*traverse', '/archives/article1', view_name='article1'
+        )
+        self.assertEqual(request.context, root)
+        self.assertEqual(request.view_name, 'article1')
+        self.assertEqual(request.traversed, ())
+
+    def test_call_route_with_virtual_root_uses_traverser(self):
+        root, request = self._callRouteWithoutTraversal(
+            'archives/{article}',
+            '/archives/article1',
+            view_name='foo',
+            HTTP_X_VHM_ROOT='/foo',
+        )
+        self.assertEqual(request.context, root)
+        self.assertEqual(request.view_name, 'foo')
+        self.assertEqual(request.virtual_root_path, ('foo',))
+
+    def _makeLazyRootApp(self, lazy_root=True, permission=None, **kw):
+        from pyramid.response import Response
+
+        calls = []
+
+        class Root:
+            __name__ = __parent__ = None
+            __acl__ = [('Allow', 'fred', 'view')]
+
+            def __init__(self, request):
+                calls.append(request)
+
+        def view(request):
+            if request.params.get('touch'):
+                request.context.__name__
+            return Response('OK')
+
+        self.config.add_route('foo', '/foo', factory=Root, lazy_root=lazy_root)
+        self.config.add_view(
+            view, route_name='foo', permission=permission, context=Root, **kw
+        )
+        self.config.commit()
+        router = self._makeOne()
+        return router, Root, calls
+
+    def test_call_route_lazy_root_unused(self):
+        router, Root, calls = self._makeLazyRootApp()
+        self._mockFinishRequest(router)
+        environ = self._makeEnviron(PATH_INFO='/foo')
+        start_response = DummyStartResponse()
+        router(environ, start_response)
+        self.assertEqual(start_response.status, '200 OK')
+        self.assertEqual(calls, [])
+
+    def test_call_route_lazy_root_used(self):
+        router, Root, calls = self._makeLazyRootApp()
+        self._mockFinishRequest(router)
+        environ = self._makeEnviron(PATH_INFO='/foo', QUERY_STRING='touch=1')
+        start_response = DummyStartResponse()
+        router(environ, start_response)
+        self.assertEqual(start_response.status, '200 OK')
+        self.assertEqual(len(calls), 1)
+
+    def test_call_route_lazy_root_permission_checked(self):
+        from pyramid.authorization import ACLHelper
+
+        class Policy:
+            def permits(self, request, context, permission):
+                return ACLHelper().permits(context, ['fred'], permission)
+
+        self.config.set_security_policy(Policy())
+        router, Root, calls = self._makeLazyRootApp(permission='view')
+        environ = self._makeEnviron(PATH_INFO='/foo')
+        start_response = DummyStartResponse()
+        router(environ, start_response)
+        self.assertEqual(start_response.status, '200 OK')
+        self.assertEqual(len(calls), 1)
+
+    def test_call_route_lazy_root_disabled(self):
+        router, Root, calls = self._makeLazyRootApp(lazy_root=False)
+        environ = self._makeEnviron(PATH_INFO='/foo')
+        router(environ, DummyStartResponse())
+        self.assertEqual(len(calls), 1)
+
+    def test_call_route_lazy_root_from_settings(self):
+        self.config.add_settings({'lazy_root': True})
+        router, Root, calls = self._makeLazyRootApp(lazy_root=None)
+        environ = self._makeEnviron(PATH_INFO='/foo')
+        router(environ, DummyStartResponse())
+        self.assertEqual(calls, [])
+
+    def test_make_dispatch_plan_lazy_root_function_factory(self):
+        from zope.interface import Interface
+
+        route = self._connectRoute('foo', 'foo', lambda request: None)
+        route.lazy_root = True
+        router = self._makeOne()
+        plan = router.dispatch_plans[route]
+        self.assertEqual(plan.lazy_context_iface, Interface)
+
+    def test_make_dispatch_plan_lazy_root_custom_traverser(self):
+        self._registerTraverserFactory(DummyContext())
+        route = self._connectRoute('foo', 'foo')
+        route.lazy_root = True
+        router = self._makeOne()
+        plan = router.dispatch_plans[route]
+        self.assertEqual(plan.lazy_context_iface, None)
+
     def test_call_route_match_miss_debug_routematch(self):
         from pyramid.httpexceptions import HTTPNotFound
 
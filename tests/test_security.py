@@ -486,6 +486,34 @@ class TestHasPermission(unittest.TestCase):
         del request.context
         self.assertRaises(AttributeError, request.has_permission, 'view')
 
+    def test_has_permissions_no_security_policy(self):
+        request = self._makeOne()
+        result = request.has_permissions('view', [object(), object()])
+        self.assertEqual(len(result), 2)
+        self.assertTrue(result[0])
+        self.assertEqual(result[1].msg, 'No security policy in use.')
+
+    def test_has_permissions(self):
+        request = self._makeOne()
+        _registerSecurityPolicy(request.registry, 'yo')
+        result = request.has_permissions('view', [object(), object()])
+        self.assertEqual(result, ['yo', 'yo'])
+
+    def test_has_permissions_permits_many(self):
+        from pyramid.interfaces import ISecurityPolicy
+
+        class Policy(DummySecurityPolicy):
+            def permits_many(self, request, contexts, permission):
+                self.args = request, contexts, permission
+                return ['many']
+
+        request = self._makeOne()
+        policy = Policy('yo')
+        request.registry.registerUtility(policy, ISecurityPolicy)
+        contexts = [object()]
+        self.assertEqual(request.has_permissions('view', contexts), ['many'])
+        self.assertEqual(policy.args, (request, contexts, 'view'))
+
 
 class TestLegacySecurityPolicy(unittest.TestCase):
     def setUp(self):
@@ -541,6 +569,110 @@ class TestLegacySecurityPolicy(unittest.TestCase):
 
         self.assertTrue(policy.permits(request, request.context, 'permission'))
 
+    def test_memoized(self):
+        from pyramid.interfaces import IAuthenticationPolicy
+        from pyramid.security import LegacySecurityPolicy
+
+        class AuthenticationPolicy(DummyAuthenticationPolicy):
+            calls = 0
+
+            def authenticated_userid(self, request):
+                self.calls += 1
+                return self.result
+
+            def effective_principals(self, request):
+                self.calls += 1
+                return [self.result]
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        authn_policy = AuthenticationPolicy('fred')
+        request.registry.registerUtility(authn_policy, IAuthenticationPolicy)
+        _registerAuthorizationPolicy(request.registry, True)
+
+        self.assertEqual(policy.identity(request), 'fred')
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        policy.permits(request, request.context, 'view')
+        policy.permits_many(request, [request.context], 'view')
+        self.assertEqual(policy._get_effective_principals(request), ['fred'])
+        self.assertEqual(authn_policy.calls, 2)
+
+        authn_policy.result = 'wilma'
+        policy.remember(request, 'wilma')
+        self.assertEqual(policy.authenticated_userid(request), 'wilma')
+        self.assertEqual(policy._get_effective_principals(request), ['wilma'])
+        self.assertEqual(authn_policy.calls, 4)
+
+        authn_policy.result = None
+        policy.forget(request)
+        self.assertEqual(policy.authenticated_userid(request), None)
+        self.assertEqual(policy._get_effective_principals(request), [None])
+        self.assertEqual(authn_policy.calls, 6)
+
+        request = _makeRequest()
+        request.registry.registerUtility(authn_policy, IAuthenticationPolicy)
+        self.assertEqual(policy.authenticated_userid(request), None)
+        self.assertEqual(authn_policy.calls, 7)
+
+    def test_memoized_principals_not_shared(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        _registerAuthenticationPolicy(request.registry, ['fred'])
+        authz_policy = _registerAuthorizationPolicy(request.registry, True)
+        principals = policy._get_effective_principals(request)
+        principals.append('injected')
+        self.assertEqual(policy._get_effective_principals(request), ['fred'])
+        policy.permits(request, request.context, 'view')
+        self.assertEqual(authz_policy.principals, ['fred'])
+        authz_policy.principals.append('injected')
+        self.assertEqual(policy._get_effective_principals(request), ['fred'])
+
+    def test_subclass_without_init(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        class Policy(LegacySecurityPolicy):
+            def __init__(self):
+                pass
+
+        request = _makeRequest()
+        policy = Policy()
+        _registerAuthenticationPolicy(request.registry, 'fred')
+        self.assertEqual(policy.forget(request), [(_TEST_HEADER, 'logout')])
+        self.assertEqual(policy.authenticated_userid(request), 'fred')
+        self.assertEqual(policy._get_effective_principals(request), 'fred')
+
+    def test_permits_many(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        _registerAuthenticationPolicy(request.registry, ['p1', 'p2'])
+        _registerAuthorizationPolicy(request.registry, True)
+
+        result = policy.permits_many(request, [object(), object()], 'edit')
+        self.assertEqual(result, [True, True])
+
+    def test_permits_many_authorization_policy_permits_many(self):
+        from pyramid.authorization import ACLAuthorizationPolicy, Allow
+        from pyramid.interfaces import IAuthorizationPolicy
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        authn_policy = _registerAuthenticationPolicy(request.registry, ['p1'])
+        request.registry.registerUtility(
+            ACLAuthorizationPolicy(), IAuthorizationPolicy
+        )
+        root = DummyContext(__acl__=[(Allow, 'p1', 'view')])
+        contexts = [DummyContext(__parent__=root), DummyContext()]
+
+        result = policy.permits_many(request, contexts, 'view')
+        self.assertEqual(result, [True, False])
+        self.assertEqual(result[0].context, root)
+        self.assertEqual(result[1].principals, authn_policy.result)
+
 
 _TEST_HEADER = 'X-Pyramid-Test'
 
@@ -603,6 +735,7 @@ class DummyAuthorizationPolicy:
         self.result = result
 
     def permits(self, context, principals, permission):
+        self.principals = principals
         return self.result
 
     def principals_allowed_by_permission(self, context, permission):
@@ -41,6 +41,7 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
         self.assertEqual(inst.index, 'index.html')
         self.assertEqual(inst.reload, False)
         self.assertEqual(inst.content_encodings, {})
+        self.assertEqual(inst.etag, False)
 
     def test_call_adds_slash_path_info_empty(self):
         inst = self._makeOne('tests:fixtures/static')
@@ -222,6 +223,26 @@ class Test_static_view_use_subpath_False(unittest.TestCase):
         self.assertEqual(response.content_encoding, None)
         response.app_iter.close()
 
+    def test_resource_zero_copy(self):
+        from pyramid.response import MappedFileIter
+
+        inst = self._makeOne('tests:fixtures/static', zero_copy=True)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertTrue(isinstance(response.app_iter, MappedFileIter))
+        response.app_iter.close()
+
+    def test_resource_with_etag(self):
+        import hashlib
+
+        inst = self._makeOne('tests:fixtures/static', etag=True)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        response = inst(context, request)
+        expected = hashlib.md5(b'<html>static</html>').hexdigest()
+        self.assertEqual(response.etag, expected)
+        response.app_iter.close()
+
     def test_resource_no_content_encoding(self):
         inst = self._makeOne('tests:fixtures/static')
         request = self._makeRequest({'PATH_INFO': '/index.html'})
@@ -562,6 +583,578 @@ class Test_static_view_content_encodings(unittest.TestCase):
         self.assertIsNot(result1, result2)
 
 
+class Test_static_view_file_cache(unittest.TestCase):
+    def _getTargetClass(self):
+        from pyramid.static import static_view
+
+        return static_view
+
+    def _makeOne(self, *arg, **kw):
+        kw.setdefault('file_cache_size', 10)
+        return self._getTargetClass()(*arg, **kw)
+
+    def _makeRequest(self, kw=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': '/',
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def _makeTempDir(self):
+        import shutil
+        import tempfile
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        return tempdir
+
+    def _writeFile(self, path, body, mtime):
+        with open(path, 'wb') as f:
+            f.write(body)
+        os.utime(path, (mtime, mtime))
+
+    def test_ctor_defaultargs(self):
+        inst = self._getTargetClass()('package:resource_name')
+        self.assertEqual(inst.file_cache, None)
+        self.assertEqual(inst.max_cached_file_size, 65536)
+
+    def test_ctor_file_cache_size(self):
+        inst = self._makeOne('package:resource_name')
+        self.assertEqual(inst.file_cache.maxsize, 10)
+
+    def test_small_file_served_from_memory(self):
+        inst = self._makeOne('tests:fixtures/static', cache_max_age=60)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.body, b'<html>static</html>')
+        self.assertEqual(response.content_type, 'text/html')
+        self.assertEqual(response.content_length, 19)
+        self.assertEqual(response.cache_control.max_age, 60)
+        self.assertTrue(response.last_modified is not None)
+        self.assertTrue(response.conditional_response)
+        filepath = os.path.join(here, 'fixtures', 'static', 'index.html')
+        cached = inst.file_cache.get(filepath)
+        self.assertEqual(cached.body, b'<html>static</html>')
+        self.assertEqual(cached.size, 19)
+
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.body, b'<html>static</html>')
+        self.assertEqual(inst.file_cache.info().hits, 2)
+
+    def test_large_file_zero_copy(self):
+        from pyramid.response import MappedFileIter
+
+        inst = self._makeOne(
+            'tests:fixtures/static', max_cached_file_size=10, zero_copy=True
+        )
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertTrue(isinstance(response.app_iter, MappedFileIter))
+        response.app_iter.close()
+
+    def test_large_file_streamed(self):
+        from pyramid.response import FileIter
+
+        inst = self._makeOne('tests:fixtures/static', max_cached_file_size=10)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertTrue(isinstance(response.app_iter, FileIter))
+        self.assertEqual(response.content_length, 19)
+        self.assertEqual(response.body, b'<html>static</html>')
+        filepath = os.path.join(here, 'fixtures', 'static', 'index.html')
+        self.assertEqual(inst.file_cache.get(filepath).body, None)
+
+    def test_large_file_changed_without_reload(self):
+        tempdir = self._makeTempDir()
+        path = os.path.join(tempdir, 'file.txt')
+        self._writeFile(path, b'0123456789', 1000000000)
+        inst = self._makeOne(tempdir, max_cached_file_size=5)
+        request = self._makeRequest({'PATH_INFO': '/file.txt'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.content_length, 10)
+        self.assertEqual(response.body, b'0123456789')
+        self._writeFile(path, b'012', 1000000000)
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.content_length, 3)
+        self.assertEqual(response.body, b'012')
+
+    def test_conditional_request(self):
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/index.html',
+                'HTTP_IF_MODIFIED_SINCE': response.headers['Last-Modified'],
+            }
+        )
+        response = inst(DummyContext(), request)
+        start_response = DummyStartResponse()
+        response(request.environ, start_response)
+        self.assertEqual(start_response.status, '304 Not Modified')
+
+    def test_content_encoding(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', content_encodings=['gzip']
+        )
+        request = self._makeRequest(
+            {'PATH_INFO': '/encoded.html', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.content_type, 'text/html')
+        self.assertEqual(len(response.body), 187)
+        request = self._makeRequest({'PATH_INFO': '/encoded.html'})
+        response = inst(DummyContext(), request)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(len(response.body), 221)
+
+    def test_not_revalidated_without_reload(self):
+        tempdir = self._makeTempDir()
+        path = os.path.join(tempdir, 'file.txt')
+        self._writeFile(path, b'one', 1000000000)
+        inst = self._makeOne(tempdir)
+        request = self._makeRequest({'PATH_INFO': '/file.txt'})
+        self.assertEqual(inst(DummyContext(), request).body, b'one')
+        self._writeFile(path, b'two', 1000000001)
+        self.assertEqual(inst(DummyContext(), request).body, b'one')
+
+    def test_revalidated_with_reload(self):
+        tempdir = self._makeTempDir()
+        path = os.path.join(tempdir, 'file.txt')
+        self._writeFile(path, b'one', 1000000000)
+        inst = self._makeOne(tempdir, reload=True)
+        request = self._makeRequest({'PATH_INFO': '/file.txt'})
+        self.assertEqual(inst(DummyContext(), request).body, b'one')
+        self.assertEqual(inst(DummyContext(), request).body, b'one')
+        self._writeFile(path, b'two', 1000000001)
+        self.assertEqual(inst(DummyContext(), request).body, b'two')
+        self._writeFile(path, b'three', 1000000001)
+        self.assertEqual(inst(DummyContext(), request).body, b'three')
+
+    def test_etag(self):
+        import hashlib
+
+        inst = self._makeOne('tests:fixtures/static', etag=True)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        expected = hashlib.md5(b'<html>static</html>').hexdigest()
+        self.assertEqual(response.etag, expected)
+        request = self._makeRequest(
+            {
+                'PATH_INFO': '/index.html',
+                'HTTP_IF_NONE_MATCH': '"%s"' % expected,
+            }
+        )
+        response = inst(DummyContext(), request)
+        start_response = DummyStartResponse()
+        response(request.environ, start_response)
+        self.assertEqual(start_response.status, '304 Not Modified')
+
+    def test_without_etag(self):
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.etag, None)
+
+    def test_range_request(self):
+        inst = self._makeOne('tests:fixtures/static', max_cached_file_size=0)
+        request = self._makeRequest(
+            {'PATH_INFO': '/index.html', 'HTTP_RANGE': 'bytes=6-11'}
+        )
+        response = request.get_response(inst(DummyContext(), request))
+        self.assertEqual(response.status_int, 206)
+        self.assertEqual(response.body, b'static')
+
+    def test_bounded(self):
+        inst = self._makeOne('tests:fixtures/static', file_cache_size=1)
+        for path in ('/index.html', '/encoded.html', '/index.html'):
+            request = self._makeRequest({'PATH_INFO': path})
+            inst(DummyContext(), request)
+        self.assertEqual(len(inst.file_cache), 1)
+        self.assertEqual(inst.file_cache.info().evictions, 2)
+
+
+class Test_static_view_file_index(unittest.TestCase):
+    def _getTargetClass(self):
+        from pyramid.static import static_view
+
+        return static_view
+
+    def _makeOne(self, *arg, **kw):
+        kw.setdefault('file_index', True)
+        return self._getTargetClass()(*arg, **kw)
+
+    def _makeRequest(self, kw=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': '/',
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def _assertNotProbed(self, inst):
+        def fail(*arg):  # pragma: no cover
+            raise AssertionError('filesystem probed')
+
+        inst.find_resource_path = fail
+
+    def test_build_index_package(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', content_encodings=['gzip']
+        )
+        inst.build_index()
+        self.assertEqual(
+            inst.index_dirs,
+            {'fixtures/static', 'fixtures/static/subdir'},
+        )
+        files = inst.filemap['fixtures/static/encoded.html']
+        self.assertEqual(
+            [encoding for path, encoding in files], ['gzip', None]
+        )
+        self.assertTrue(files[0][0].endswith('encoded.html.gz'))
+        files = inst.filemap['fixtures/static/only_encoded.html']
+        self.assertEqual([encoding for path, encoding in files], ['gzip'])
+        self.assertTrue('fixtures/static/subdir/index.html' in inst.filemap)
+
+    def test_build_index_filesystem(self):
+        import os
+
+        here = os.path.dirname(__file__)
+        root = os.path.normcase(os.path.join(here, 'fixtures', 'static'))
+        inst = self._makeOne(root)
+        inst.build_index()
+        self.assertEqual(inst.index_dirs, {root, os.path.join(root, 'subdir')})
+        path = os.path.join(root, 'subdir', 'index.html')
+        self.assertEqual(inst.filemap[path], [(path, None)])
+
+    def test_build_index_follows_directory_symlinks(self):
+        import os
+        import shutil
+        import tempfile
+
+        root = os.path.normcase(os.path.realpath(tempfile.mkdtemp()))
+        self.addCleanup(shutil.rmtree, root)
+        os.makedirs(os.path.join(root, 'real', 'sub'))
+        with open(os.path.join(root, 'real', 'sub', 'a.txt'), 'wb') as f:
+            f.write(b'a')
+        os.symlink(os.path.join(root, 'real'), os.path.join(root, 'linked'))
+        # a cycle back to the root
+        os.symlink(root, os.path.join(root, 'real', 'sub', 'up'))
+        inst = self._makeOne(root)
+        inst.build_index()
+        path = os.path.join(root, 'linked', 'sub', 'a.txt')
+        self.assertEqual(inst.filemap[path], [(path, None)])
+        self.assertTrue(
+            os.path.join(root, 'real', 'sub', 'a.txt') in inst.filemap
+        )
+        self.assertFalse(
+            os.path.join(root, 'real', 'sub', 'up', 'real') in inst.index_dirs
+        )
+        request = self._makeRequest({'PATH_INFO': '/linked/sub/a.txt'})
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.body, b'a')
+
+    def test_build_index_manifest(self):
+        import json
+        import os
+        import tempfile
+
+        here = os.path.dirname(__file__)
+        root = os.path.normcase(os.path.join(here, 'fixtures', 'static'))
+        manifest = {'index.html': 20, 'subdir/index.html': 10}
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as f:
+            json.dump(manifest, f)
+            f.flush()
+            inst = self._makeOne(root, file_index=f.name)
+            inst.build_index()
+        self.assertEqual(inst.index_dirs, {root, os.path.join(root, 'subdir')})
+        path = os.path.join(root, 'index.html')
+        self.assertEqual(
+            inst.filemap,
+            {
+                path: [(path, None)],
+                os.path.join(root, 'subdir', 'index.html'): [
+                    (os.path.join(root, 'subdir', 'index.html'), None)
+                ],
+            },
+        )
+
+    def test_build_index_package_manifest(self):
+        inst = self._makeOne(
+            'tests:fixtures/static',
+            content_encodings=['gzip'],
+            file_index='tests:fixtures/manifest.json',
+        )
+        self.assertTrue(inst.file_index.endswith('manifest.json'))
+        inst._load_file_manifest = lambda: {
+            'encoded.html': ('/encoded.html', 100),
+            'encoded.html.gz': ('/encoded.html.gz', 200),
+        }
+        inst.build_index()
+        self.assertEqual(
+            inst.filemap['fixtures/static/encoded.html'],
+            [('/encoded.html', None), ('/encoded.html.gz', 'gzip')],
+        )
+
+    def test_load_file_manifest_package(self):
+        import json
+        import os
+        import tempfile
+
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as f:
+            json.dump({'index.html': 20}, f)
+            f.flush()
+            inst = self._makeOne('tests:fixtures/static', file_index=f.name)
+            files = inst._load_file_manifest()
+        here = os.path.dirname(__file__)
+        path = os.path.join(here, 'fixtures', 'static', 'index.html')
+        self.assertEqual(files, {'index.html': (path, 20)})
+
+    def test_call_builds_index(self):
+        inst = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertTrue(b'<html>static</html>' in response.body)
+        self.assertTrue(inst.index_dirs)
+
+    def test_call_missing_not_probed(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        inst = self._makeOne('tests:fixtures/static')
+        inst.build_index()
+        self._assertNotProbed(inst)
+        request = self._makeRequest({'PATH_INFO': '/missing.html'})
+        self.assertRaises(HTTPNotFound, inst, DummyContext(), request)
+
+    def test_call_encoded_not_probed(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', content_encodings=['gzip']
+        )
+        inst.build_index()
+        self._assertNotProbed(inst)
+        request = self._makeRequest(
+            {'PATH_INFO': '/encoded.html', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        response = inst(DummyContext(), request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        response.app_iter.close()
+
+    def test_call_directory(self):
+        from pyramid.httpexceptions import HTTPMovedPermanently
+
+        inst = self._makeOne('tests:fixtures/static')
+        inst.build_index()
+        self._assertNotProbed(inst)
+        request = self._makeRequest({'PATH_INFO': '/subdir'})
+        self.assertRaises(HTTPMovedPermanently, inst, DummyContext(), request)
+        request = self._makeRequest({'PATH_INFO': '/subdir/'})
+        response = inst(DummyContext(), request)
+        self.assertTrue(b'<html>subdir</html>' in response.body)
+
+    def test_call_with_reload(self):
+        inst = self._makeOne('tests:fixtures/static', reload=True)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        response = inst(DummyContext(), request)
+        self.assertTrue(b'<html>static</html>' in response.body)
+        self.assertEqual(inst.index_dirs, None)
+
+
+class Test_static_view_compress(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = os.path.normcase(self.tempdir.name)
+        self.body = b'body { color: red; }\n' * 50
+        self._writeFile('style.css', self.body)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _writeFile(self, name, data):
+        with open(os.path.join(self.root, name), 'wb') as f:
+            f.write(data)
+
+    def _getTargetClass(self):
+        from pyramid.static import static_view
+
+        return static_view
+
+    def _makeOne(self, **kw):
+        kw.setdefault('compress', ['gzip'])
+        return self._getTargetClass()(self.root, **kw)
+
+    def _makeRequest(self, path, accept_encoding=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': path,
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if accept_encoding is not None:
+            environ['HTTP_ACCEPT_ENCODING'] = accept_encoding
+        return Request(environ=environ)
+
+    def _callView(self, inst, request):
+        response = inst(DummyContext(), request)
+        if hasattr(response.app_iter, 'close'):
+            self.addCleanup(response.app_iter.close)
+        return response
+
+    def test_compress(self):
+        import gzip
+
+        inst = self._makeOne()
+        request = self._makeRequest('/style.css', 'gzip')
+        response = self._callView(inst, request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertEqual(response.content_type, 'text/css')
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+        self.assertEqual(gzip.decompress(response.body), self.body)
+        self.assertEqual(response.content_length, len(response.body))
+        self.assertTrue(response.last_modified is not None)
+        self.assertEqual(response.etag, None)
+
+        response = self._callView(inst, request)
+        self.assertEqual(gzip.decompress(response.body), self.body)
+        self.assertEqual(inst.compress_cache.info().hits, 1)
+
+    def test_compress_not_accepted(self):
+        inst = self._makeOne()
+        response = self._callView(inst, self._makeRequest('/style.css'))
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.vary, ('Accept-Encoding',))
+        self.assertEqual(response.body, self.body)
+        request = self._makeRequest('/style.css', 'br')
+        response = self._callView(inst, request)
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(len(inst.compress_cache), 0)
+
+    def test_compress_not_compressible_type(self):
+        self._writeFile('image.png', self.body)
+        inst = self._makeOne()
+        request = self._makeRequest('/image.png', 'gzip')
+        response = self._callView(inst, request)
+        self.assertEqual(response.content_encoding, None)
+        self.assertEqual(response.vary, None)
+
+    def test_compress_size_limits(self):
+        self._writeFile('small.css', b'a')
+        inst = self._makeOne(max_compressed_file_size=100)
+        for name in ('small.css', 'style.css'):
+            request = self._makeRequest('/' + name, 'gzip')
+            response = self._callView(inst, request)
+            self.assertEqual(response.content_encoding, None)
+            self.assertEqual(response.vary, ('Accept-Encoding',))
+
+    def test_compress_incompressible(self):
+        self._writeFile('random.js', os.urandom(1000))
+        inst = self._makeOne()
+        request = self._makeRequest('/random.js', 'gzip')
+        for _ in range(2):
+            response = self._callView(inst, request)
+            self.assertEqual(response.content_encoding, None)
+        self.assertEqual(inst.compress_cache.info().hits, 1)
+
+    def test_compress_changed_file(self):
+        import gzip
+
+        inst = self._makeOne()
+        request = self._makeRequest('/style.css', 'gzip')
+        self._callView(inst, request)
+        body = b'p { color: blue; }\n' * 100
+        self._writeFile('style.css', body)
+        response = self._callView(inst, request)
+        self.assertEqual(gzip.decompress(response.body), body)
+
+    def test_compress_with_etag(self):
+        inst = self._makeOne(etag=True)
+        request = self._makeRequest('/style.css', 'gzip')
+        response = self._callView(inst, request)
+        self.assertTrue(response.etag.endswith('-gzip'))
+
+    def test_compress_prefers_precompressed(self):
+        import gzip
+
+        self._writeFile('style.css.gz', gzip.compress(self.body))
+        inst = self._makeOne(content_encodings=['gzip'])
+        request = self._makeRequest('/style.css', 'gzip')
+        response = self._callView(inst, request)
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertEqual(len(inst.compress_cache), 0)
+
+    def test_compress_preferred_encoding(self):
+        import sys
+        import types
+
+        brotli = types.ModuleType('brotli')
+        brotli.compress = lambda data: b'br'
+        sys.modules['brotli'] = brotli
+        try:
+            inst = self._makeOne(compress=['br', 'gzip', 'compress'])
+        finally:
+            del sys.modules['brotli']
+        self.assertEqual(list(inst.compressors), ['br', 'gzip'])
+        request = self._makeRequest('/style.css', 'gzip;q=0.5, br')
+        response = self._callView(inst, request)
+        self.assertEqual(response.content_encoding, 'br')
+        self.assertEqual(response.body, b'br')
+
+    def test_compress_without_brotli(self):
+        import sys
+
+        sys.modules['brotli'] = None
+        try:
+            inst = self._makeOne(compress=['br', 'gzip'])
+        finally:
+            del sys.modules['brotli']
+        self.assertEqual(list(inst.compressors), ['gzip'])
+
+
+class Test__is_compressible(unittest.TestCase):
+    def _callFUT(self, content_type):
+        from pyramid.static import _is_compressible
+
+        return _is_compressible(content_type)
+
+    def test_compressible(self):
+        for content_type in (
+            'text/html',
+            'application/javascript',
+            'image/svg+xml',
+            'application/ld+json',
+        ):
+            self.assertTrue(self._callFUT(content_type), content_type)
+
+    def test_not_compressible(self):
+        for content_type in ('image/png', 'application/octet-stream'):
+            self.assertFalse(self._callFUT(content_type), content_type)
+
+
 class TestQueryStringConstantCacheBuster(unittest.TestCase):
     def _makeOne(self, param=None):
         from pyramid.static import QueryStringConstantCacheBuster as cls
@@ -659,6 +1252,47 @@ class TestManifestCacheBuster(unittest.TestCase):
             fut('foo', 'css/main.css', {}), ('css/main-678b7c80.css', {})
         )
 
+    def test_reload_interval(self):
+        manifest_path = os.path.join(here, 'fixtures', 'manifest.json')
+        new_manifest_path = os.path.join(here, 'fixtures', 'manifest2.json')
+        inst = self._makeOne(manifest_path, reload=True, reload_interval=5)
+        self.assertEqual(inst.reload_interval, 5)
+        now = [100]
+        inst.monotonic = lambda: now[0]
+        mtimes = []
+
+        def getmtime(path):
+            mtimes.append(path)
+            return len(mtimes)
+
+        inst.getmtime = getmtime
+        self.assertEqual(
+            inst('foo', 'css/main.css', {}), ('css/main-test.css', {})
+        )
+        inst.manifest_path = new_manifest_path
+
+        # the file is not checked again within the interval
+        now[0] = 104
+        self.assertEqual(
+            inst('foo', 'css/main.css', {}), ('css/main-test.css', {})
+        )
+        self.assertEqual(len(mtimes), 1)
+
+        now[0] = 105
+        self.assertEqual(
+            inst('foo', 'css/main.css', {}), ('css/main-678b7c80.css', {})
+        )
+        self.assertEqual(len(mtimes), 2)
+
+    def test_reload_removed(self):
+        manifest_path = os.path.join(here, 'fixtures', 'manifest.json')
+        inst = self._makeOne(manifest_path, reload=True)
+        self.assertEqual(
+            inst('foo', 'css/main.css', {}), ('css/main-test.css', {})
+        )
+        inst.exists = lambda path: False
+        self.assertEqual(inst.manifest, {})
+
     def test_invalid_manifest(self):
         self.assertRaises(IOError, lambda: self._makeOne('foo'))
 
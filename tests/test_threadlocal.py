@@ -50,6 +50,55 @@ class TestThreadLocalManager(unittest.TestCase):
         self.assertEqual(local.get(), 1)
 
 
+class TestContextVarManager(TestThreadLocalManager):
+    def _getTargetClass(self):
+        from pyramid.threadlocal import ContextVarManager
+
+        return ContextVarManager
+
+    def test_isolated_per_context(self):
+        import contextvars
+
+        local = self._makeOne()
+        local.push('outer')
+
+        def inner():
+            self.assertEqual(local.get(), 'outer')
+            local.push('inner')
+            self.assertEqual(local.get(), 'inner')
+
+        contextvars.copy_context().run(inner)
+        self.assertEqual(local.get(), 'outer')
+        self.assertEqual(local.stack, ['outer'])
+
+    def test_isolated_per_thread(self):
+        import threading
+
+        local = self._makeOne()
+        local.push('main')
+        result = []
+        thread = threading.Thread(target=lambda: result.append(local.get()))
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [1])
+
+    def test_isolated_per_task(self):
+        import asyncio
+
+        local = self._makeOne()
+
+        async def task(name):
+            local.push(name)
+            await asyncio.sleep(0)
+            return local.get()
+
+        async def main():
+            return await asyncio.gather(task('a'), task('b'))
+
+        self.assertEqual(asyncio.run(main()), ['a', 'b'])
+        self.assertEqual(local.get(), 1)
+
+
 class TestGetCurrentRequest(unittest.TestCase):
     def _callFUT(self):
         from pyramid.threadlocal import get_current_request
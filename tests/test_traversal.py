@@ -879,6 +879,33 @@ class QuotePathSegmentTests(unittest.TestCase):
         result = self._callFUT(s)
         self.assertEqual(result, 'abc')
 
+    def test_bytes(self):
+        result = self._callFUT(b'/La Pe\xc3\xb1a')
+        self.assertEqual(result, '%2FLa%20Pe%C3%B1a')
+
+    def test_cache(self):
+        from pyramid.traversal import (
+            quote_path_segment_cache_info,
+            set_quote_path_segment_cache_size,
+        )
+
+        self.addCleanup(set_quote_path_segment_cache_size, 10000)
+        set_quote_path_segment_cache_size(2)
+        self.assertEqual(self._callFUT('a b'), 'a%20b')
+        self.assertEqual(self._callFUT('a b'), 'a%20b')
+        info = quote_path_segment_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 1)
+        self._callFUT('b')
+        self._callFUT('c')
+        info = quote_path_segment_cache_info()
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(self._callFUT('a b'), 'a%20b')
+        self.assertEqual(quote_path_segment_cache_info().misses, 4)
+
 
 class ResourceURLTests(unittest.TestCase):
     def _makeOne(self, context, url):
@@ -1200,6 +1227,104 @@ class TestDefaultRootFactory(unittest.TestCase):
         self.assertEqual(root.__name__, None)
 
 
+class TestLazyRoot(unittest.TestCase):
+    def _makeOne(self, factory, request=None):
+        from pyramid.traversal import LazyRoot
+
+        return LazyRoot(factory, request)
+
+    def _makeFactory(self, root):
+        calls = []
+
+        def factory(request):
+            calls.append(request)
+            return root
+
+        return factory, calls
+
+    def test_factory_not_called_until_used(self):
+        root = DummyContext()
+        factory, calls = self._makeFactory(root)
+        request = DummyRequest({})
+        lazy = self._makeOne(factory, request)
+        self.assertEqual(calls, [])
+        self.assertEqual(lazy.__name__, None)
+        self.assertEqual(calls, [request])
+        lazy.__parent__
+        self.assertEqual(calls, [request])
+
+    def test_attributes_delegated(self):
+        root = DummyContext()
+        factory, calls = self._makeFactory(root)
+        lazy = self._makeOne(factory)
+        lazy.foo = 1
+        self.assertEqual(root.foo, 1)
+        self.assertEqual(lazy.foo, 1)
+        del lazy.foo
+        self.assertFalse(hasattr(root, 'foo'))
+
+    def test_isinstance_and_interfaces(self):
+        from zope.interface import Interface, directlyProvides, providedBy
+
+        class IFoo(Interface):
+            pass
+
+        root = DummyContext()
+        directlyProvides(root, IFoo)
+        factory, calls = self._makeFactory(root)
+        lazy = self._makeOne(factory)
+        self.assertTrue(isinstance(lazy, DummyContext))
+        self.assertTrue(IFoo.providedBy(lazy))
+        self.assertEqual(providedBy(lazy), providedBy(root))
+
+    def test_comparison(self):
+        root = DummyContext()
+        factory, calls = self._makeFactory(root)
+        lazy = self._makeOne(factory)
+        self.assertTrue(lazy == root)
+        self.assertFalse(lazy != root)
+        self.assertEqual(hash(lazy), hash(root))
+        self.assertEqual(repr(lazy), repr(root))
+        self.assertEqual(str(lazy), str(root))
+        self.assertTrue(lazy)
+
+    def test_container(self):
+        root = {'a': 1}
+        factory, calls = self._makeFactory(root)
+        lazy = self._makeOne(factory)
+        self.assertEqual(lazy['a'], 1)
+        self.assertTrue('a' in lazy)
+        self.assertEqual(list(lazy), ['a'])
+        self.assertEqual(len(lazy), 1)
+
+    def test_not_a_container(self):
+        factory, calls = self._makeFactory(object())
+        lazy = self._makeOne(factory)
+        self.assertFalse(hasattr(lazy, '__getitem__'))
+
+    def test_traversal(self):
+        from pyramid.traversal import ResourceTreeTraverser
+
+        foo = DummyContext(name='foo')
+        factory, calls = self._makeFactory(DummyContext(foo))
+        lazy = self._makeOne(factory)
+        request = DummyRequest(path_info='/foo')
+        result = ResourceTreeTraverser(lazy)(request)
+        self.assertEqual(result['context'], foo)
+        self.assertEqual(result['view_name'], '')
+
+    def test_traversal_not_a_container(self):
+        from pyramid.traversal import ResourceTreeTraverser
+
+        root = DummyLeaf()
+        factory, calls = self._makeFactory(root)
+        lazy = self._makeOne(factory)
+        request = DummyRequest(path_info='/foo')
+        result = ResourceTreeTraverser(lazy)(request)
+        self.assertEqual(result['context'], lazy)
+        self.assertEqual(result['view_name'], 'foo')
+
+
 class Test__join_path_tuple(unittest.TestCase):
     def _callFUT(self, tup):
         from pyramid.traversal import _join_path_tuple
@@ -1270,6 +1395,11 @@ class DummyContext:
         )
 
 
+class DummyLeaf:
+    __parent__ = None
+    __name__ = None
+
+
 class DummyRequest:
     application_url = (
         'http://example.com:5432'  # app_url never ends with slash
@@ -432,6 +432,122 @@ class TestURLMethodsMixin(unittest.TestCase):
         result = request.resource_path(root, anchor='abc')
         self.assertEqual(result, '/context/#abc')
 
+    def _makeTree(self):
+        root = DummyResource('', None)
+        folder = DummyResource('La Pe\xf1a', root)
+        children = [DummyResource(name, folder) for name in ('a', 'b c')]
+        return [root, folder] + children + [DummyResource('d', root)]
+
+    def test_resource_urls(self):
+        request = self._makeOne()
+        resources = self._makeTree()
+        result = request.resource_urls(resources)
+        self.assertEqual(
+            result,
+            [
+                'http://example.com:5432/',
+                'http://example.com:5432/La%20Pe%C3%B1a/',
+                'http://example.com:5432/La%20Pe%C3%B1a/a/',
+                'http://example.com:5432/La%20Pe%C3%B1a/b%20c/',
+                'http://example.com:5432/d/',
+            ],
+        )
+        self.assertEqual(result, [request.resource_url(r) for r in resources])
+
+    def test_resource_urls_with_elements_and_kw(self):
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'SERVER_PORT': '8080',
+            'SERVER_NAME': 'example.com',
+        }
+        request = self._makeOne(environ)
+        resources = self._makeTree()
+        kw = dict(scheme='https', query={'a': '1'}, anchor='b c')
+        result = request.resource_urls(resources, 'x', 'y z', **kw)
+        self.assertEqual(
+            result[2], 'https://example.com/La%20Pe%C3%B1a/a/x/y%20z?a=1#b%20c'
+        )
+        self.assertEqual(
+            result,
+            [request.resource_url(r, 'x', 'y z', **kw) for r in resources],
+        )
+
+    def test_resource_urls_with_virtual_root(self):
+        from pyramid.interfaces import VH_ROOT_KEY
+
+        request = self._makeOne({VH_ROOT_KEY: '/La%20Pe%C3%B1a/'})
+        resources = self._makeTree()
+        result = request.resource_urls(resources)
+        self.assertEqual(
+            result,
+            [
+                'http://example.com:5432/',
+                'http://example.com:5432/',
+                'http://example.com:5432/a/',
+                'http://example.com:5432/b%20c/',
+                'http://example.com:5432/d/',
+            ],
+        )
+        self.assertEqual(result, [request.resource_url(r) for r in resources])
+
+    def test_resource_urls_IResourceURL_registered(self):
+        request = self._makeOne()
+        self._registerResourceURL(request.registry)
+        result = request.resource_urls(self._makeTree()[:2])
+        self.assertEqual(
+            result,
+            [
+                'http://example.com:5432/context/',
+                'http://example.com:5432/context/',
+            ],
+        )
+
+    def test_resource_urls_with_local_url(self):
+        request = self._makeOne()
+        resources = self._makeTree()
+
+        def resource_url(req, info):
+            return info['app_url'] + '/local' + info['physical_path']
+
+        resources[2].__resource_url__ = resource_url
+        result = request.resource_urls(resources[1:3], 'x')
+        self.assertEqual(
+            result,
+            [
+                'http://example.com:5432/La%20Pe%C3%B1a/x',
+                'http://example.com:5432/local/La%20Pe%C3%B1a/a/x',
+            ],
+        )
+
+    def test_resource_urls_no_registry_on_request(self):
+        request = self._makeOne()
+        del request.registry
+        result = request.resource_urls(self._makeTree()[:1])
+        self.assertEqual(result, ['http://example.com:5432/'])
+
+    def test_resource_urls_with_route_name(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        route = DummyRoute('/1/2/3')
+        mapper = DummyRoutesMapper(route)
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        result = request.resource_urls(self._makeTree()[2:4], route_name='foo')
+        self.assertEqual(
+            result,
+            ['http://example.com:5432/1/2/3', 'http://example.com:5432/1/2/3'],
+        )
+        self.assertEqual(route.kw, {'traverse': ('', 'La Pe\xf1a', 'b c', '')})
+
+    def test_resource_paths(self):
+        request = self._makeOne()
+        request.script_name = '/app'
+        result = request.resource_paths(self._makeTree()[2:4], anchor='x')
+        self.assertEqual(
+            result,
+            ['/app/La%20Pe%C3%B1a/a/#x', '/app/La%20Pe%C3%B1a/b%20c/#x'],
+        )
+
     def test_route_url_with_elements(self):
         from pyramid.interfaces import IRoutesMapper
 
@@ -1421,6 +1537,12 @@ class DummyContext:
         self.next = next
 
 
+class DummyResource:
+    def __init__(self, name, parent):
+        self.__name__ = name
+        self.__parent__ = parent
+
+
 class DummyRoutesMapper:
     raise_exc = None
 
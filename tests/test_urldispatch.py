@@ -42,6 +42,10 @@ class TestRoute(unittest.TestCase):
         self.assertIsInstance(route.generate, types.FunctionType)
         self.assertIsInstance(route.match, types.FunctionType)
 
+    def test_static_segments(self):
+        route = self._makeOne('name', '/archives/{year}/edit')
+        self.assertEqual(route.static_segments, ('archives',))
+
     def test_match(self):
         route = self._makeOne('name', ':path')
         self.assertEqual(route.match('/whatever'), {'path': 'whatever'})
@@ -306,6 +310,141 @@ class RoutesMapperTests(unittest.TestCase):
         self.assertEqual(mapper.generate('abc', {}), 123)
 
 
+class CompiledRoutesMapperTests(RoutesMapperTests):
+    def _makeOne(self):
+        klass = self._getTargetClass()
+        return klass(compiled=True)
+
+    def test_candidates_in_definition_order(self):
+        mapper = self._makeOne()
+        mapper.connect('any', '{name}/edit')
+        mapper.connect('users', 'users/{id}')
+        mapper.connect('users_edit', 'users/{id}/edit')
+        mapper.connect('blog', 'blog/*traverse')
+        request = self._getRequest(path_info='/users/1/edit')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['users_edit'])
+        request = self._getRequest(path_info='/blog/edit')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['any'])
+
+    def test_predicate_fallthrough_to_wildcard_route(self):
+        mapper = self._makeOne()
+        mapper.connect('users', 'users/{id}', predicates=[lambda *arg: False])
+        mapper.connect('catchall', '*subpath')
+        request = self._getRequest(path_info='/users/1')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['catchall'])
+        self.assertEqual(result['match'], {'subpath': ('users', '1')})
+
+    def test_partial_segment_prefix(self):
+        mapper = self._makeOne()
+        mapper.connect('page', 'page{num}.html')
+        request = self._getRequest(path_info='/page1.html')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['page'])
+        self.assertEqual(result['match'], {'num': '1'})
+
+    def test_literal_route_with_trailing_newline(self):
+        mapper = self._makeOne()
+        mapper.connect('about', 'about')
+        request = self._getRequest(path_info='/about\n')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['about'])
+
+    def test_no_candidates(self):
+        mapper = self._makeOne()
+        mapper.connect('users', 'users/{id}')
+        request = self._getRequest(path_info='/groups/1')
+        result = mapper(request)
+        self.assertEqual(result['route'], None)
+        self.assertEqual(result['match'], None)
+
+    def test_connect_invalidates_index(self):
+        mapper = self._makeOne()
+        mapper.connect('users', 'users/{id}')
+        request = self._getRequest(path_info='/groups/1')
+        self.assertEqual(mapper(request)['route'], None)
+        mapper.connect('groups', 'groups/{id}')
+        self.assertEqual(mapper(request)['route'], mapper.routes['groups'])
+
+    def test_same_results_as_linear_scan(self):
+        from pyramid.urldispatch import RoutesMapper
+
+        patterns = [
+            '/',
+            'about',
+            'about/',
+            'users/{id}',
+            'users/{id}/edit',
+            'users/{id:\\d+}/{action}',
+            'users/me',
+            'files/{path:.*}',
+            'static/*subpath',
+            'v{version}/status',
+            '{lang}/about',
+            'archives/:year/:month',
+        ]
+        paths = [
+            '/',
+            '/about',
+            '/about/',
+            '/users/1',
+            '/users/1/edit',
+            '/users/me',
+            '/users/me/edit',
+            '/users/',
+            '/files/a/b/c',
+            '/static/css/site.css',
+            '/static',
+            '/v2/status',
+            '/en/about',
+            '/archives/2010/01',
+            '/nothing/here',
+        ]
+        compiled = self._makeOne()
+        linear = RoutesMapper()
+        for idx, pattern in enumerate(patterns):
+            compiled.connect(str(idx), pattern)
+            linear.connect(str(idx), pattern)
+        for path in paths:
+            request = self._getRequest(path_info=path)
+            expected = linear(request)
+            result = compiled(request)
+            self.assertEqual(
+                (result['route'] and result['route'].name, result['match']),
+                (
+                    expected['route'] and expected['route'].name,
+                    expected['match'],
+                ),
+            )
+
+
+class Test_static_segments(unittest.TestCase):
+    def _callFUT(self, pattern):
+        from pyramid.urldispatch import _static_segments
+
+        return _static_segments(pattern)
+
+    def test_root(self):
+        self.assertEqual(self._callFUT('/'), ('',))
+        self.assertEqual(self._callFUT(''), ('',))
+
+    def test_literal(self):
+        self.assertEqual(self._callFUT('/foo/bar'), ('foo', 'bar'))
+        self.assertEqual(self._callFUT('foo/bar/'), ('foo', 'bar', ''))
+
+    def test_replacement_marker(self):
+        self.assertEqual(self._callFUT('/foo/{bar}'), ('foo',))
+        self.assertEqual(self._callFUT('/foo/:bar/baz'), ('foo',))
+        self.assertEqual(self._callFUT('/foo/x{bar}'), ('foo',))
+        self.assertEqual(self._callFUT('/{foo}/bar'), ())
+
+    def test_star_remainder(self):
+        self.assertEqual(self._callFUT('/foo/*traverse'), ('foo',))
+        self.assertEqual(self._callFUT('/foo*traverse'), ())
+
+
 class TestCompileRoute(unittest.TestCase):
     def _callFUT(self, pattern):
         from pyramid.urldispatch import _compile_route
@@ -629,6 +768,19 @@ class TestCompileRouteFunctional(unittest.TestCase):
         self.generates('/foo/{_abc}', {'_abc': '20'}, '/foo/20')
         self.generates('/foo/{abc_def}', {'abc_def': '20'}, '/foo/20')
 
+    def test_generator_ignores_extra_keys(self):
+        self.generates('/{x}', {'x': 'a', 'y': object()}, '/a')
+
+    def test_generator_missing_marker(self):
+        from pyramid.urldispatch import _compile_route
+
+        generator = _compile_route('/{x}/{y}')[1]
+        self.assertRaises(KeyError, generator, {'x': 'a'})
+
+    def test_generator_nonstr_values(self):
+        self.generates('/{x}*y', {'x': 1, 'y': b'/a b'}, '/1/a%20b')
+        self.generates('/{x}*y', {'x': b'a', 'y': 2}, '/a2')
+
     def test_generator_functional_oldstyle(self):
         self.generates('/:x', {'x': ''}, '/')
         self.generates('/:x', {'x': 'a'}, '/a')
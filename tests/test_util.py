@@ -169,6 +169,18 @@ class Test_InstancePropertyHelper(unittest.TestCase):
         self.assertEqual(1, foo.x)
         self.assertEqual(2, foo.y)
 
+    def test_make_class(self):
+        helper = self._getTargetClass()
+        x = helper.make_property(lambda _: 1, name='x', reify=True)
+        newcls = helper.make_class(Dummy, [x])
+        self.assertTrue(issubclass(newcls, Dummy))
+        self.assertEqual(newcls.__name__, 'Dummy')
+        self.assertEqual(newcls.__module__, Dummy.__module__)
+        foo = Dummy()
+        foo.__class__ = newcls
+        self.assertEqual(foo.x, 1)
+        self.assertFalse(hasattr(Dummy, 'x'))
+
     def test_make_property_unicode(self):
         from pyramid.exceptions import ConfigurationError
 
@@ -417,6 +429,62 @@ class Test_WeakOrderedSet(unittest.TestCase):
         self.assertEqual(wos.last, None)
 
 
+class TestLRUCache(unittest.TestCase):
+    def _makeOne(self, maxsize):
+        from pyramid.util import LRUCache
+
+        return LRUCache(maxsize)
+
+    def test_get_miss(self):
+        cache = self._makeOne(2)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_get_hit(self):
+        cache = self._makeOne(2)
+        cache['a'] = 1
+        self.assertEqual(cache.get('a'), 1)
+        self.assertTrue('a' in cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._makeOne(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_setitem_existing_key(self):
+        cache = self._makeOne(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['a'] = 3
+        cache['c'] = 4
+        self.assertEqual(cache.get('a'), 3)
+        self.assertFalse('b' in cache)
+
+    def test_clear(self):
+        cache = self._makeOne(2)
+        cache['a'] = 1
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_info(self):
+        cache = self._makeOne(1)
+        cache['a'] = 1
+        cache.get('a')
+        cache.get('b')
+        cache['b'] = 2
+        self.assertEqual(tuple(cache.info()), (1, 1, 1, 1, 1))
+
+
 class Test_strings_differ(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from pyramid.util import strings_differ
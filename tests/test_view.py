@@ -297,6 +297,16 @@ class RenderViewToResponseTests(BaseTest, unittest.TestCase):
         result = self._callFUT(context, request, name='notregistered')
         self.assertEqual(result, None)
 
+    def test_call_no_view_registered_caches_miss(self):
+        request = self._makeRequest()
+        context = self._makeContext()
+        self._callFUT(context, request, name='notregistered')
+        self._callFUT(context, request, name='notregistered')
+        info = request.registry.view_lookup_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.currsize, 1)
+
     def test_call_no_registry_on_request(self):
         request = self._makeRequest()
         del request.registry
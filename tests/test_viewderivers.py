@@ -212,6 +212,33 @@ class TestDeriveView(unittest.TestCase):
         context = testing.DummyResource()
         self.assertEqual(result(context, request), response)
 
+    def test_coroutine_function(self):
+        response = DummyResponse()
+
+        async def view(request):
+            return response
+
+        result = self.config.derive_view(view)
+        self.assertEqual(result(None, self._makeRequest()), response)
+
+    def test_coroutine_function_with_renderer(self):
+        response = DummyResponse()
+
+        class moo:
+            def render_view(inself, req, resp, view_inst, ctx):
+                self.assertEqual(resp, 'OK')
+                return response
+
+            def clone(self):
+                return self
+
+        async def view(request):
+            return 'OK'
+
+        result = self.config.derive_view(view, renderer=moo())
+        request = self._makeRequest()
+        self.assertEqual(result(None, request), response)
+
     def test_requestonly_function_with_renderer_request_override(self):
         def moo(info):
             def inner(value, system):